@@ -0,0 +1,555 @@
+"""
+Load and benchmark suite for the REST API
+
+Seeds a throwaway test database (created next to the configured one, like the test runner does)
+with tests/factories.py: boards with many participants, categories, goals and comments.
+Then every endpoint of goals, core and bot apps is driven in-process through the Django
+test client by concurrent workers, one endpoint at a time. Reported per endpoint:
+throughput, latency percentiles, SQL queries per request and response statuses.
+
+Usage:
+    python -m benchmarks.api_load --concurrency 8 --requests 400 --output before.json
+    python -m benchmarks.compare before.json after.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.db import connection, connections  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases  # noqa: E402
+from django.urls import URLPattern, URLResolver, get_resolver  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from benchmarks.asgi_vs_wsgi import percentile  # noqa: E402
+from bot.models import TgUser  # noqa: E402
+from core.models import User  # noqa: E402
+from goals.archive import archive_goals  # noqa: E402
+from goals.models.board import Board, BoardParticipant  # noqa: E402
+from goals.models.category import GoalCategory  # noqa: E402
+from goals.models.comment import Comment  # noqa: E402
+from goals.models.goal import Goal  # noqa: E402
+from goals.positions import append_positions  # noqa: E402
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory, \
+    UserFactory  # noqa: E402
+
+BENCHMARKED_URLCONFS: tuple = ('core.urls', 'goals.urls', 'bot.urls')
+PASSWORDS: tuple = ('Bench-password-1', 'Bench-password-2')
+
+
+# ----------------------------------------------------------------
+# seeding
+@dataclass
+class Dataset:
+    """
+    Ids of seeded rows
+
+    Attrs:
+        - users: workers' users, each of them is a writer on every seeded board
+        - boards, categories, goals: ids of seeded rows
+        - comments: ids of seeded comments by author id
+        - archived: ids of goals moved to archive, restored ones are popped
+    """
+    users: list[User]
+    boards: list[int]
+    categories: list[int]
+    goals: list[int]
+    comments: dict[int, list[int]]
+    archived: list[int]
+
+
+def seed(options: argparse.Namespace, rng: random.Random) -> Dataset:
+    """
+    Fill database with realistic shapes using factories of the test suite and bulk inserts
+
+    Params:
+        - options: scale options
+        - rng: seeded random generator
+
+    Returns:
+        - Dataset
+    """
+    now = timezone.now()
+    dates: dict[str, Any] = {'created': now, 'updated': now}
+    password_hash: str = make_password(PASSWORDS[0])
+
+    participants: int = max(options.participants, options.concurrency + 1)
+    users: list[User] = User.objects.bulk_create(
+        UserFactory.build(username=f'bench_user_{number}', password=password_hash)
+        for number in range(participants)
+    )
+    owner, workers = users[0], users[1:options.concurrency + 1]
+
+    def role(user: User) -> int:
+        if user is owner:
+            return BoardParticipant.Role.owner
+        if user in workers:
+            return BoardParticipant.Role.writer
+        return rng.choice((BoardParticipant.Role.writer, BoardParticipant.Role.reader))
+
+    boards: list[Board] = Board.objects.bulk_create(BoardFactory.build_batch(options.boards, **dates))
+    BoardParticipant.objects.bulk_create(
+        BoardParticipantFactory.build(board=board, user=user, role=role(user), **dates)
+        for board in boards for user in users
+    )
+    categories: list[GoalCategory] = GoalCategory.objects.bulk_create(
+        CategoryFactory.build(board=board, user=owner, **dates)
+        for board in boards for _ in range(options.categories)
+    )
+    goals: list[Goal] = [
+        GoalFactory.build(
+            category=category,
+            user=rng.choice(users),
+            description='description ' * rng.randint(0, 50),
+            status=rng.choice(Goal.Status.values[:3]),
+            priority=rng.choice(Goal.Priority.values),
+            **dates,
+        )
+        for category in categories for _ in range(options.goals)
+    ]
+    append_positions(goals)
+    goals = Goal.objects.bulk_create(goals, batch_size=1000)
+    comments: list[Comment] = Comment.objects.bulk_create(
+        (
+            CommentFactory.build(goal=goal, user=rng.choice(users), **dates)
+            for goal in goals for _ in range(options.comments)
+        ),
+        batch_size=1000,
+    )
+    archived: list[Goal] = Goal.objects.bulk_create(
+        (
+            GoalFactory.build(category=category, user=owner, status=Goal.Status.archived, **dates)
+            for category in categories for _ in range(max(options.goals // 5, 1))
+        ),
+        batch_size=1000,
+    )
+    archive_goals([goal.id for goal in archived], now + timedelta(seconds=1))
+    TgUser.objects.bulk_create(
+        TgUser(tg_chat_id=number, tg_user_id=number, verification_code=f'bench{number}')
+        for number in range(len(workers))
+    )
+
+    by_author: dict[int, list[int]] = {}
+    for comment in comments:
+        by_author.setdefault(comment.user_id, []).append(comment.id)
+    return Dataset(
+        users=workers,
+        boards=[board.id for board in boards],
+        categories=[category.id for category in categories],
+        goals=[goal.id for goal in goals],
+        comments=by_author,
+        archived=[goal.id for goal in archived],
+    )
+
+
+# ----------------------------------------------------------------
+# workers and scenarios
+@dataclass
+class Worker:
+    """
+    State of one concurrent client
+
+    Attrs:
+        - number: worker number
+        - user: authenticated user
+        - client: Django test client with session of the user
+        - rng: seeded random generator of the worker
+        - created: rows created by the worker by kind (response data), consumed by update and delete scenarios
+        - cursor: sync cursor of the worker, the first sync is a full one
+    """
+    number: int
+    user: User
+    client: Client
+    rng: random.Random
+    data: Dataset
+    password: str = PASSWORDS[0]
+    created: dict[str, list[dict]] = field(default_factory=dict)
+    cursor: str = ''
+
+    def own(self, kind: str) -> dict | None:
+        pool: list[dict] = self.created.get(kind, [])
+        return self.rng.choice(pool) if pool else None
+
+    def pop(self, kind: str) -> dict | None:
+        pool: list[dict] = self.created.get(kind, [])
+        return pool.pop() if pool else None
+
+    def relogin(self, *_: Any) -> None:
+        self.user.refresh_from_db()
+        self.client.force_login(self.user)
+
+
+@dataclass
+class Scenario:
+    """
+    One endpoint and method with a request builder
+
+    Attrs:
+        - route: route of URL pattern, e.g. goals/goal/<int:pk>
+        - method: HTTP method
+        - build: returns path and json body for a worker, None when there is nothing to request
+        - after: callback with worker and response, run outside of the measured time
+    """
+    route: str
+    method: str
+    build: Callable[[Worker], tuple[str, dict | None] | None]
+    after: Callable[[Worker, Any], None] | None = None
+
+    @property
+    def name(self) -> str:
+        return f'{self.method} /{self.route}'
+
+
+def remember(kind: str) -> Callable[[Worker, Any], None]:
+    """Callback to keep created row for update and delete scenarios"""
+    def after(worker: Worker, response: Any) -> None:
+        if response.status_code == 201:
+            worker.created.setdefault(kind, []).append(response.json())
+    return after
+
+
+def swap_password(worker: Worker, response: Any) -> None:
+    if response.status_code == 200:
+        worker.password = PASSWORDS[1] if worker.password == PASSWORDS[0] else PASSWORDS[0]
+    worker.relogin()
+
+
+def detail(prefix: str, kind: str, body: Callable[[Worker, dict], dict] | None = None, pop: bool = False) -> Callable:
+    """Request builder for detail endpoint of a row created by the worker"""
+    def build(worker: Worker) -> tuple[str, dict | None] | None:
+        row: dict | None = worker.pop(kind) if pop else worker.own(kind)
+        if row is None:
+            return None
+        return f'{prefix}/{row["id"]}', body(worker, row) if body else None
+    return build
+
+
+def keep_cursor(worker: Worker, response: Any) -> None:
+    if response.status_code == 200:
+        worker.cursor = response.json()['cursor']
+
+
+def title(worker: Worker) -> str:
+    return f'bench {worker.number} {worker.rng.randrange(10 ** 6)}'
+
+
+SCENARIOS: list[Scenario] = [
+    # core
+    Scenario('core/signup', 'POST', lambda w: ('/core/signup', {
+        'username': f'signup_{w.number}_{w.rng.randrange(10 ** 9)}',
+        'password': PASSWORDS[0],
+        'password_repeat': PASSWORDS[0],
+    })),
+    Scenario('core/login', 'POST', lambda w: ('/core/login', {'username': w.user.username, 'password': w.password})),
+    Scenario('core/profile', 'GET', lambda w: ('/core/profile', None)),
+    Scenario('core/profile', 'PUT', lambda w: ('/core/profile', {'username': w.user.username, 'first_name': title(w)})),
+    Scenario('core/profile', 'PATCH', lambda w: ('/core/profile', {'last_name': title(w)})),
+    Scenario('core/update_password', 'PUT', lambda w: ('/core/update_password', {
+        'old_password': w.password,
+        'new_password': PASSWORDS[1] if w.password == PASSWORDS[0] else PASSWORDS[0],
+    }), after=swap_password),
+    Scenario('core/profile', 'DELETE', lambda w: ('/core/profile', None), after=Worker.relogin),
+    # bot
+    Scenario('bot/verify', 'PATCH', lambda w: ('/bot/verify', {'verification_code': f'bench{w.number}'})),
+    # goals: create
+    Scenario('goals/board/create', 'POST', lambda w: ('/goals/board/create', {'title': title(w)}),
+             after=remember('board')),
+    Scenario('goals/goal_category/create', 'POST', lambda w: ('/goals/goal_category/create', {
+        'title': title(w), 'board': w.rng.choice(w.data.boards),
+    }), after=remember('category')),
+    Scenario('goals/goal/create', 'POST', lambda w: ('/goals/goal/create', {
+        'title': title(w), 'category': w.rng.choice(w.data.categories),
+    }), after=remember('goal')),
+    Scenario('goals/goal_comment/create', 'POST', lambda w: ('/goals/goal_comment/create', {
+        'text': title(w), 'goal': w.rng.choice(w.data.goals),
+    }), after=remember('comment')),
+    # body of JSON request is a one-line JSON lines file
+    Scenario('goals/board/<int:pk>/import.<str:import_format>', 'POST', lambda w: (
+        f'/goals/board/{w.rng.choice(w.data.boards)}/import.jsonl', {'category': 'bench import', 'title': title(w)},
+    )),
+    # goals: read
+    Scenario('goals/board/list', 'GET', lambda w: ('/goals/board/list?limit=20', None)),
+    Scenario('goals/board/<int:pk>', 'GET', lambda w: (f'/goals/board/{w.rng.choice(w.data.boards)}', None)),
+    Scenario('goals/board/<int:pk>/summary', 'GET', lambda w: (
+        f'/goals/board/{w.rng.choice(w.data.boards)}/summary', None,
+    )),
+    Scenario('goals/board/<int:pk>/export.<str:export_format>', 'GET', lambda w: (
+        f'/goals/board/{w.rng.choice(w.data.boards)}/export.{w.rng.choice(("csv", "jsonl"))}', None,
+    )),
+    Scenario('goals/goal_category/list', 'GET', lambda w: (
+        f'/goals/goal_category/list?limit=20&board={w.rng.choice(w.data.boards)}', None,
+    )),
+    Scenario('goals/goal_category/<int:pk>', 'GET', lambda w: (
+        f'/goals/goal_category/{w.rng.choice(w.data.categories)}', None,
+    )),
+    Scenario('goals/goal/list', 'GET', lambda w: (
+        f'/goals/goal/list?limit=20&board={w.rng.choice(w.data.boards)}', None,
+    )),
+    Scenario('goals/goal/<int:pk>', 'GET', lambda w: (f'/goals/goal/{w.rng.choice(w.data.goals)}', None)),
+    Scenario('goals/goal_comment/list', 'GET', lambda w: (
+        f'/goals/goal_comment/list?limit=20&goal={w.rng.choice(w.data.goals)}', None,
+    )),
+    Scenario('goals/goal_comment/<int:pk>', 'GET', lambda w: (
+        f'/goals/goal_comment/{w.rng.choice(w.data.comments.get(w.user.id) or [0])}', None,
+    )),
+    Scenario('goals/goal_comment/latest', 'GET', lambda w: (
+        f'/goals/goal_comment/latest?goal={",".join(map(str, w.rng.sample(w.data.goals, min(20, len(w.data.goals)))))}',
+        None,
+    )),
+    # goals: update rows created by the worker
+    Scenario('goals/board/<int:pk>', 'PUT', detail('/goals/board', 'board', lambda w, row: {
+        'title': title(w), 'participants': [],
+    })),
+    Scenario('goals/board/<int:pk>', 'PATCH', detail('/goals/board', 'board', lambda w, row: {
+        'title': title(w), 'participants': [],
+    })),
+    Scenario('goals/goal_category/<int:pk>', 'PUT', detail('/goals/goal_category', 'category', lambda w, row: {
+        'title': title(w), 'board': row['board'],
+    })),
+    Scenario('goals/goal_category/<int:pk>', 'PATCH', detail('/goals/goal_category', 'category', lambda w, row: {
+        'title': title(w),
+    })),
+    Scenario('goals/goal/<int:pk>', 'PUT', detail('/goals/goal', 'goal', lambda w, row: {
+        'title': title(w), 'category': row['category'], 'priority': w.rng.choice(Goal.Priority.values),
+    })),
+    Scenario('goals/goal/<int:pk>', 'PATCH', detail('/goals/goal', 'goal', lambda w, row: {
+        'status': w.rng.choice(Goal.Status.values[:3]),
+    })),
+    Scenario('goals/goal/<int:pk>/move', 'POST', lambda w: (
+        f'/goals/goal/{row["id"]}/move', {'status': w.rng.choice(Goal.Status.values[:3])},
+    ) if (row := w.own('goal')) else None),
+    Scenario('goals/archive/goal/list', 'GET', lambda w: ('/goals/archive/goal/list?limit=20', None)),
+    Scenario('goals/archive/goal/<int:pk>', 'GET', lambda w: (
+        f'/goals/archive/goal/{w.rng.choice(w.data.archived)}', None
+    )),
+    Scenario('goals/goal_comment/<int:pk>', 'PUT', detail('/goals/goal_comment', 'comment', lambda w, row: {
+        'text': title(w),
+    })),
+    Scenario('goals/goal_comment/<int:pk>', 'PATCH', detail('/goals/goal_comment', 'comment', lambda w, row: {
+        'text': title(w),
+    })),
+    Scenario('goals/archive/goal/<int:pk>/restore', 'POST', lambda w: (
+        f'/goals/archive/goal/{w.data.archived.pop()}/restore', None
+    ) if w.data.archived else None),
+    # goals: delta sync after the changes (first request of a worker is a full sync)
+    Scenario('goals/sync', 'GET', lambda w: (f'/goals/sync?cursor={w.cursor}', None), after=keep_cursor),
+    # goals: delete rows created by the worker
+    Scenario('goals/goal_comment/<int:pk>', 'DELETE', detail('/goals/goal_comment', 'comment', pop=True)),
+    Scenario('goals/goal/<int:pk>', 'DELETE', detail('/goals/goal', 'goal', pop=True)),
+    Scenario('goals/goal_category/<int:pk>', 'DELETE', detail('/goals/goal_category', 'category', pop=True)),
+    Scenario('goals/board/<int:pk>', 'DELETE', detail('/goals/board', 'board', pop=True)),
+]
+
+
+def routes() -> set[str]:
+    """
+    Function to collect routes of benchmarked apps from root URLconf
+
+    Returns:
+        - set of routes like goals/goal/<int:pk>
+    """
+    found: set[str] = set()
+    for resolver in get_resolver().url_patterns:
+        if not isinstance(resolver, URLResolver):
+            continue
+        if getattr(resolver.urlconf_module, '__name__', '') not in BENCHMARKED_URLCONFS:
+            continue
+        for pattern in resolver.url_patterns:
+            if isinstance(pattern, URLPattern):
+                found.add(f'{resolver.pattern}{pattern.pattern}')
+    return found
+
+
+# ----------------------------------------------------------------
+# measurement
+@dataclass
+class Sample:
+    seconds: float
+    queries: int
+    status: int
+
+
+def run_scenario(scenario: Scenario, workers: list[Worker], requests: int) -> dict[str, Any]:
+    """
+    Drive one endpoint by all workers concurrently
+
+    Params:
+        - scenario: endpoint to drive
+        - workers: concurrent clients
+        - requests: total number of requests
+
+    Returns:
+        - dict with endpoint results
+    """
+    per_worker: int = max(1, requests // len(workers))
+    samples: list[Sample] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(workers) + 1)
+
+    def count(queries: list[int]) -> Callable:
+        def wrapper(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+            queries[0] += 1
+            return execute(sql, params, many, context)
+        return wrapper
+
+    def drive(worker: Worker) -> None:
+        local: list[Sample] = []
+        barrier.wait()
+        try:
+            for _ in range(per_worker):
+                request: tuple[str, dict | None] | None = scenario.build(worker)
+                if request is None:
+                    continue
+                path, body = request
+                queries: list[int] = [0]
+                with ExitStack() as stack:
+                    for alias in connections:
+                        stack.enter_context(connections[alias].execute_wrapper(count(queries)))
+                    started: float = time.perf_counter()
+                    response: Any = worker.client.generic(
+                        scenario.method, path, json.dumps(body) if body is not None else '',
+                        content_type='application/json',
+                    )
+                    if response.streaming:
+                        # streamed body is produced (and queried) while it is read
+                        for _ in response.streaming_content:
+                            pass
+                    seconds: float = time.perf_counter() - started
+                local.append(Sample(seconds, queries[0], response.status_code))
+                if scenario.after:
+                    scenario.after(worker, response)
+        finally:
+            connections.close_all()
+            with lock:
+                samples.extend(local)
+
+    threads: list[threading.Thread] = [threading.Thread(target=drive, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started: float = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed: float = time.perf_counter() - started
+
+    latencies: list[float] = sorted(sample.seconds for sample in samples)
+    queries: list[int] = [sample.queries for sample in samples]
+    statuses: dict[str, int] = {}
+    for sample in samples:
+        statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample.status >= 500),
+        'status': statuses,
+        'throughput_rps': round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50) * 1000, 2),
+            'p95': round(percentile(latencies, 95) * 1000, 2),
+            'p99': round(percentile(latencies, 99) * 1000, 2),
+            'mean': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+        },
+        'sql': {
+            'mean': round(statistics.fmean(queries), 2) if queries else 0.0,
+            'max': max(queries, default=0),
+        },
+    }
+
+
+def run(options: argparse.Namespace) -> dict[str, Any]:
+    """
+    Seed database and drive all endpoints
+
+    Returns:
+        - report with run options and results by endpoint
+    """
+    missing: set[str] = routes() - {scenario.route for scenario in SCENARIOS}
+    if missing:
+        raise RuntimeError(f'No benchmark scenario for: {", ".join(sorted(missing))}')
+
+    rng = random.Random(options.seed)
+    data: Dataset = seed(options, rng)
+    workers: list[Worker] = []
+    for number, user in enumerate(data.users):
+        client = Client(raise_request_exception=False)
+        worker = Worker(number, user, client, random.Random(f'{options.seed}-{number}'), data)
+        worker.relogin()
+        workers.append(worker)
+
+    endpoints: dict[str, Any] = {}
+    for scenario in SCENARIOS:
+        if options.only and not any(part in scenario.name for part in options.only):
+            continue
+        endpoints[scenario.name] = run_scenario(scenario, workers, options.requests)
+        print(f'{scenario.name}: {endpoints[scenario.name]["latency_ms"]}', file=sys.stderr)
+    return {
+        'meta': {
+            'vendor': connection.vendor,
+            'async_views': settings.ASYNC_VIEWS,
+            'concurrency': options.concurrency,
+            'requests': options.requests,
+            'scale': {
+                'boards': options.boards,
+                'participants': options.participants,
+                'categories': options.categories,
+                'goals': options.goals,
+                'comments': options.comments,
+            },
+            'seed': options.seed,
+        },
+        'endpoints': endpoints,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='requests per endpoint')
+    parser.add_argument('--boards', type=int, default=20)
+    parser.add_argument('--participants', type=int, default=10, help='participants per board')
+    parser.add_argument('--categories', type=int, default=5, help='categories per board')
+    parser.add_argument('--goals', type=int, default=20, help='goals per category')
+    parser.add_argument('--comments', type=int, default=5, help='comments per goal')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='*', help='run endpoints whose name contains any of the strings')
+    parser.add_argument('--output', help='file to write JSON report to (stdout by default)')
+    options: argparse.Namespace = parser.parse_args()
+
+    setup_test_environment()
+    with tempfile.TemporaryDirectory() as directory:
+        if connection.vendor == 'sqlite':
+            # shared-cache in-memory database locks whole tables, use a file for concurrent workers
+            settings.DATABASES['default'].setdefault('TEST', {})['NAME'] = str(Path(directory, 'bench.sqlite3'))
+        old_config: list = setup_databases(verbosity=0, interactive=False)
+        try:
+            report: dict[str, Any] = run(options)
+        finally:
+            connections.close_all()
+            teardown_databases(old_config, verbosity=0)
+
+    output: str = json.dumps(report, indent=2)
+    if options.output:
+        Path(options.output).write_text(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
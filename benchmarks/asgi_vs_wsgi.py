@@ -0,0 +1,290 @@
+"""
+Load test comparing the WSGI serving profile with the ASGI one
+
+Both profiles are started with gunicorn against the database from .env:
+    - wsgi: sync workers, todolist.wsgi:application
+    - asgi: uvicorn workers, todolist.asgi:application with ASYNC_VIEWS=True
+
+Each run holds a number of idle (slow) client connections, drives a read endpoint with
+concurrent keep-alive clients and reports throughput, latency percentiles and resident
+memory of the gunicorn process tree per open connection.
+
+Usage:
+    python -m benchmarks.asgi_vs_wsgi --concurrency 100 --slow-clients 20 --duration 20
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+BASE_DIR: Path = Path(__file__).resolve().parent.parent
+
+PROFILES: dict[str, dict[str, Any]] = {
+    'wsgi': {
+        'args': ['todolist.wsgi:application'],
+        'env': {'ASYNC_VIEWS': 'False'},
+    },
+    'asgi': {
+        'args': ['-k', 'uvicorn.workers.UvicornWorker', 'todolist.asgi:application'],
+        'env': {'ASYNC_VIEWS': 'True'},
+    },
+}
+
+
+# ----------------------------------------------------------------
+# process helpers
+def process_tree_rss(pid: int) -> int:
+    """
+    Sum of resident memory (bytes) of a process and all of its children (Linux only)
+
+    Params:
+        - pid: root process id
+
+    Returns:
+        - resident set size in bytes
+    """
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                ppid = int(stat.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/status') as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            continue
+        stack.extend(children.get(current, []))
+    return total
+
+
+def start_server(profile: str, port: int, workers: int) -> subprocess.Popen:
+    """
+    Start gunicorn for given profile and wait until it accepts connections
+
+    Params:
+        - profile: wsgi or asgi
+        - port: port to bind
+        - workers: number of gunicorn workers
+
+    Returns:
+        - gunicorn master process
+    """
+    config: dict[str, Any] = PROFILES[profile]
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-b', f'127.0.0.1:{port}', '-w', str(workers), *config['args']],
+        cwd=BASE_DIR,
+        env={**os.environ, **config['env']},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline: float = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f'{profile} server did not start on port {port}')
+
+
+# ----------------------------------------------------------------
+# http helpers
+def request(port: int, method: str, path: str, body: dict | None = None, cookie: str = '') -> tuple[int, Any, list]:
+    """
+    Make one request with a fresh connection
+
+    Returns:
+        - status code, decoded json body (or None), list of name=value pairs from Set-Cookie headers
+    """
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    headers: dict[str, str] = {'Content-Type': 'application/json', 'Cookie': cookie}
+    connection.request(method, path, body=json.dumps(body) if body else None, headers=headers)
+    response = connection.getresponse()
+    payload: bytes = response.read()
+    connection.close()
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        data = None
+    cookies: list[str] = [header.split(';')[0] for header in response.msg.get_all('Set-Cookie') or []]
+    return response.status, data, cookies
+
+
+def prepare_session(port: int, goals: int) -> str:
+    """
+    Register a user, create board, category and goals, return session cookie
+
+    Params:
+        - port: port of running server
+        - goals: number of goals to create
+
+    Returns:
+        - Cookie header value
+    """
+    username, password = f'bench_{uuid.uuid4().hex[:10]}', uuid.uuid4().hex
+    request(port, 'POST', '/core/signup', {'username': username, 'password': password, 'password_repeat': password})
+    _, _, cookies = request(port, 'POST', '/core/login', {'username': username, 'password': password})
+    cookie: str = '; '.join(cookies)
+    csrf: str = next((c.split('=', 1)[1] for c in cookies if c.startswith('csrftoken')), '')
+
+    def post(path: str, body: dict) -> Any:
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        connection.request('POST', path, body=json.dumps(body), headers={
+            'Content-Type': 'application/json', 'Cookie': cookie, 'X-CSRFToken': csrf,
+        })
+        data = json.loads(connection.getresponse().read())
+        connection.close()
+        return data
+
+    board: dict = post('/goals/board/create', {'title': 'bench'})
+    category: dict = post('/goals/goal_category/create', {'title': 'bench', 'board': board['id']})
+    for number in range(goals):
+        post('/goals/goal/create', {'title': f'goal {number}', 'category': category['id']})
+    return cookie
+
+
+def hold_slow_client(port: int, stop: threading.Event) -> None:
+    """
+    Open a connection and trickle request headers until stopped (slow client)
+    """
+    try:
+        sock = socket.create_connection(('127.0.0.1', port), timeout=5)
+        sock.sendall(b'GET /goals/goal/list HTTP/1.1\r\nHost: localhost\r\n')
+        while not stop.wait(1):
+            sock.sendall(b'X-Slow: 1\r\n')
+        sock.close()
+    except OSError:
+        pass
+
+
+def drive(port: int, path: str, cookie: str, deadline: float, latencies: list[float], errors: list[int]) -> None:
+    """
+    Issue requests over one keep-alive connection until deadline
+    """
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    while time.monotonic() < deadline:
+        started: float = time.perf_counter()
+        try:
+            connection.request('GET', path, headers={'Cookie': cookie})
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+                continue
+        except (OSError, http.client.HTTPException):
+            errors.append(0)
+            connection.close()
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+            continue
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """Nearest-rank percentile, values must be sorted"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(rank / 100 * len(values)) - 1)]
+
+
+# ----------------------------------------------------------------
+# run
+def run_profile(profile: str, options: argparse.Namespace) -> dict[str, Any]:
+    """
+    Run load against one serving profile
+
+    Returns:
+        - dict with measured results
+    """
+    server = start_server(profile, options.port, options.workers)
+    try:
+        cookie: str = prepare_session(options.port, options.goals)
+        idle_rss: int = process_tree_rss(server.pid)
+
+        stop = threading.Event()
+        slow: list[threading.Thread] = [
+            threading.Thread(target=hold_slow_client, args=(options.port, stop), daemon=True)
+            for _ in range(options.slow_clients)
+        ]
+        for thread in slow:
+            thread.start()
+
+        latencies: list[float] = []
+        errors: list[int] = []
+        started: float = time.monotonic()
+        deadline: float = started + options.duration
+        clients: list[threading.Thread] = [
+            threading.Thread(target=drive, args=(options.port, options.path, cookie, deadline, latencies, errors))
+            for _ in range(options.concurrency)
+        ]
+        for thread in clients:
+            thread.start()
+        peak_rss: int = idle_rss
+        while any(thread.is_alive() for thread in clients):
+            peak_rss = max(peak_rss, process_tree_rss(server.pid))
+            time.sleep(0.5)
+        elapsed: float = time.monotonic() - started
+        stop.set()
+
+        latencies.sort()
+        connections: int = options.concurrency + options.slow_clients
+        return {
+            'profile': profile,
+            'requests': len(latencies),
+            'errors': len(errors),
+            'throughput_rps': round(len(latencies) / elapsed, 1),
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50) * 1000, 2),
+                'p95': round(percentile(latencies, 95) * 1000, 2),
+                'p99': round(percentile(latencies, 99) * 1000, 2),
+                'mean': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            },
+            'rss_idle_mb': round(idle_rss / 2 ** 20, 1),
+            'rss_peak_mb': round(peak_rss / 2 ** 20, 1),
+            'rss_per_connection_kb': round((peak_rss - idle_rss) / 1024 / connections, 1),
+        }
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', nargs='+', default=['wsgi', 'asgi'], choices=list(PROFILES))
+    parser.add_argument('--path', default='/goals/goal/list?limit=20')
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--slow-clients', type=int, default=10)
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--goals', type=int, default=50)
+    parser.add_argument('--port', type=int, default=8765)
+    options: argparse.Namespace = parser.parse_args()
+
+    results: list[dict[str, Any]] = [run_profile(profile, options) for profile in options.profiles]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
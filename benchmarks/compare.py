@@ -0,0 +1,86 @@
+"""
+Compare two reports of benchmarks.api_load and flag regressions
+
+An endpoint regresses when, compared with the baseline run:
+    - p95 or p99 latency grows by more than --latency percent (and by at least --min-ms)
+    - throughput drops by more than --throughput percent
+    - mean number of SQL queries per request grows (query count does not depend on load)
+    - it starts answering with server errors
+
+Exits with status 1 if any regression is found.
+
+Usage:
+    python -m benchmarks.compare before.json after.json --latency 20 --throughput 15
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def change(before: float, after: float) -> float:
+    """Relative change in percent"""
+    if not before:
+        return 0.0 if not after else float('inf')
+    return (after - before) / before * 100
+
+
+def compare_endpoint(before: dict[str, Any], after: dict[str, Any], options: argparse.Namespace) -> list[str]:
+    """
+    Compare results of one endpoint
+
+    Returns:
+        - list of regression descriptions
+    """
+    problems: list[str] = []
+    for rank in ('p95', 'p99'):
+        old, new = before['latency_ms'][rank], after['latency_ms'][rank]
+        if change(old, new) > options.latency and new - old >= options.min_ms:
+            problems.append(f'{rank} {old} -> {new} ms ({change(old, new):+.0f}%)')
+    old, new = before['throughput_rps'], after['throughput_rps']
+    if -change(old, new) > options.throughput:
+        problems.append(f'throughput {old} -> {new} rps ({change(old, new):+.0f}%)')
+    old, new = before['sql']['mean'], after['sql']['mean']
+    if new > old:
+        problems.append(f'sql queries {old} -> {new} per request')
+    if after['errors'] > before['errors']:
+        problems.append(f'server errors {before["errors"]} -> {after["errors"]}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('candidate', type=Path)
+    parser.add_argument('--latency', type=float, default=20, help='allowed p95/p99 growth, percent')
+    parser.add_argument('--min-ms', type=float, default=1, help='ignore latency growth below this, ms')
+    parser.add_argument('--throughput', type=float, default=15, help='allowed throughput drop, percent')
+    options: argparse.Namespace = parser.parse_args()
+
+    baseline: dict[str, Any] = json.loads(options.baseline.read_text())
+    candidate: dict[str, Any] = json.loads(options.candidate.read_text())
+    if baseline['meta'] != candidate['meta']:
+        print('warning: runs were made with different options or database', file=sys.stderr)
+
+    regressions: dict[str, list[str]] = {}
+    for name, after in candidate['endpoints'].items():
+        before: dict[str, Any] | None = baseline['endpoints'].get(name)
+        if before is None:
+            continue
+        problems: list[str] = compare_endpoint(before, after, options)
+        if problems:
+            regressions[name] = problems
+        print(
+            f'{name:45} p95 {before["latency_ms"]["p95"]:>8} -> {after["latency_ms"]["p95"]:>8} ms'
+            f'  sql {before["sql"]["mean"]:>6} -> {after["sql"]["mean"]:>6}'
+            f'  {"REGRESSION" if problems else "ok"}'
+        )
+
+    for name, problems in regressions.items():
+        print(f'{name}: {"; ".join(problems)}', file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark of JSON rendering and parsing: DRF stdlib JSONRenderer/JSONParser against orjson ones
+
+Goal pages are built with factories of the test suite (not saved) and serialized by GoalSerializer,
+the same payload as GET /goals/goal/list?limit=N returns. Each renderer encodes the page repeatedly,
+outputs are checked to be byte-identical. Parsing is measured on goal create request bodies.
+
+Usage:
+    python -m benchmarks.json_encoding --pages 20 100 1000 --repeat 200
+"""
+import argparse
+import io
+import json
+import os
+import random
+import time
+from datetime import timedelta
+from typing import Any, Callable
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.settings')
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from goals.models.goal import Goal  # noqa: E402
+from goals.serializers.goal import GoalSerializer  # noqa: E402
+from tests.factories import BoardFactory, CategoryFactory, GoalFactory, UserFactory  # noqa: E402
+from todolist.parsers import OrJSONParser  # noqa: E402
+from todolist.renderers import OrJSONRenderer  # noqa: E402
+
+
+def goal_page(size: int, rng: random.Random) -> dict[str, Any]:
+    """
+    Paginated goal list payload
+
+    Params:
+        - size: number of goals on page
+        - rng: random generator
+
+    Returns:
+        - dict as returned by LimitOffsetPagination
+    """
+    now = timezone.now()
+    users: list = [UserFactory.build(id=number, email=f'user{number}@example.com') for number in range(1, 21)]
+    board = BoardFactory.build(id=1)
+    categories: list = [CategoryFactory.build(id=number, board=board) for number in range(1, 11)]
+    goals: list[Goal] = [
+        GoalFactory.build(
+            id=number,
+            user=rng.choice(users),
+            category=rng.choice(categories),
+            description='Описание цели, description of goal. ' * rng.randint(0, 10),
+            status=rng.choice(Goal.Status.values),
+            priority=rng.choice(Goal.Priority.values),
+            due_date=now + timedelta(days=rng.randint(-30, 90)) if rng.random() > 0.25 else None,
+            created=now - timedelta(seconds=rng.randint(0, 10 ** 7)),
+            updated=now,
+        )
+        for number in range(1, size + 1)
+    ]
+    return {'count': size * 10, 'next': None, 'previous': None, 'results': GoalSerializer(goals, many=True).data}
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Mean duration of one call in milliseconds"""
+    started: float = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, nargs='+', default=[20, 100, 1000], help='goals per page')
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    options: argparse.Namespace = parser.parse_args()
+
+    rng = random.Random(options.seed)
+    results: list[dict[str, Any]] = []
+    for size in options.pages:
+        page: dict[str, Any] = goal_page(size, rng)
+        stdlib, fast = JSONRenderer(), OrJSONRenderer()
+        body: bytes = stdlib.render(page)
+        if fast.render(page) != body:
+            raise RuntimeError(f'Rendered page of {size} goals differs from JSONRenderer output')
+        render_stdlib: float = measure(lambda: stdlib.render(page), options.repeat)
+        render_fast: float = measure(lambda: fast.render(page), options.repeat)
+        results.append({
+            'goals': size,
+            'bytes': len(body),
+            'render_ms': {'stdlib': round(render_stdlib, 4), 'orjson': round(render_fast, 4)},
+            'render_speedup': round(render_stdlib / render_fast, 1),
+        })
+
+    request: bytes = json.dumps({
+        'title': 'Новая цель', 'description': 'x' * 500, 'category': 1, 'status': 1, 'priority': 2,
+        'due_date': timezone.now().isoformat(),
+    }).encode()
+    parse_stdlib: float = measure(lambda: JSONParser().parse(io.BytesIO(request)), options.repeat * 10)
+    parse_fast: float = measure(lambda: OrJSONParser().parse(io.BytesIO(request)), options.repeat * 10)
+
+    print(json.dumps({
+        'render': results,
+        'parse_goal_create': {
+            'bytes': len(request),
+            'parse_ms': {'stdlib': round(parse_stdlib, 4), 'orjson': round(parse_fast, 4)},
+            'parse_speedup': round(parse_stdlib / parse_fast, 1),
+        },
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark of visibility filters: participants joined to the listed table against semi-join
+on boards of user (visible_to querysets of goals models)
+
+Runs on the configured database, which is expected to be seeded with `manage.py seed`. For users with
+the most boards, each list query of the API (first page and count) is built both ways, checked to return
+the same rows, timed and explained.
+
+Usage:
+    python -m benchmarks.visibility_plans --users 3 --page 20 --repeat 20 --explain
+"""
+import argparse
+import json
+import os
+import time
+from typing import Any, Callable
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.settings')
+django.setup()
+
+from django.db.models import Count, QuerySet  # noqa: E402
+
+from core.models import User  # noqa: E402
+from goals.models.board import Board  # noqa: E402
+from goals.models.category import GoalCategory  # noqa: E402
+from goals.models.comment import Comment  # noqa: E402
+from goals.models.goal import Goal  # noqa: E402
+
+
+def joined(user: User) -> dict[str, QuerySet]:
+    """List querysets filtered the way views did before visible_to"""
+    return {
+        'boards': Board.objects.filter(participants__user=user, is_deleted=False),
+        'categories': GoalCategory.objects.select_related('board').filter(
+            board__participants__user=user, board__is_deleted=False, is_deleted=False
+        ),
+        'goals': Goal.objects.select_related('category').filter(
+            board__participants__user=user, board__is_deleted=False, category__is_deleted=False
+        ).exclude(status=Goal.Status.archived),
+        'comments': Comment.objects.select_related('goal').filter(
+            board__participants__user=user, board__is_deleted=False, goal__category__is_deleted=False
+        ).exclude(goal__status=Goal.Status.archived),
+    }
+
+
+def visible(user: User) -> dict[str, QuerySet]:
+    """List querysets of views"""
+    return {
+        'boards': Board.objects.visible_to(user),
+        'categories': GoalCategory.objects.select_related('board').visible_to(user),
+        'goals': Goal.objects.select_related('category').visible_to(user),
+        'comments': Comment.objects.select_related('goal').visible_to(user),
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Mean duration of one call in milliseconds"""
+    started: float = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=3, help='number of users with the most boards')
+    parser.add_argument('--page', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--explain', action='store_true', help='include query plans')
+    options: argparse.Namespace = parser.parse_args()
+
+    users: list[User] = list(
+        User.objects.annotate(boards=Count('participants')).filter(boards__gt=0).order_by('-boards')[:options.users]
+    )
+    if not users:
+        raise SystemExit('No board participants, seed the database first')
+    results: list[dict[str, Any]] = []
+    for user in users:
+        before, after = joined(user), visible(user)
+        for name in before:
+            old: QuerySet = before[name].order_by('-id')
+            new: QuerySet = after[name].order_by('-id')
+            if list(old[:options.page]) != list(new[:options.page]) or old.count() != new.count():
+                raise RuntimeError(f'{name} of user {user.id} differ')
+            result: dict[str, Any] = {
+                'user': user.id,
+                'list': name,
+                'rows': new.count(),
+                'page_ms': {
+                    'join': round(measure(lambda: list(old[:options.page]), options.repeat), 3),
+                    'semi_join': round(measure(lambda: list(new[:options.page]), options.repeat), 3),
+                },
+                'count_ms': {
+                    'join': round(measure(old.count, options.repeat), 3),
+                    'semi_join': round(measure(new.count, options.repeat), 3),
+                },
+            }
+            if options.explain:
+                result['plan'] = {
+                    'join': old[:options.page].explain().splitlines(),
+                    'semi_join': new[:options.page].explain().splitlines(),
+                }
+            results.append(result)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
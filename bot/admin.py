@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from bot.models import TgUser
+from bot.models import Reminder, TgUser
 
 
 # ----------------------------------------------------------------
@@ -17,3 +17,9 @@ class BoardAdmin(admin.ModelAdmin):
             'fields': ('status',)
         }),
     )
+
+
+@admin.register(Reminder)
+class ReminderAdmin(admin.ModelAdmin):
+    list_display = ('tg_user', 'goal', 'due_date', 'window', 'sent')
+    list_select_related = ('tg_user', 'goal')
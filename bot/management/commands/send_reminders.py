@@ -0,0 +1,40 @@
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+from django.utils import timezone
+
+from bot.tg.client import TgClient
+from bot.tg.reminders import RateLimiter, collect_digests, deliver
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Send digests of goals approaching due date to verified telegram users, once per reminder window'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--windows', type=int, nargs='+', default=settings.REMINDER_WINDOWS_HOURS,
+            help='reminder windows in hours'
+        )
+        parser.add_argument('--rate', type=float, default=settings.REMINDER_RATE, help='messages per second')
+        parser.add_argument('--loop', type=int, default=0, help='run every LOOP seconds, run once by default')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run once (e.g. by cron) or as a worker with --loop"""
+        client: TgClient = TgClient(settings.TG_BOT_KEY)
+        limiter: RateLimiter = RateLimiter(options['rate'])
+        while True:
+            close_old_connections()
+            digests: list = collect_digests(timezone.now(), options['windows'])
+            delivered: int = deliver(digests, client, limiter)
+            self.stdout.write(self.style.SUCCESS(
+                f'Sent {delivered} of {len(digests)} digests '
+                f'({sum(len(digest.reminders) for digest in digests)} reminders)'
+            ))
+            if not options['loop']:
+                return
+            time.sleep(options['loop'])
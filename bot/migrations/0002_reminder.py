@@ -0,0 +1,34 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0008_goal_due_idx'),
+        ('bot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Reminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateTimeField(verbose_name='Дедлайн')),
+                ('window', models.PositiveIntegerField(verbose_name='Окно напоминания, ч')),
+                ('sent', models.DateTimeField(auto_now_add=True, verbose_name='Дата отправки')),
+                ('goal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='goals.goal', verbose_name='Цель')),
+                ('tg_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='bot.tguser', verbose_name='Телеграм пользователь')),
+            ],
+            options={
+                'verbose_name': 'Напоминание',
+                'verbose_name_plural': 'Напоминания',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reminder',
+            constraint=models.UniqueConstraint(fields=('goal', 'tg_user', 'due_date', 'window'), name='reminder_unique'),
+        ),
+    ]
@@ -49,3 +49,43 @@ class TgUser(models.Model):
     class Meta:
         verbose_name: str = 'Телеграм пользователь'
         verbose_name_plural: str = 'Телеграм пользователи'
+
+
+class Reminder(models.Model):
+    """
+    Model representing a due date reminder sent to telegram user, runs of reminders skip sent ones
+
+    Attrs:
+        - tg_user: Related telegram user
+        - goal: Related goal
+        - due_date: Due date of goal at sending, reminders are sent again when due date changes
+        - window: Reminder window in hours, the smallest window goal was due in
+        - sent: Sending date
+    """
+    tg_user = models.ForeignKey(
+        TgUser,
+        verbose_name='Телеграм пользователь',
+        on_delete=models.CASCADE
+    )
+    goal = models.ForeignKey(
+        'goals.Goal',
+        verbose_name='Цель',
+        on_delete=models.CASCADE
+    )
+    due_date = models.DateTimeField(
+        verbose_name='Дедлайн'
+    )
+    window = models.PositiveIntegerField(
+        verbose_name='Окно напоминания, ч'
+    )
+    sent = models.DateTimeField(
+        verbose_name='Дата отправки',
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name: str = 'Напоминание'
+        verbose_name_plural: str = 'Напоминания'
+        constraints = [
+            models.UniqueConstraint(fields=['goal', 'tg_user', 'due_date', 'window'], name='reminder_unique'),
+        ]
@@ -56,11 +56,7 @@ class BotDAO:
         Returns:
             - goals: list of goals from database
         """
-        goals: QuerySet[Goal] = Goal.objects.select_related('category').filter(
-            category__board__participants__user=tg_user.user,
-            category__board__is_deleted=False,
-            category__is_deleted=False
-        ).exclude(status=Goal.Status.archived)
+        goals: QuerySet[Goal] = Goal.objects.select_related('category').visible_to(tg_user.user)
         return goals
 
     @staticmethod
@@ -74,11 +70,8 @@ class BotDAO:
         Returns:
             - goals: list of categories from database
         """
-        categories: QuerySet[GoalCategory] = GoalCategory.objects.select_related('board').filter(
-            board__participants__role__in=[BoardParticipant.Role.owner, BoardParticipant.Role.writer],
-            board__participants__user=tg_user.user,
-            board__is_deleted=False,
-            is_deleted=False
+        categories: QuerySet[GoalCategory] = GoalCategory.objects.select_related('board').visible_to(
+            tg_user.user, min_role=BoardParticipant.Role.writer
         )
         return categories
 
@@ -91,10 +84,7 @@ class BotDAO:
             - tg_user: telegram user
             - category: chosen category
         """
-        category_: GoalCategory = GoalCategory.objects.select_related('board').get(
-            board__participants__user=tg_user.user,
-            board__is_deleted=False,
-            is_deleted=False,
+        category_: GoalCategory = GoalCategory.objects.select_related('board').visible_to(tg_user.user).get(
             title__iexact=category
         )
         tg_user.selected_category = category_
@@ -110,11 +100,11 @@ class BotDAO:
             - item: data from bot, contains message, etc
 
         Returns:
-            - new_goal.category.board.id, new_goal.category.id, new_goal.id: board id, category id, goal id
+            - new_goal.board_id, new_goal.category_id, new_goal.id: board id, category id, goal id
         """
         new_goal: Goal = Goal.objects.create(
             user=tg_user.user,
             category=tg_user.selected_category,
             title=item.message.text
         )
-        return new_goal.category.board.id, new_goal.category.id, new_goal.id
+        return new_goal.board_id, new_goal.category_id, new_goal.id
@@ -0,0 +1,170 @@
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+import requests
+from django.utils import timezone
+
+from bot.models import Reminder, TgUser
+from bot.tg.client import TgClient
+from goals.models.goal import Goal
+
+logger = logging.getLogger(__name__)
+
+ACTIVE: tuple = (Goal.Status.to_do, Goal.Status.in_progress)
+
+
+# ----------------------------------------------------------------
+# digests
+@dataclass
+class Digest:
+    """
+    Reminders of one chat, sent as one message
+
+    Attrs:
+        - chat_id: id of telegram chat
+        - reminders: unsaved Reminder entities, saved after message is sent
+        - goals: goals by id, values of due_goals
+        - attempts: number of sending attempts
+    """
+    chat_id: int
+    reminders: list[Reminder] = field(default_factory=list)
+    goals: dict[int, dict] = field(default_factory=dict)
+    attempts: int = 0
+
+    def text(self) -> str:
+        lines: list[str] = [
+            f"#{goal['id']} {goal['title']} - до {timezone.localtime(goal['due_date']):%d.%m.%Y %H:%M}"
+            for goal in sorted(self.goals.values(), key=lambda goal: goal['due_date'])
+        ]
+        return 'Приближается дедлайн целей:\n' + '\n'.join(lines)
+
+
+def due_goals(now: datetime, horizon: timedelta) -> list[dict]:
+    """
+    Function to get active goals due within horizon, read by range of goal_due_idx index
+
+    Params:
+        - now: current date
+        - horizon: the largest reminder window
+
+    Returns:
+        - list of goal values: id, title, due_date, board_id
+    """
+    return list(
+        Goal.objects.filter(
+            due_date__gte=now, due_date__lt=now + horizon, status__in=ACTIVE,
+            category__is_deleted=False, board__is_deleted=False
+        ).values('id', 'title', 'due_date', 'board_id').order_by('due_date', 'id')
+    )
+
+
+def collect_digests(now: datetime, windows: Iterable[int]) -> list[Digest]:
+    """
+    Function to collect reminders of goals due within windows for verified telegram users of their boards.
+    Goal is reminded once per window it enters, with the smallest window only when it enters several
+    windows at once. Sent reminders are skipped, so runs are idempotent and a run reads due goals,
+    their recipients and reminders already sent for them only
+
+    Params:
+        - now: current date
+        - windows: reminder windows in hours, e.g. (24, 1)
+
+    Returns:
+        - list of digests, one per chat
+    """
+    windows = sorted(windows)
+    goals: list[dict] = due_goals(now, timedelta(hours=windows[-1]))
+    if not goals:
+        return []
+
+    recipients: dict[int, list[tuple[int, int]]] = {}
+    for tg_user_id, chat_id, board_id in TgUser.objects.filter(
+        status=TgUser.Status.verified, user__participants__board__in={goal['board_id'] for goal in goals}
+    ).values_list('id', 'tg_chat_id', 'user__participants__board'):
+        recipients.setdefault(board_id, []).append((tg_user_id, chat_id))
+
+    sent: dict[tuple, int] = {}
+    for key in Reminder.objects.filter(
+        goal__in=[goal['id'] for goal in goals], due_date__gte=now
+    ).values_list('goal', 'tg_user', 'due_date', 'window'):
+        sent[key[:3]] = min(key[3], sent.get(key[:3], key[3]))
+
+    digests: dict[int, Digest] = {}
+    for goal in goals:
+        window: int = next(hours for hours in windows if goal['due_date'] - now < timedelta(hours=hours))
+        for tg_user_id, chat_id in recipients.get(goal['board_id'], ()):
+            if sent.get((goal['id'], tg_user_id, goal['due_date']), window + 1) <= window:
+                continue
+            digest: Digest = digests.setdefault(chat_id, Digest(chat_id))
+            digest.goals[goal['id']] = goal
+            digest.reminders.append(
+                Reminder(tg_user_id=tg_user_id, goal_id=goal['id'], due_date=goal['due_date'], window=window)
+            )
+    return list(digests.values())
+
+
+# ----------------------------------------------------------------
+# delivery
+class RateLimiter:
+    """
+    Limiter of sending rate, Telegram allows about 30 messages per second for a bot
+
+    Attrs:
+        - interval: minimal interval between messages in seconds
+    """
+    def __init__(self, rate: float) -> None:
+        self.interval: float = 1 / rate
+        self._next: float = 0
+
+    def wait(self) -> None:
+        delay: float = self._next - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next = max(self._next, time.monotonic()) + self.interval
+
+    def pause(self, seconds: float) -> None:
+        """Pause sending, e.g. on 429 response with retry_after"""
+        self._next = time.monotonic() + seconds
+
+
+def deliver(digests: list[Digest], client: TgClient, limiter: RateLimiter, attempts: int = 3) -> int:
+    """
+    Function to send digests through rate-limited queue. Reminders of sent digest are saved right after
+    sending, failed digests are retried at the end of the queue and left for the next run then
+
+    Params:
+        - digests: digests to send
+        - client: telegram client
+        - limiter: rate limiter
+        - attempts: maximal number of attempts per digest
+
+    Returns:
+        - number of sent digests
+    """
+    queue: deque[Digest] = deque(digests)
+    delivered: int = 0
+    while queue:
+        digest: Digest = queue.popleft()
+        digest.attempts += 1
+        limiter.wait()
+        try:
+            response: Any = client.send_message(chat_id=digest.chat_id, text=digest.text())
+        except requests.RequestException:
+            logger.warning('Reminders to chat %s are not sent', digest.chat_id, exc_info=True)
+            response = {}
+        if getattr(response, 'ok', False):
+            Reminder.objects.bulk_create(digest.reminders, ignore_conflicts=True)
+            delivered += 1
+            continue
+        retry_after: Any = (response.get('parameters') or {}).get('retry_after') if isinstance(response, dict) else None
+        if retry_after:
+            limiter.pause(retry_after)
+        if digest.attempts < attempts:
+            queue.append(digest)
+        else:
+            logger.warning('Reminders to chat %s are not sent: %s', digest.chat_id, response)
+    return delivered
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class GoalsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'goals'
+
+    def ready(self) -> None:
+        # board versions, goal counters, positions and live events follow changes of board content
+        import goals.counters  # noqa: F401
+        import goals.live  # noqa: F401
+        import goals.positions  # noqa: F401
+        import goals.versioning  # noqa: F401
@@ -0,0 +1,141 @@
+from datetime import datetime
+from typing import Any
+
+from django.db import connection, models, transaction
+from django.db.models import Model, QuerySet
+from django.http import Http404
+from rest_framework.exceptions import ValidationError
+
+from goals.models.archive import ArchivedComment, ArchivedGoal
+from goals.models.board import lock_boards
+from goals.models.category import lock_categories
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.models.tombstone import Tombstone
+from goals.versioning import bury_many, touch
+
+GOAL_FIELDS: tuple = (
+    'id', 'user_id', 'category_id', 'board_id', 'title', 'description', 'status', 'priority', 'due_date',
+    'created', 'updated'
+)
+COMMENT_FIELDS: tuple = ('id', 'goal_id', 'board_id', 'user_id', 'text', 'created', 'updated')
+
+
+# ----------------------------------------------------------------
+# helpers
+def copy(source: Any, model: type[Model], fields: tuple) -> Any:
+    return model(**{name: getattr(source, name) for name in fields})
+
+
+def delete_rows(model: type[Model], ids: list[int]) -> None:
+    """
+    Function to delete rows by ids with one statement. Model signals are not sent: rows are moved,
+    not removed, and their tombstones are written in bulk by the caller
+
+    Params:
+        - model: model of rows
+        - ids: ids of rows
+    """
+    table: str = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {table} WHERE id IN ({", ".join(["%s"] * len(ids))})', ids)
+
+
+def delete_dependents(model: type[Model], ids: list[int], handled: tuple = ()) -> None:
+    """
+    Function to do on_delete of rows referencing rows which are deleted by delete_rows: rows of CASCADE
+    relations (e.g. sent reminders of goals) are deleted, nullable references are cleared
+
+    Params:
+        - model: model of deleted rows
+        - ids: ids of deleted rows
+        - handled: models of relations deleted by the caller
+    """
+    for relation in model._meta.related_objects:
+        if relation.related_model in handled:
+            continue
+        related: QuerySet = relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': ids})
+        if relation.on_delete is models.CASCADE:
+            related.delete()
+        elif relation.field.null:
+            related.update(**{relation.field.name: None})
+
+
+# ----------------------------------------------------------------
+# archiving
+def archivable(cutoff: datetime) -> QuerySet[Goal]:
+    """Goals archived (deleted by user, with their category or board) before cutoff"""
+    return Goal.objects.filter(status=Goal.Status.archived, updated__lt=cutoff)
+
+
+def archive_goals(ids: list[int], cutoff: datetime) -> int:
+    """
+    Function to move archived goals and their comments to archive tables in one transaction. Goals are
+    locked and checked again, so goals restored from archive in the meantime stay. Removals are recorded
+    as tombstones for sync clients, rows referencing goals with CASCADE (e.g. sent reminders) are deleted
+
+    Params:
+        - ids: ids of goals
+        - cutoff: goals archived before this date are moved
+
+    Returns:
+        - number of moved goals
+    """
+    with transaction.atomic():
+        # boards before goals and comments, as other writes of board content lock them
+        lock_boards(archivable(cutoff).filter(id__in=ids).values('board_id'))
+        goals: list[Goal] = list(archivable(cutoff).filter(id__in=ids).select_for_update().order_by('id'))
+        if not goals:
+            return 0
+        ids = [goal.id for goal in goals]
+        comments: list[Comment] = list(Comment.objects.filter(goal__in=ids).order_by('id'))
+
+        ArchivedGoal.objects.bulk_create([copy(goal, ArchivedGoal, GOAL_FIELDS) for goal in goals])
+        ArchivedComment.objects.bulk_create([copy(comment, ArchivedComment, COMMENT_FIELDS) for comment in comments])
+        delete_dependents(Goal, ids, handled=(Comment,))
+        if comments:
+            delete_rows(Comment, [comment.id for comment in comments])
+        delete_rows(Goal, ids)
+        bury_many([
+            *((comment.board_id, Tombstone.Entity.comment, comment.id) for comment in comments),
+            *((goal.board_id, Tombstone.Entity.goal, goal.id) for goal in goals),
+        ])
+    return len(goals)
+
+
+def restore_goal(archived: ArchivedGoal) -> Goal:
+    """
+    Function to move goal with its comments from archive back to goals. Goal is restored with
+    to_do status, so it is shown and counted again
+
+    Params:
+        - archived: ArchivedGoal entity
+
+    Returns:
+        - restored Goal entity
+
+    Raises:
+        - Http404 (if goal was restored by a concurrent request)
+        - ValidationError (if category of goal is deleted)
+    """
+    with transaction.atomic():
+        # board and category before archived row, as other writes of board content lock them,
+        # concurrent restores of the goal wait and find no row
+        lock_categories([archived.category_id])
+        locked: ArchivedGoal | None = ArchivedGoal.objects.select_for_update().select_related('category').filter(
+            pk=archived.pk
+        ).first()
+        if locked is None:
+            raise Http404
+        archived = locked
+        if archived.category.is_deleted:
+            raise ValidationError("You can't restore goal of deleted category")
+        goal: Goal = copy(archived, Goal, GOAL_FIELDS)
+        goal.status = Goal.Status.to_do
+        goal.save(force_insert=True)
+        Comment.objects.bulk_create(
+            [copy(comment, Comment, COMMENT_FIELDS) for comment in archived.comments.order_by('id')]
+        )
+        touch(Comment.objects.filter(goal=goal), resync=True)
+        archived.delete()
+    return goal
@@ -0,0 +1,157 @@
+from collections import Counter
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from goals.models.board import Board
+from goals.models.category import GoalCategory
+from goals.models.goal import Goal
+
+COUNTER_FIELDS: tuple = ('goals_total', 'goals_open', 'goals_done')
+OPEN_STATUSES: tuple = (Goal.Status.to_do, Goal.Status.in_progress)
+
+
+# ----------------------------------------------------------------
+# counting
+def contribution(status: int | None) -> Counter:
+    """
+    Counters of one goal with given status. Overdue goals are not counted here, as they depend on time
+    (see goals.summary)
+
+    Params:
+        - status: goal status, None for goal which is not counted
+
+    Returns:
+        - Counter by counter field
+    """
+    if status is None or status == Goal.Status.archived:
+        return Counter()
+    return Counter(goals_total=1, goals_open=int(status in OPEN_STATUSES), goals_done=int(status == Goal.Status.done))
+
+
+def count_goals(goals: QuerySet[Goal], group_by: str) -> dict[int, dict[str, int]]:
+    """
+    Function to count goals with one grouped query
+
+    Params:
+        - goals: goals to count
+        - group_by: field to group by, category or board
+
+    Returns:
+        - counters by group
+    """
+    rows: Iterable[dict] = goals.exclude(status=Goal.Status.archived).values(group_by).annotate(
+        goals_total=Count('id'),
+        goals_open=Count('id', filter=Q(status__in=OPEN_STATUSES)),
+        goals_done=Count('id', filter=Q(status=Goal.Status.done)),
+    ).order_by()
+    return {row.pop(group_by): row for row in rows}
+
+
+def change_counters(category_id: int, board_id: int, delta: Counter) -> None:
+    """
+    Function to change counters of category and its board by delta with F expressions
+
+    Params:
+        - category_id: id of category
+        - board_id: id of board of category
+        - delta: change by counter field, may be negative
+    """
+    values: dict[str, Any] = {name: F(name) + change for name, change in delta.items() if change}
+    if not values:
+        return
+    GoalCategory.objects.filter(id=category_id).update(**values)
+    Board.objects.filter(id=board_id).update(**values)
+
+
+def clear_counters(categories: QuerySet[GoalCategory]) -> None:
+    """
+    Function to subtract counters of categories from their boards and set them to zero,
+    used before goals of categories are archived with QuerySet.update
+
+    Params:
+        - categories: categories which goals are archived
+    """
+    counted: dict[int, dict[str, int]] = count_goals(
+        Goal.objects.filter(category__in=categories), 'board'
+    )
+    for board_id, counters in counted.items():
+        Board.objects.filter(id=board_id).update(**{name: F(name) - counters[name] for name in COUNTER_FIELDS})
+    categories.update(**dict.fromkeys(COUNTER_FIELDS, 0))
+
+
+# ----------------------------------------------------------------
+# signal receivers
+@receiver(post_save, sender=Goal, dispatch_uid='counters_goal_save')
+def count_saved(sender: type, instance: Goal, created: bool, **kwargs: Any) -> None:
+    if created:
+        change_counters(instance.category_id, instance.board_id, contribution(instance.status))
+        return
+    if not hasattr(instance, 'loaded_status'):
+        # previous state is unknown, reconciliation repairs counters
+        return
+    old_category: int = instance.loaded_category_id
+    if old_category == instance.category_id:
+        delta = contribution(instance.status)
+        delta.subtract(contribution(instance.loaded_status))
+        change_counters(instance.category_id, instance.board_id, delta)
+        return
+    removed = Counter()
+    removed.subtract(contribution(instance.loaded_status))
+    change_counters(old_category, instance.loaded_board_id, removed)
+    change_counters(instance.category_id, instance.board_id, contribution(instance.status))
+
+
+@receiver(post_delete, sender=Goal, dispatch_uid='counters_goal_delete')
+def count_deleted(sender: type, instance: Goal, **kwargs: Any) -> None:
+    removed = Counter()
+    removed.subtract(contribution(getattr(instance, 'loaded_status', instance.status)))
+    change_counters(
+        getattr(instance, 'loaded_category_id', instance.category_id),
+        getattr(instance, 'loaded_board_id', instance.board_id),
+        removed,
+    )
+
+
+# ----------------------------------------------------------------
+# reconciliation
+def reconcile_boards(board_ids: list[int]) -> int:
+    """
+    Function to recount counters of boards and their categories and repair drift
+
+    Params:
+        - board_ids: ids of boards
+
+    Returns:
+        - number of repaired categories and boards
+    """
+    repaired: int = 0
+    empty: dict[str, int] = dict.fromkeys(COUNTER_FIELDS, 0)
+    with transaction.atomic():
+        # rows are locked in the order of writes of board content (boards, then categories, see lock_categories),
+        # concurrent writes wait and apply their changes to repaired counters
+        boards: list[Board] = list(Board.objects.select_for_update().filter(id__in=board_ids).order_by('id'))
+        categories: list[GoalCategory] = list(
+            GoalCategory.objects.select_for_update().filter(board__in=board_ids).order_by('id')
+        )
+        by_category: dict[int, dict[str, int]] = count_goals(
+            Goal.objects.filter(board__in=boards), 'category'
+        )
+        totals: dict[int, Counter] = {board.id: Counter() for board in boards}
+        for category in categories:
+            counters: dict[str, int] = by_category.get(category.id, empty)
+            totals[category.board_id].update(counters)
+            repaired += _repair(category, counters)
+        for board in boards:
+            repaired += _repair(board, {name: totals[board.id][name] for name in COUNTER_FIELDS})
+    return repaired
+
+
+def _repair(entity: Board | GoalCategory, counters: dict[str, int]) -> int:
+    if all(getattr(entity, name) == value for name, value in counters.items()):
+        return 0
+    type(entity).objects.filter(id=entity.id).update(**counters)
+    return 1
@@ -2,6 +2,7 @@ import django_filters
 from django.db import models
 from django_filters import rest_framework
 
+from goals.models.comment import Comment
 from goals.models.goal import Goal
 
 
@@ -9,9 +10,13 @@ from goals.models.goal import Goal
 # filters
 class GoalDateFilter(rest_framework.FilterSet):
     """filterset defining fields for sorting, filtering, searching"""
+    # former name of board filter, goals keep board of their category
+    category__board = django_filters.NumberFilter(field_name="board")
+
     class Meta:
         model = Goal
         fields: dict = {
+            "board": ("exact", "in"),
             "due_date": ("lte", "gte"),
             "category": ("exact", "in"),
             "status": ("exact", "in"),
@@ -21,3 +26,13 @@ class GoalDateFilter(rest_framework.FilterSet):
     filter_overrides: dict = {
         models.DateTimeField: {"filter_class": django_filters.IsoDateTimeFilter},
     }
+
+
+class CommentFilter(rest_framework.FilterSet):
+    """filterset defining fields for filtering comments"""
+    # former name of board filter, comments keep board of their goal
+    goal__category__board = django_filters.NumberFilter(field_name="board")
+
+    class Meta:
+        model = Comment
+        fields: tuple = ("board", "goal")
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+
+logger = logging.getLogger(__name__)
+
+# event sent to a subscriber which queue overflowed, client resyncs instead of reading lost events
+OVERFLOW: dict[str, str] = {'entity': 'overflow'}
+
+
+# ----------------------------------------------------------------
+# in-process broker
+class Subscription:
+    """
+    Queue of events of some boards for one open stream, filled from any thread
+
+    Attrs:
+        - boards: ids of boards
+        - queue: events, OVERFLOW is the last one when stream does not keep up
+    """
+    def __init__(self, boards: Iterable[int], size: int) -> None:
+        self.boards: frozenset[int] = frozenset(boards)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.overflowed: bool = False
+
+    def put(self, event: dict) -> None:
+        """Runs on the loop of the stream"""
+        if self.overflowed:
+            return
+        if self.queue.qsize() >= self.queue.maxsize - 1:
+            self.overflowed = True
+            event = OVERFLOW
+        self.queue.put_nowait(event)
+
+
+class Broker:
+    """
+    Process-wide fan-out of board events to open streams. Events come from the backend,
+    streams subscribe to boards and read events from their queues without touching the database
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, boards: Iterable[int], size: int = 100) -> Subscription:
+        """
+        Method to subscribe to events of boards, called on the loop of the stream
+
+        Params:
+            - boards: ids of boards
+            - size: maximal number of events waiting to be sent
+
+        Returns:
+            - Subscription
+        """
+        subscription = Subscription(boards, size)
+        with self._lock:
+            for board in subscription.boards:
+                self._subscriptions[board].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for board in subscription.boards:
+                self._subscriptions[board].discard(subscription)
+                if not self._subscriptions[board]:
+                    del self._subscriptions[board]
+
+    def dispatch(self, event: dict) -> None:
+        """
+        Method to pass event to subscriptions of its board, safe to call from any thread
+
+        Params:
+            - event: event with board id
+        """
+        with self._lock:
+            subscriptions: list[Subscription] = list(self._subscriptions.get(event['board'], ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # loop of a stream is closed, the stream unsubscribes itself
+                pass
+
+    @property
+    def streams(self) -> int:
+        with self._lock:
+            return len({subscription for group in self._subscriptions.values() for subscription in group})
+
+
+# ----------------------------------------------------------------
+# backends
+class LocalBackend:
+    """
+    Events of this process only: writes and streams are served by the same process (development, tests)
+    """
+    def __init__(self, broker: Broker) -> None:
+        self.broker = broker
+
+    def publish(self, event: dict) -> None:
+        """Event is dispatched after commit of the change"""
+        transaction.on_commit(lambda: self.broker.dispatch(event))
+
+    def start(self) -> None:
+        pass
+
+
+class PostgresBackend(LocalBackend):
+    """
+    Events of all processes through PostgreSQL LISTEN/NOTIFY. A change is notified in its transaction,
+    so the event is delivered on commit only. Each process with open streams keeps one listening
+    connection (LIVE_EVENTS_DATABASE_URL or default database) in a thread, streams themselves do not
+    hold database connections
+
+    Attrs:
+        - channel: notification channel
+    """
+    channel: str = 'todolist_board_events'
+
+    def __init__(self, broker: Broker) -> None:
+        super().__init__(broker)
+        self._lock = threading.Lock()
+        self._listener: threading.Thread | None = None
+
+    def publish(self, event: dict) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [self.channel, json.dumps(event)])
+
+    def start(self) -> None:
+        """Listener is started by the first stream of the process"""
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='board-events', daemon=True)
+                self._listener.start()
+
+    def _listen(self) -> None:
+        """Listen forever, reconnecting with backoff when connection is lost"""
+        import psycopg2
+
+        delay: float = 1
+        while True:
+            try:
+                listener: Any = (
+                    psycopg2.connect(settings.LIVE_EVENTS_DATABASE_URL) if settings.LIVE_EVENTS_DATABASE_URL
+                    else psycopg2.connect(**connection.get_connection_params())
+                )
+                listener.autocommit = True
+                with listener.cursor() as cursor:
+                    cursor.execute(f'LISTEN {self.channel}')
+                delay = 1
+                while True:
+                    if select.select([listener], [], [], 30) == ([], [], []):
+                        continue
+                    listener.poll()
+                    while listener.notifies:
+                        self.broker.dispatch(json.loads(listener.notifies.pop(0).payload))
+            except Exception:
+                logger.warning('Board events listener failed, reconnecting in %s s', delay, exc_info=True)
+                time.sleep(delay)
+                delay = min(delay * 2, 30)
+
+
+broker = Broker()
+_backend: LocalBackend | None = None
+
+
+def get_backend() -> LocalBackend:
+    """Backend of LIVE_EVENTS_BACKEND setting, created once per process"""
+    global _backend
+    if _backend is None:
+        _backend = import_string(settings.LIVE_EVENTS_BACKEND)(broker)
+    return _backend
+
+
+# ----------------------------------------------------------------
+# board resync
+def publish_changed(boards: Iterable[tuple[int, int]]) -> None:
+    """
+    Function to publish board-level events of writes which bypass model signals (bulk_create, QuerySet.update,
+    archiving, purge): changed rows are not listed, clients resync the board by /goals/sync. Called in
+    the transaction of the change, events are delivered on commit
+
+    Params:
+        - boards: id and new version of each changed board
+    """
+    for board, version in boards:
+        get_backend().publish({'board': board, 'entity': 'board', 'id': board, 'action': 'changed', 'version': version})
+
+
+# ----------------------------------------------------------------
+# signal receivers
+ENTITIES: dict[type, str] = {GoalCategory: 'category', Goal: 'goal', Comment: 'comment'}
+
+
+@receiver(post_save, sender=Comment, dispatch_uid='live_comment_saved')
+@receiver(post_save, sender=Goal, dispatch_uid='live_goal_saved')
+@receiver(post_save, sender=GoalCategory, dispatch_uid='live_category_saved')
+def publish_saved(sender: type, instance: Any, created: bool, **kwargs: Any) -> None:
+    action: str = 'created' if created else 'updated'
+    former: int | None = getattr(instance, 'loaded_board_id', None) if sender is Goal else None
+    if former is not None and former != instance.board_id:
+        # moved goal leaves its former board
+        get_backend().publish({'board': former, 'entity': ENTITIES[sender], 'id': instance.pk, 'action': 'deleted'})
+    get_backend().publish({'board': instance.board_id, 'entity': ENTITIES[sender], 'id': instance.pk, 'action': action})
+
+
+@receiver(post_delete, sender=Comment, dispatch_uid='live_comment_deleted')
+@receiver(post_delete, sender=Goal, dispatch_uid='live_goal_deleted')
+@receiver(post_delete, sender=GoalCategory, dispatch_uid='live_category_deleted')
+def publish_deleted(sender: type, instance: Any, **kwargs: Any) -> None:
+    get_backend().publish(
+        {'board': instance.board_id, 'entity': ENTITIES[sender], 'id': instance.pk, 'action': 'deleted'}
+    )
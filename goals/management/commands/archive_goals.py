@@ -0,0 +1,34 @@
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from goals.archive import archivable, archive_goals
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Move goals archived longer than DAYS days with their comments to archive tables in batches'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--days', type=int, default=settings.ARCHIVE_AFTER_DAYS, help='days since goal was archived'
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='goals moved in one transaction')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Walk archivable goals by id, each batch is moved in its own short transaction"""
+        started: float = time.monotonic()
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        goals = archivable(cutoff).order_by('id')
+        last_id: int = 0
+        moved: int = 0
+        while batch := list(goals.filter(id__gt=last_id).values_list('id', flat=True)[:options['batch_size']]):
+            moved += archive_goals(batch, cutoff)
+            last_id = batch[-1]
+        elapsed: float = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'Moved {moved} goals to archive in {elapsed:.1f}s'))
@@ -0,0 +1,48 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core.models import User
+from goals.models.board import Board, BoardParticipant
+from goals.transfer import IMPORT_CHUNK_SIZE, IMPORT_FORMATS, ImportResult, import_goals
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Create goals of board from CSV or JSON lines file (format of board export)'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('board', type=int, help='board id')
+        parser.add_argument('file', type=Path)
+        parser.add_argument('--user', required=True, help='username of author, owner or writer of board')
+        parser.add_argument('--format', choices=tuple(IMPORT_FORMATS), help='defined by file extension by default')
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Check board and user, then import file by chunks and print summary with rejected rows"""
+        path: Path = options['file']
+        import_format: str = options['format'] or path.suffix.lstrip('.')
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(f'Unknown format "{import_format}", use --format')
+        board: Board | None = Board.objects.filter(id=options['board'], is_deleted=False).first()
+        if board is None:
+            raise CommandError(f'Board {options["board"]} not found')
+        user: User | None = User.objects.filter(username=options['user']).first()
+        if user is None:
+            raise CommandError(f'User "{options["user"]}" not found')
+        if not BoardParticipant.objects.with_role(user, BoardParticipant.Role.writer).filter(board=board).exists():
+            raise CommandError(f'User "{user.username}" is not owner or writer of board {board.id}')
+
+        with path.open('rb') as file:
+            result: ImportResult = import_goals(
+                board, SimpleNamespace(user=user), IMPORT_FORMATS[import_format](file), options['chunk_size']
+            )
+        for error in result.errors:
+            self.stderr.write(f'row {error["row"]}: {error["errors"]}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Read {result.rows} rows: created {result.created} goals and {result.categories_created} categories, '
+            f'rejected {result.failed}, skipped {result.skipped}'
+        ))
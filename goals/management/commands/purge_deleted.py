@@ -0,0 +1,46 @@
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from goals.purge import Purge, deleted_boards, deleted_categories, walk
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Hard delete boards and categories soft-deleted more than DAYS days ago with all their rows'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--days', type=int, default=settings.PURGE_AFTER_DAYS, help='days since board or category was deleted'
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='rows deleted in one transaction')
+        parser.add_argument('--pause', type=float, default=0.05, help='seconds to sleep after each batch')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Purge boards, then categories of remaining boards, reporting progress per board or category"""
+        started: float = time.monotonic()
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        purge: Purge = Purge(options['batch_size'], options['pause'])
+        for kind, ids, method in (
+            ('board', walk(deleted_boards(cutoff)), purge.board),
+            ('category', walk(deleted_categories(cutoff)), purge.category),
+        ):
+            for entity_id in ids:
+                entity_started: float = time.monotonic()
+                removed: int = method(entity_id)
+                self.stdout.write(f'Purged {kind} {entity_id}: {removed} rows, {self.rate(removed, entity_started)}')
+        total: int = sum(purge.removed.values())
+        tables: str = ', '.join(f'{table} {count}' for table, count in sorted(purge.removed.items()))
+        self.stdout.write(self.style.SUCCESS(
+            f'Removed {total} rows ({tables or "nothing to purge"}), {self.rate(total, started)}'
+        ))
+
+    @staticmethod
+    def rate(rows: int, started: float) -> str:
+        elapsed: float = time.monotonic() - started
+        return f'{rows / elapsed if elapsed else 0:.0f} rows/s in {elapsed:.1f}s'
@@ -0,0 +1,32 @@
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from goals.positions import rebalance, unbalanced
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Give goals of kanban columns with long, missing or equal position keys evenly spaced short keys'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--length', type=int, default=settings.POSITION_REBALANCE_LENGTH,
+            help='rebalance columns with keys longer than LENGTH'
+        )
+        parser.add_argument('--loop', type=int, default=0, help='run every LOOP seconds, run once by default')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run once (e.g. by cron) or as a worker with --loop, each column is rebalanced in its own transaction"""
+        while True:
+            close_old_connections()
+            columns: set[tuple[int, int]] = unbalanced(options['length'])
+            changed: int = sum(rebalance(category_id, status) for category_id, status in sorted(columns))
+            self.stdout.write(self.style.SUCCESS(f'Rebalanced {len(columns)} columns ({changed} goals)'))
+            if not options['loop']:
+                return
+            time.sleep(options['loop'])
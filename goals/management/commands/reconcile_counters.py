@@ -0,0 +1,35 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from goals.counters import reconcile_boards
+from goals.models.board import Board
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Recount goal counters of boards and categories and repair drift, boards are processed in batches'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--boards', type=int, nargs='+', help='ids of boards, all boards by default')
+        parser.add_argument('--batch-size', type=int, default=200, help='boards locked and recounted together')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Walk boards by id, each batch is recounted in its own short transaction"""
+        started: float = time.monotonic()
+        boards = Board.objects.order_by('id')
+        if options['boards']:
+            boards = boards.filter(id__in=options['boards'])
+        last_id: int = 0
+        checked: int = 0
+        repaired: int = 0
+        while batch := list(boards.filter(id__gt=last_id).values_list('id', flat=True)[:options['batch_size']]):
+            repaired += reconcile_boards(batch)
+            checked += len(batch)
+            last_id = batch[-1]
+        elapsed: float = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Checked {checked} boards, repaired counters of {repaired} boards and categories in {elapsed:.1f}s'
+        ))
@@ -0,0 +1,272 @@
+import csv
+import io
+import math
+import multiprocessing
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from core.models import User
+from goals.counters import COUNTER_FIELDS, contribution
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+
+# shares of goal statuses and priorities, seeded goals look like a live installation
+STATUS_WEIGHTS: dict[int, int] = {
+    Goal.Status.to_do: 35, Goal.Status.in_progress: 20, Goal.Status.done: 35, Goal.Status.archived: 10,
+}
+PRIORITY_WEIGHTS: dict[int, int] = {
+    Goal.Priority.low: 25, Goal.Priority.medium: 45, Goal.Priority.high: 22, Goal.Priority.critical: 8,
+}
+NO_DUE_DATE_SHARE: float = 0.25
+MAX_CATEGORIES: int = 30
+MAX_GOALS: int = 500
+MAX_COMMENTS: int = 100
+
+# command options passed to worker processes
+TASK_OPTIONS: tuple = (
+    'seed', 'database', 'batch_size', 'copy', 'max_participants', 'categories', 'goals', 'comments',
+)
+# ids of seeded users, set by parent process before workers are forked
+USER_IDS: list[int] = []
+
+
+# ----------------------------------------------------------------
+# generation helpers
+def later(rng: random.Random, start: datetime, now: datetime) -> datetime:
+    """Random moment between start and now"""
+    return start + (now - start) * rng.random()
+
+
+def skewed(rng: random.Random, mean: float, limit: int, sigma: float = 1.0) -> int:
+    """
+    Log-normal integer with given mean: most values are small, a few are large
+
+    Params:
+        - rng: random generator
+        - mean: expected value
+        - limit: upper bound
+        - sigma: spread of underlying normal distribution
+    """
+    mu: float = math.log(max(mean, 0.01)) - sigma ** 2 / 2
+    return min(limit, int(rng.lognormvariate(mu, sigma)))
+
+
+def copy_rows(model: type[models.Model], fields: tuple, rows: list[tuple], using: str) -> None:
+    """
+    Insert rows with COPY FROM STDIN (PostgreSQL with psycopg2)
+
+    Params:
+        - model: model of table
+        - fields: model field names in order of values in rows
+        - rows: tuples of python values
+        - using: database alias
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow('' if value is None else value for value in row)
+    buffer.seek(0)
+    columns: str = ', '.join(model._meta.get_field(name).column for name in fields)
+    with connections[using].cursor() as cursor:
+        cursor.cursor.copy_expert(f'COPY {model._meta.db_table} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def insert_leaf_rows(model: type[models.Model], fields: tuple, rows: list[tuple], options: dict) -> None:
+    """
+    Insert rows, which ids are not needed later, with COPY if requested or bulk_create otherwise
+    """
+    if options['copy']:
+        copy_rows(model, fields, rows, options['database'])
+        return
+    model.objects.using(options['database']).bulk_create(
+        (model(**dict(zip(fields, row))) for row in rows), batch_size=options['batch_size']
+    )
+
+
+def set_counters(goals: list[Goal], categories: list[GoalCategory], boards: list[Board], options: dict) -> None:
+    """
+    Set goal counters of seeded categories and boards, which are created before their goals
+    """
+    by_category: dict[int, Counter] = defaultdict(Counter)
+    for goal in goals:
+        by_category[goal.category_id].update(contribution(goal.status))
+    by_board: dict[int, Counter] = defaultdict(Counter)
+    for category in categories:
+        by_board[category.board_id].update(by_category[category.id])
+    for model, entities, counters in ((GoalCategory, categories, by_category), (Board, boards, by_board)):
+        for entity in entities:
+            for name in COUNTER_FIELDS:
+                setattr(entity, name, counters[entity.id][name])
+        model.objects.using(options['database']).bulk_update(entities, COUNTER_FIELDS, batch_size=options['batch_size'])
+
+
+def seed_chunk(task: tuple[int, int, dict]) -> dict[str, int]:
+    """
+    Generate boards with their participants, categories, goals and comments.
+    Runs in worker process, result depends on seed and chunk number only
+
+    Params:
+        - task: chunk number, number of boards in chunk and command options
+
+    Returns:
+        - numbers of created rows by model
+    """
+    number, boards_count, options = task
+    rng = random.Random(f'{options["seed"]}-{number}')
+    using: str = options['database']
+    batch_size: int = options['batch_size']
+    now: datetime = timezone.now()
+    year_ago: datetime = now - timedelta(days=365)
+
+    with transaction.atomic(using=using):
+        boards: list[Board] = []
+        for index in range(boards_count):
+            created: datetime = later(rng, year_ago, now)
+            boards.append(Board(title=f'Board {number}-{index}', created=created, updated=later(rng, created, now)))
+        boards = Board.objects.using(using).bulk_create(boards, batch_size=batch_size)
+
+        participants: list[tuple] = []
+        members: dict[int, list[int]] = {}
+        categories: list[GoalCategory] = []
+        for board in boards:
+            # pareto gives many personal boards and a long tail of team boards
+            size: int = min(len(USER_IDS), options['max_participants'], int(rng.paretovariate(1.2)))
+            users: list[int] = rng.sample(USER_IDS, size)
+            members[board.id] = users
+            for index, user_id in enumerate(users):
+                role: int = BoardParticipant.Role.owner if index == 0 else rng.choices(
+                    (BoardParticipant.Role.writer, BoardParticipant.Role.reader), (3, 1)
+                )[0]
+                participants.append((board.created, board.created, board.id, user_id, role))
+            for index in range(1 + skewed(rng, options['categories'] - 1, MAX_CATEGORIES - 1)):
+                created = later(rng, board.created, now)
+                categories.append(GoalCategory(
+                    board_id=board.id, user_id=users[0], title=f'Category {index}',
+                    is_deleted=rng.random() < 0.03, created=created, updated=later(rng, created, now),
+                ))
+        insert_leaf_rows(
+            BoardParticipant, ('created', 'updated', 'board_id', 'user_id', 'role'), participants, options
+        )
+        categories = GoalCategory.objects.using(using).bulk_create(categories, batch_size=batch_size)
+
+        goals: list[Goal] = []
+        for category in categories:
+            users = members[category.board_id]
+            for index in range(skewed(rng, options['goals'], MAX_GOALS, sigma=1.2)):
+                created = later(rng, category.created, now)
+                due_date: datetime | None = None
+                if rng.random() >= NO_DUE_DATE_SHARE:
+                    due_date = created + timedelta(days=rng.gauss(21, 30))
+                goals.append(Goal(
+                    category_id=category.id, board_id=category.board_id, user_id=rng.choice(users),
+                    title=f'Goal {index}',
+                    description='Lorem ipsum dolor sit amet. ' * skewed(rng, 3, 60),
+                    status=rng.choices(tuple(STATUS_WEIGHTS), tuple(STATUS_WEIGHTS.values()))[0],
+                    priority=rng.choices(tuple(PRIORITY_WEIGHTS), tuple(PRIORITY_WEIGHTS.values()))[0],
+                    due_date=due_date, created=created, updated=later(rng, created, now),
+                ))
+        goals = Goal.objects.using(using).bulk_create(goals, batch_size=batch_size)
+        set_counters(goals, categories, boards, options)
+
+        comments: list[tuple] = []
+        for goal in goals:
+            users = members[goal.board_id]
+            for index in range(skewed(rng, options['comments'], MAX_COMMENTS, sigma=1.5)):
+                created = later(rng, goal.created, now)
+                comments.append((created, created, goal.id, goal.board_id, rng.choice(users), f'Comment {index}'))
+        insert_leaf_rows(Comment, ('created', 'updated', 'goal_id', 'board_id', 'user_id', 'text'), comments, options)
+
+    return {
+        'boards': len(boards),
+        'participants': len(participants),
+        'categories': len(categories),
+        'goals': len(goals),
+        'comments': len(comments),
+    }
+
+
+def chunks(total: int, size: int) -> Iterable[tuple[int, int]]:
+    """Split total number of boards into numbered chunks"""
+    for number, start in enumerate(range(0, total, size)):
+        yield number, min(size, total - start)
+
+
+# ----------------------------------------------------------------
+# command class
+class Command(BaseCommand):
+    help = 'Generate high-volume synthetic users, boards, participants, categories, goals and comments'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--boards', type=int, default=1000)
+        parser.add_argument('--categories', type=float, default=4, help='mean categories per board')
+        parser.add_argument('--goals', type=float, default=10, help='mean goals per category')
+        parser.add_argument('--comments', type=float, default=1.5, help='mean comments per goal')
+        parser.add_argument('--max-participants', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=0, help='same seed gives the same data')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--chunk-boards', type=int, default=200, help='boards generated by one task')
+        parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+        parser.add_argument('--copy', action='store_true', help='insert leaf rows with COPY (PostgreSQL)')
+        parser.add_argument('--password', help='password of seeded users (unusable by default)')
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Create users in this process, then boards with their content by chunks in worker processes"""
+        vendor: str = connections[options['database']].vendor
+        if options['copy'] and vendor != 'postgresql':
+            raise CommandError('--copy is supported for PostgreSQL only')
+        if vendor == 'sqlite' and options['workers'] > 1:
+            self.stdout.write('SQLite allows one writer at a time, using one worker')
+            options['workers'] = 1
+        prefix: str = f'seed{options["seed"]}_'
+        if User.objects.using(options['database']).filter(username__startswith=prefix).exists():
+            raise CommandError(f'Users "{prefix}*" already exist, use another --seed')
+
+        started: float = time.monotonic()
+        self._create_users(prefix, options)
+        task_options: dict[str, Any] = {name: options[name] for name in TASK_OPTIONS}
+        tasks: list[tuple] = [
+            (number, size, task_options) for number, size in chunks(options['boards'], options['chunk_boards'])
+        ]
+        totals: dict[str, int] = {'users': len(USER_IDS)}
+        if options['workers'] > 1:
+            # workers inherit USER_IDS, connections must not be shared with them
+            connections.close_all()
+            with multiprocessing.get_context('fork').Pool(options['workers']) as pool:
+                results: Iterable[dict] = pool.imap_unordered(seed_chunk, tasks)
+                self._collect(results, totals, len(tasks))
+        else:
+            self._collect(map(seed_chunk, tasks), totals, len(tasks))
+
+        elapsed: float = time.monotonic() - started
+        summary: str = ', '.join(f'{name}: {count}' for name, count in totals.items())
+        self.stdout.write(self.style.SUCCESS(f'Created {summary} in {elapsed:.1f}s'))
+
+    def _create_users(self, prefix: str, options: dict) -> None:
+        now: datetime = timezone.now()
+        password: str = make_password(options['password'])
+        users: Iterable[User] = (
+            User(username=f'{prefix}{number}', password=password, date_joined=now)
+            for number in range(options['users'])
+        )
+        created: list[User] = User.objects.using(options['database']).bulk_create(
+            users, batch_size=options['batch_size']
+        )
+        USER_IDS[:] = [user.id for user in created]
+
+    def _collect(self, results: Iterable[dict], totals: dict[str, int], tasks: int) -> None:
+        for done, result in enumerate(results, start=1):
+            for name, count in result.items():
+                totals[name] = totals.get(name, 0) + count
+            self.stdout.write(f'chunk {done}/{tasks}: {result}')
@@ -0,0 +1,77 @@
+# Generated by Django 4.1.7 on 2026-10-19 11:40
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+COUNTER_FIELDS = ('goals_total', 'goals_open', 'goals_done', 'goals_overdue')
+
+
+def count_goals(apps, schema_editor):
+    """Counters of existing categories and boards, same as reconcile_counters command"""
+    Goal = apps.get_model('goals', 'Goal')
+    GoalCategory = apps.get_model('goals', 'GoalCategory')
+    Board = apps.get_model('goals', 'Board')
+    is_open = Q(status__in=(1, 2))
+    rows = Goal.objects.exclude(status=4).values('category').annotate(
+        goals_total=Count('id'),
+        goals_open=Count('id', filter=is_open),
+        goals_done=Count('id', filter=Q(status=3)),
+        goals_overdue=Count('id', filter=is_open & Q(due_date__lt=timezone.now())),
+    ).order_by()
+    for row in rows:
+        GoalCategory.objects.filter(id=row.pop('category')).update(**row)
+    rows = GoalCategory.objects.values('board').annotate(**{name: Sum(name) for name in COUNTER_FIELDS}).order_by()
+    for row in rows:
+        Board.objects.filter(id=row.pop('board')).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0002_board_version_goal_summary_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='goals_done',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Выполненных целей'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='goals_open',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Открытых целей'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='goals_overdue',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Просроченных целей'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='goals_total',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Целей'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='goals_done',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Выполненных целей'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='goals_open',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Открытых целей'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='goals_overdue',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Просроченных целей'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='goals_total',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Целей'),
+        ),
+        migrations.RunPython(count_goals, migrations.RunPython.noop),
+    ]
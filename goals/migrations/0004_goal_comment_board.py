@@ -0,0 +1,30 @@
+# Generated by Django 4.1.7 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0003_goal_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='board',
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='comments',
+                to='goals.board', verbose_name='Доска'
+            ),
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='board',
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='goals',
+                to='goals.board', verbose_name='Доска'
+            ),
+        ),
+    ]
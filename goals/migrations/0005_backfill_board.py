@@ -0,0 +1,41 @@
+# Generated by Django 4.1.7 on 2026-10-19 12:05
+
+from django.db import migrations, transaction
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 10000
+
+
+def fill(model, source, source_field, using):
+    """Set board of rows by batches of ids, each batch is committed separately"""
+    last_id = 0
+    while True:
+        ids = list(
+            model.objects.using(using).filter(id__gt=last_id, board__isnull=True)
+            .order_by('id').values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            return
+        board = source.objects.using(using).filter(id=OuterRef(source_field)).values('board_id')[:1]
+        with transaction.atomic(using=using):
+            model.objects.using(using).filter(id__in=ids).update(board_id=Subquery(board))
+        last_id = ids[-1]
+
+
+def fill_boards(apps, schema_editor):
+    using = schema_editor.connection.alias
+    fill(apps.get_model('goals', 'Goal'), apps.get_model('goals', 'GoalCategory'), 'category_id', using)
+    fill(apps.get_model('goals', 'Comment'), apps.get_model('goals', 'Goal'), 'goal_id', using)
+
+
+class Migration(migrations.Migration):
+    # batches are committed one by one, tables are not locked for the whole backfill
+    atomic = False
+
+    dependencies = [
+        ('goals', '0004_goal_comment_board'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_boards, migrations.RunPython.noop),
+    ]
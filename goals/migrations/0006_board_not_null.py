@@ -0,0 +1,40 @@
+# Generated by Django 4.1.7 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0005_backfill_board'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='board',
+            field=models.ForeignKey(
+                editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='comments',
+                to='goals.board', verbose_name='Доска'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='goal',
+            name='board',
+            field=models.ForeignKey(
+                editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='goals',
+                to='goals.board', verbose_name='Доска'
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name='goal',
+            name='goal_summary_idx',
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(
+                fields=['board', 'status', 'category', 'priority', 'due_date', 'user'], name='goal_board_summary_idx'
+            ),
+        ),
+    ]
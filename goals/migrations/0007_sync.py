@@ -0,0 +1,73 @@
+# Generated by Django 4.1.7 on 2026-10-19 12:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0006_board_not_null'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(choices=[('participant', 'Участник'), ('category', 'Категория'), ('goal', 'Цель'), ('comment', 'Комментарий')], max_length=20, verbose_name='Сущность')),
+                ('entity_id', models.BigIntegerField(verbose_name='Id сущности')),
+                ('board_version', models.PositiveBigIntegerField(verbose_name='Версия доски')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Дата удаления')),
+            ],
+            options={
+                'verbose_name': 'Удалённая сущность',
+                'verbose_name_plural': 'Удалённые сущности',
+            },
+        ),
+        migrations.AddField(
+            model_name='boardparticipant',
+            name='board_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Версия доски'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='board_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Версия доски'),
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='board_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Версия доски'),
+        ),
+        migrations.AddField(
+            model_name='goalcategory',
+            name='board_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Версия доски'),
+        ),
+        migrations.AddIndex(
+            model_name='boardparticipant',
+            index=models.Index(fields=['board', 'board_version'], name='participant_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['board', 'board_version'], name='comment_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['board', 'board_version'], name='goal_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goalcategory',
+            index=models.Index(fields=['board', 'board_version'], name='category_sync_idx'),
+        ),
+        migrations.AddField(
+            model_name='tombstone',
+            name='board',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to='goals.board', verbose_name='Доска'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['board', 'board_version'], name='tombstone_sync_idx'),
+        ),
+    ]
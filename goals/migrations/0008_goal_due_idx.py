@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0007_sync'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('status__in', [1, 2])), fields=['due_date'], name='goal_due_idx'),
+        ),
+    ]
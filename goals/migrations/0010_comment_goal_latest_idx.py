@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-19 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0009_archive'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['goal', '-created', '-id'], name='comment_goal_latest_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.1.7 on 2026-10-19 15:10
+
+from django.db import migrations, models, transaction
+
+BATCH_SIZE = 5000
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+WIDTH = 6
+# keys of goals.positions: integer part in base 36 from the middle of key range, stepped by 36 ** 2
+START = len(DIGITS) ** WIDTH // 2
+STEP = len(DIGITS) ** 2
+
+
+def encode(number):
+    digits = []
+    for _ in range(WIDTH):
+        number, digit = divmod(number, len(DIGITS))
+        digits.append(DIGITS[digit])
+    return ''.join(reversed(digits))
+
+
+def fill_positions(apps, schema_editor):
+    """Goals of every column (category and status) are placed in creation order, batches are committed one by one"""
+    Goal = apps.get_model('goals', 'Goal')
+    using = schema_editor.connection.alias
+    goals = Goal.objects.using(using).order_by('category_id', 'status', 'id')
+    column, index, last = None, 0, (0, 0, 0)
+    while True:
+        category_id, status, last_id = last
+        batch = list(
+            goals.filter(
+                models.Q(category_id__gt=category_id)
+                | models.Q(category_id=category_id, status__gt=status)
+                | models.Q(category_id=category_id, status=status, id__gt=last_id)
+            ).only('id', 'category_id', 'status')[:BATCH_SIZE]
+        )
+        if not batch:
+            return
+        for goal in batch:
+            if (goal.category_id, goal.status) != column:
+                column, index = (goal.category_id, goal.status), 0
+            goal.position = encode(START + STEP * index)
+            index += 1
+        with transaction.atomic(using=using):
+            Goal.objects.using(using).bulk_update(batch, ['position'])
+        last = (batch[-1].category_id, batch[-1].status, batch[-1].id)
+
+
+class Migration(migrations.Migration):
+    # batches are committed one by one, the table is not locked for the whole backfill
+    atomic = False
+
+    dependencies = [
+        ('goals', '0010_comment_goal_latest_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goal',
+            name='position',
+            field=models.CharField(default='', editable=False, max_length=64, verbose_name='Позиция'),
+        ),
+        migrations.RunPython(fill_positions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['category', 'status', 'position'], name='goal_position_idx'),
+        ),
+    ]
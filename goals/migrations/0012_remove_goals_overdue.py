@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-19 16:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0011_goal_position'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='board',
+            name='goals_overdue',
+        ),
+        migrations.RemoveField(
+            model_name='goalcategory',
+            name='goals_overdue',
+        ),
+    ]
@@ -0,0 +1,128 @@
+from django.db import models
+
+from goals.models.board import Board, BoardContentQuerySet
+from goals.models.category import GoalCategory
+from goals.models.goal import Goal
+
+
+# ----------------------------------------------------------------
+# archived goal model
+class ArchivedGoal(models.Model):
+    """
+    Model representing a goal moved out of hot goals table by goals.archive, keeps id of the goal
+
+    Attrs:
+        - user, category, board, title, description, status, priority, due_date, created, updated: Fields of goal
+        - archived: Date of moving to archive
+    """
+    id = models.BigIntegerField(
+        primary_key=True
+    )
+    user = models.ForeignKey(
+        'core.User',
+        verbose_name='Автор',
+        on_delete=models.PROTECT,
+        related_name='+'
+    )
+    category = models.ForeignKey(
+        GoalCategory,
+        verbose_name='Категория',
+        on_delete=models.PROTECT,
+        related_name='archived_goals'
+    )
+    board = models.ForeignKey(
+        Board,
+        verbose_name='Доска',
+        on_delete=models.PROTECT,
+        related_name='archived_goals'
+    )
+    title = models.CharField(
+        verbose_name='Название',
+        max_length=500
+    )
+    description = models.TextField(
+        verbose_name='Описание',
+        max_length=2000,
+        blank=True
+    )
+    status = models.PositiveSmallIntegerField(
+        verbose_name='Статус',
+        choices=Goal.Status.choices
+    )
+    priority = models.PositiveSmallIntegerField(
+        verbose_name='Приоритет',
+        choices=Goal.Priority.choices
+    )
+    due_date = models.DateTimeField(
+        verbose_name='Дедлайн',
+        null=True,
+        blank=True
+    )
+    created = models.DateTimeField(
+        verbose_name='Дата создания'
+    )
+    updated = models.DateTimeField(
+        verbose_name='Дата последнего обновления'
+    )
+    archived = models.DateTimeField(
+        verbose_name='Дата переноса в архив',
+        auto_now_add=True
+    )
+
+    objects = BoardContentQuerySet.as_manager()
+
+    def __str__(self):
+        return self.title
+
+    class Meta:
+        verbose_name = 'Архивная цель'
+        verbose_name_plural = 'Архивные цели'
+        indexes = [
+            models.Index(fields=['board', 'archived'], name='archived_goal_board_idx'),
+        ]
+
+
+# ----------------------------------------------------------------
+# archived comment model
+class ArchivedComment(models.Model):
+    """
+    Model representing a comment of archived goal, keeps id of the comment
+
+    Attrs:
+        - goal: Related archived goal
+        - board, user, text, created, updated: Fields of comment
+    """
+    id = models.BigIntegerField(
+        primary_key=True
+    )
+    goal = models.ForeignKey(
+        ArchivedGoal,
+        verbose_name='Цель',
+        on_delete=models.CASCADE,
+        related_name='comments'
+    )
+    board = models.ForeignKey(
+        Board,
+        verbose_name='Доска',
+        on_delete=models.PROTECT,
+        related_name='+'
+    )
+    user = models.ForeignKey(
+        'core.User',
+        verbose_name='Автор',
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    text = models.TextField(
+        verbose_name='Текст'
+    )
+    created = models.DateTimeField(
+        verbose_name='Дата создания'
+    )
+    updated = models.DateTimeField(
+        verbose_name='Дата последнего обновления'
+    )
+
+    class Meta:
+        verbose_name = 'Архивный комментарий'
+        verbose_name_plural = 'Архивные комментарии'
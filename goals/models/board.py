@@ -1,17 +1,93 @@
+from typing import Any, Iterable
+
 from django.db import models
+from django.db.models import QuerySet
 
 from goals.models.dates_model_mixin import DatesModelMixin
+from goals.models.goal_counters_mixin import GoalCountersMixin
+
+
+# ----------------------------------------------------------------
+# visibility querysets
+class BoardContentQuerySet(models.QuerySet):
+    """
+    Queryset of entities which belong to a board (categories, goals, comments).
+    Participation is checked with a semi-join (board IN boards of user) instead of joining participants,
+    so rows are not duplicated and LIMIT is applied to the filtered table directly. The subquery is not
+    correlated: SQLite runs it once and searches the board index, while a correlated EXISTS makes it scan
+    the whole table; PostgreSQL plans both forms as the same semi-join
+
+    Attrs:
+        - board_field: field referencing board in the model
+    """
+    board_field: str = 'board'
+
+    def participated_by(self, user: Any, min_role: int | None = None) -> QuerySet:
+        """
+        Method to filter entities of boards where user is a participant
+
+        Params:
+            - user: User
+            - min_role: the least privileged role required (BoardParticipant.Role), any role if None
+
+        Returns:
+            - QuerySet
+        """
+        boards: QuerySet = BoardParticipant.objects.with_role(user, min_role).values('board')
+        return self.filter(**{f'{self.board_field}__in': boards})
+
+    def visible_to(self, user: Any, min_role: int | None = None) -> QuerySet:
+        """
+        Method to filter entities shown to user: user participates in the board and board is not deleted
+
+        Params:
+            - user: User
+            - min_role: the least privileged role required (BoardParticipant.Role), any role if None
+
+        Returns:
+            - QuerySet
+        """
+        return self.participated_by(user, min_role).filter(board__is_deleted=False)
+
+
+class BoardQuerySet(BoardContentQuerySet):
+    """Queryset of boards"""
+    board_field: str = 'pk'
+
+    def visible_to(self, user: Any, min_role: int | None = None) -> QuerySet:
+        return self.participated_by(user, min_role).filter(is_deleted=False)
+
+
+class BoardParticipantQuerySet(models.QuerySet):
+    """Queryset of board participants"""
+    def with_role(self, user: Any, min_role: int | None = None) -> QuerySet:
+        """
+        Method to filter participations of user with at least given role
+
+        Params:
+            - user: User
+            - min_role: the least privileged role required (BoardParticipant.Role), any role if None
+
+        Returns:
+            - QuerySet
+        """
+        participants: QuerySet = self.filter(user=user)
+        if min_role is not None:
+            # roles are ordered from owner (1) to reader (3)
+            participants = participants.filter(role__lte=min_role)
+        return participants
 
 
 # ----------------------------------------------------------------
 # board model
-class Board(DatesModelMixin):
+class Board(DatesModelMixin, GoalCountersMixin):
     """
     Model representing a board
 
     Attrs:
         - title: Title of Board
         - is_deleted: This field defines status of board (deleted or not)
+        - version: Number of changes of board content, changed by goals.versioning in database only
     """
     title = models.CharField(
         verbose_name='Название',
@@ -21,6 +97,13 @@ class Board(DatesModelMixin):
         verbose_name='Удалена',
         default=False
     )
+    version = models.PositiveBigIntegerField(
+        verbose_name='Версия',
+        default=0,
+        editable=False
+    )
+
+    objects = BoardQuerySet.as_manager()
 
     def __str__(self):
         return self.title
@@ -40,6 +123,7 @@ class BoardParticipant(DatesModelMixin):
         - board: Related board
         - user: Related user
         - role: Role of board participants. Defines by class Role
+        - board_version: Version of board at last change of participant, set by goals.versioning
     """
     class Role(models.IntegerChoices):
         owner = 1, "Владелец"
@@ -63,6 +147,13 @@ class BoardParticipant(DatesModelMixin):
         choices=Role.choices,
         default=Role.owner
     )
+    board_version = models.PositiveBigIntegerField(
+        verbose_name='Версия доски',
+        default=0,
+        editable=False
+    )
+
+    objects = BoardParticipantQuerySet.as_manager()
 
     def __str__(self):
         return self.user.username
@@ -71,3 +162,19 @@ class BoardParticipant(DatesModelMixin):
         unique_together = ("board", "user")
         verbose_name = "Участник"
         verbose_name_plural = "Участники"
+        indexes = [
+            # changes since a board version are read by sync
+            models.Index(fields=['board', 'board_version'], name='participant_sync_idx'),
+        ]
+
+
+def lock_boards(ids: Iterable[int] | QuerySet) -> None:
+    """
+    Function to lock rows of boards till the end of transaction. Every write of board content locks its board
+    first (then categories and goals, see goals.models.category.lock_categories), so concurrent writes of a board
+    wait for each other instead of deadlock
+
+    Params:
+        - ids: ids of boards or queryset of ids
+    """
+    list(Board.objects.select_for_update().filter(id__in=ids).order_by('id').values_list('id', flat=True))
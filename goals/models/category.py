@@ -1,12 +1,24 @@
+from typing import Any, Iterable
+
 from django.db import models
+from django.db.models import QuerySet
 
-from goals.models.board import Board
+from goals.models.board import Board, BoardContentQuerySet, lock_boards
 from goals.models.dates_model_mixin import DatesModelMixin
+from goals.models.goal_counters_mixin import GoalCountersMixin
+
+
+# ----------------------------------------------------------------
+# category queryset
+class GoalCategoryQuerySet(BoardContentQuerySet):
+    def visible_to(self, user: Any, min_role: int | None = None) -> QuerySet:
+        """Categories of visible boards which are not deleted"""
+        return super().visible_to(user, min_role).filter(is_deleted=False)
 
 
 # ----------------------------------------------------------------
 # category model
-class GoalCategory(DatesModelMixin):
+class GoalCategory(DatesModelMixin, GoalCountersMixin):
     """
     Model representing a category
 
@@ -15,6 +27,7 @@ class GoalCategory(DatesModelMixin):
         - title: Title of category
         - user: Related user
         - is_deleted: This field defines status of category (deleted or not)
+        - board_version: Version of board at last change of category, set by goals.versioning
     """
     board = models.ForeignKey(
         Board,
@@ -35,6 +48,13 @@ class GoalCategory(DatesModelMixin):
         verbose_name="Удалена",
         default=False
     )
+    board_version = models.PositiveBigIntegerField(
+        verbose_name='Версия доски',
+        default=0,
+        editable=False
+    )
+
+    objects = GoalCategoryQuerySet.as_manager()
 
     def __str__(self):
         return self.title
@@ -42,3 +62,21 @@ class GoalCategory(DatesModelMixin):
     class Meta:
         verbose_name = "Категория"
         verbose_name_plural = "Категории"
+        indexes = [
+            # changes since a board version are read by sync
+            models.Index(fields=['board', 'board_version'], name='category_sync_idx'),
+        ]
+
+
+def lock_categories(ids: Iterable[int]) -> None:
+    """
+    Function to lock rows of categories and of their boards till the end of transaction. Writes of board
+    content lock rows in one order: boards, categories, then goals, each by id, so concurrent writes
+    (e.g. goal update and deletion of its category) wait for each other instead of deadlock
+
+    Params:
+        - ids: ids of categories
+    """
+    ids = set(ids)
+    lock_boards(GoalCategory.objects.filter(id__in=ids).values('board_id'))
+    list(GoalCategory.objects.select_for_update().filter(id__in=ids).order_by('id').values_list('id', flat=True))
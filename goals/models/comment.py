@@ -1,10 +1,70 @@
-from django.db import models
-from django.db.models import CASCADE
+from typing import Any
 
+from django.db import models, transaction
+from django.db.models import CASCADE, Count, F, OuterRef, QuerySet, Subquery, Window
+from django.db.models.functions import Coalesce, Left, RowNumber
+from django.db.models.query import RawQuerySet
+
+from goals.models.board import Board, BoardContentQuerySet, lock_boards
 from goals.models.dates_model_mixin import DatesModelMixin
 from goals.models.goal import Goal
 
 
+# ----------------------------------------------------------------
+# comment queryset
+class CommentQuerySet(BoardContentQuerySet):
+    def visible_to(self, user: Any, min_role: int | None = None) -> QuerySet:
+        """Comments of visible goals"""
+        return super().visible_to(user, min_role).filter(goal__category__is_deleted=False).exclude(
+            goal__status=Goal.Status.archived
+        )
+
+    def latest_per_goal(self, limit: int) -> RawQuerySet:
+        """
+        Method to get the latest comments of each goal with one query: comments are numbered within their goal
+        by ROW_NUMBER window and the first ones are taken from the numbered subquery
+
+        Params:
+            - limit: number of comments per goal
+
+        Returns:
+            - RawQuerySet of comments ordered by goal and from the latest one
+        """
+        ranked: QuerySet = self.annotate(comment_rank=Window(
+            RowNumber(), partition_by=[F('goal_id')], order_by=[F('created').desc(), F('id').desc()]
+        )).order_by()
+        sql, params = ranked.query.sql_with_params()
+        return self.model.objects.raw(
+            f'SELECT * FROM ({sql}) ranked WHERE comment_rank <= %s ORDER BY goal_id, comment_rank',
+            (*params, limit), using=self.db
+        )
+
+
+def comment_summary(goal: Any = OuterRef('pk'), snippet: int = 200) -> dict[str, Any]:
+    """
+    Annotations of goals with number of comments and the latest comment, each is a subquery
+    searching comment_goal_latest_idx index
+
+    Params:
+        - goal: goal id expression, the annotated goal by default
+        - snippet: length of text of the latest comment
+
+    Returns:
+        - annotations: comment_count, last_comment_id, last_comment_text, last_comment_created, last_comment_user
+    """
+    comments: QuerySet = Comment.objects.filter(goal=goal)
+    latest: QuerySet = comments.order_by('-created', '-id')
+    return {
+        'comment_count': Coalesce(Subquery(
+            comments.order_by().values('goal').annotate(count=Count('id')).values('count')
+        ), 0),
+        'last_comment_id': Subquery(latest.values('id')[:1]),
+        'last_comment_text': Subquery(latest.values(snippet=Left('text', snippet))[:1]),
+        'last_comment_created': Subquery(latest.values('created')[:1]),
+        'last_comment_user': Subquery(latest.values('user__username')[:1]),
+    }
+
+
 # ----------------------------------------------------------------
 # comment model
 class Comment(DatesModelMixin):
@@ -13,14 +73,23 @@ class Comment(DatesModelMixin):
 
     Attrs:
         - goal: Related goal
+        - board: Board of goal, kept by save and by goal moving to another board
         - user: Related user
         - text: Comment content
+        - board_version: Version of board at last change of comment, set by goals.versioning
     """
     goal = models.ForeignKey(
         Goal,
         verbose_name='Цель',
         on_delete=CASCADE
     )
+    board = models.ForeignKey(
+        Board,
+        verbose_name='Доска',
+        on_delete=models.PROTECT,
+        related_name='comments',
+        editable=False
+    )
     user = models.ForeignKey(
         'core.User',
         verbose_name='Автор',
@@ -30,7 +99,33 @@ class Comment(DatesModelMixin):
         verbose_name='Текст',
         max_length=1000
     )
+    board_version = models.PositiveBigIntegerField(
+        verbose_name='Версия доски',
+        default=0,
+        editable=False
+    )
+
+    objects = CommentQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        if self.board_id is None:
+            self.board_id = self.goal.board_id
+        # board row before the comment row, as other writes of board content lock them (see lock_boards)
+        with transaction.atomic(using=kwargs.get('using')):
+            lock_boards([self.board_id])
+            return super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            lock_boards([self.board_id])
+            return super().delete(*args, **kwargs)
 
     class Meta:
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            # changes since a board version are read by sync
+            models.Index(fields=['board', 'board_version'], name='comment_sync_idx'),
+            # the latest comments of goals are read by goal lists and latest comments endpoint
+            models.Index(fields=['goal', '-created', '-id'], name='comment_goal_latest_idx'),
+        ]
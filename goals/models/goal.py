@@ -1,9 +1,23 @@
-from django.db import models
+from typing import Any
 
-from goals.models.category import GoalCategory
+from django.db import models, transaction
+from django.db.models import Q, QuerySet, Subquery
+
+from goals.models.board import Board, BoardContentQuerySet
+from goals.models.category import GoalCategory, lock_categories
 from goals.models.dates_model_mixin import DatesModelMixin
 
 
+# ----------------------------------------------------------------
+# goal queryset
+class GoalQuerySet(BoardContentQuerySet):
+    def visible_to(self, user: Any, min_role: int | None = None) -> QuerySet:
+        """Goals of visible boards which are not archived and which categories are not deleted"""
+        return super().visible_to(user, min_role).filter(category__is_deleted=False).exclude(
+            status=Goal.Status.archived
+        )
+
+
 # ----------------------------------------------------------------
 # goal model
 class Goal(DatesModelMixin):
@@ -13,11 +27,14 @@ class Goal(DatesModelMixin):
     Attrs:
         - user: Related user
         - category: Related category
+        - board: Board of category, kept by save to filter goals without joining categories
         - title: Title of goal
         - description: Description of goal
         - status: Status of goal. Defines by class Status
         - priority: Priority of goal. Defines by class Priority
         - due_date: Due date of goal
+        - position: Key of goal in its kanban column (category and status), set by goals.positions
+        - board_version: Version of board at last change of goal, set by goals.versioning
     """
     class Status(models.IntegerChoices):
         to_do = 1, "К выполнению"
@@ -41,6 +58,13 @@ class Goal(DatesModelMixin):
         verbose_name='Категория',
         on_delete=models.PROTECT
     )
+    board = models.ForeignKey(
+        Board,
+        verbose_name='Доска',
+        on_delete=models.PROTECT,
+        related_name='goals',
+        editable=False
+    )
     title = models.CharField(
         verbose_name='Название',
         max_length=500
@@ -65,10 +89,112 @@ class Goal(DatesModelMixin):
         null=True,
         blank=True
     )
+    position = models.CharField(
+        verbose_name='Позиция',
+        max_length=64,
+        default='',
+        editable=False
+    )
+    board_version = models.PositiveBigIntegerField(
+        verbose_name='Версия доски',
+        default=0,
+        editable=False
+    )
+
+    objects = GoalQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_loaded()
+        return instance
+
+    def remember_loaded(self) -> None:
+        """
+        Category, board, status and position as stored in database: moved goal changes both boards and
+        their counters, goal of another column without a new position goes to the bottom of the column
+        """
+        self.loaded_category_id = self.__dict__.get('category_id')
+        self.loaded_board_id = self.__dict__.get('board_id')
+        self.loaded_status = self.__dict__.get('status')
+        self.loaded_position = self.__dict__.get('position')
+
+    def lock_loaded(self) -> None:
+        """
+        Method to lock row of goal till the end of transaction and take its stored state as loaded one:
+        state read before the lock may be changed by a concurrent write, counters of categories and boards
+        are changed by difference from the locked state
+        """
+        stored: tuple | None = type(self).objects.select_for_update().filter(pk=self.pk).values_list(
+            'category_id', 'board_id', 'status', 'position'
+        ).first()
+        if stored is not None:
+            self.loaded_category_id, self.loaded_board_id, self.loaded_status, self.loaded_position = stored
+
+    def lock_rows(self, *categories: int) -> None:
+        """
+        Method to lock rows changed by write of goal in the order of all writes of board content (see
+        lock_categories): stored and new category of goal with their boards, then the goal row (lock_loaded).
+        Goal changes category under locks of both categories, so stored category is read until it is locked
+
+        Params:
+            - categories: ids of other categories changed with the goal (e.g. target of move)
+        """
+        locked: set[int] = set()
+        while True:
+            stored: int | None = None
+            if not self._state.adding and self.pk is not None:
+                stored = type(self).objects.filter(pk=self.pk).values_list('category_id', flat=True).first()
+            wanted: set[int] = {self.category_id, stored, *categories} - {None}
+            if wanted <= locked:
+                break
+            lock_categories(wanted - locked)
+            locked |= wanted
+        if not self._state.adding and self.pk is not None:
+            self.lock_loaded()
+
+    def save(self, *args, **kwargs):
+        # goal row and counters of its categories and boards (post_save receivers) are changed together
+        with transaction.atomic(using=kwargs.get('using')):
+            self.lock_rows()
+            return self._save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            self.lock_rows()
+            return super().delete(*args, **kwargs)
+
+    def _save(self, *args, **kwargs):
+        if self.board_id is None or self.category_id != getattr(self, 'loaded_category_id', self.category_id):
+            self.board_id = self.category.board_id
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'board'}
+        moved: bool = not self._state.adding and self.board_id != getattr(self, 'loaded_board_id', self.board_id)
+        result = super().save(*args, **kwargs)
+        if moved:
+            # comments follow goal to another board, with version of the goal change in it
+            self.comment_set.update(
+                board_id=self.board_id,
+                board_version=Subquery(Board.objects.filter(id=self.board_id).values('version')[:1])
+            )
+        self.remember_loaded()
+        return result
+
     class Meta:
         verbose_name = 'Цель'
         verbose_name_plural = 'Цели'
+        indexes = [
+            # board summary is read from this index only
+            models.Index(
+                fields=['board', 'status', 'category', 'priority', 'due_date', 'user'], name='goal_board_summary_idx'
+            ),
+            # changes since a board version are read by sync
+            models.Index(fields=['board', 'board_version'], name='goal_sync_idx'),
+            # reminders read due dates of active (to_do, in_progress) goals by range, see bot.tg.reminders
+            models.Index(fields=['due_date'], name='goal_due_idx', condition=Q(status__in=[1, 2])),
+            # kanban columns are read and moved into in position order
+            models.Index(fields=['category', 'status', 'position'], name='goal_position_idx'),
+        ]
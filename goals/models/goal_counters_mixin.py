@@ -0,0 +1,41 @@
+from django.db import models
+
+
+# ----------------------------------------------------------------
+# goal counters mixin
+class GoalCountersMixin(models.Model):
+    """
+    Parent model defines counters of goals, maintained by goals.counters.
+    Counters and other non-editable fields are changed in database only (F expressions),
+    so saving existing entity does not write values loaded with it
+
+    Attrs:
+        - goals_total: Number of goals which are not archived
+        - goals_open: Number of goals to do or in progress
+        - goals_done: Number of done goals
+    """
+    goals_total = models.PositiveIntegerField(
+        verbose_name="Целей",
+        default=0,
+        editable=False
+    )
+    goals_open = models.PositiveIntegerField(
+        verbose_name="Открытых целей",
+        default=0,
+        editable=False
+    )
+    goals_done = models.PositiveIntegerField(
+        verbose_name="Выполненных целей",
+        default=0,
+        editable=False
+    )
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields if field.editable and not field.primary_key
+            ]
+        return super().save(*args, **kwargs)
+
+    class Meta:
+        abstract = True
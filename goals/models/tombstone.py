@@ -0,0 +1,55 @@
+from django.db import models
+
+from goals.models.board import Board
+
+
+# ----------------------------------------------------------------
+# tombstone model
+class Tombstone(models.Model):
+    """
+    Model representing an entity removed from a board, read by sync clients to drop their copies
+
+    Attrs:
+        - board: Board the entity was removed from
+        - entity: Kind of entity. Defines by class Entity
+        - entity_id: Id of removed entity
+        - board_version: Version of board at removal
+        - created: Date of removal
+    """
+    class Entity(models.TextChoices):
+        participant = 'participant', 'Участник'
+        category = 'category', 'Категория'
+        goal = 'goal', 'Цель'
+        comment = 'comment', 'Комментарий'
+
+    board = models.ForeignKey(
+        Board,
+        verbose_name='Доска',
+        on_delete=models.CASCADE,
+        related_name='tombstones'
+    )
+    entity = models.CharField(
+        verbose_name='Сущность',
+        max_length=20,
+        choices=Entity.choices
+    )
+    entity_id = models.BigIntegerField(
+        verbose_name='Id сущности'
+    )
+    board_version = models.PositiveBigIntegerField(
+        verbose_name='Версия доски'
+    )
+    created = models.DateTimeField(
+        verbose_name='Дата удаления',
+        auto_now_add=True
+    )
+
+    def __str__(self):
+        return f'{self.entity} {self.entity_id}'
+
+    class Meta:
+        verbose_name = 'Удалённая сущность'
+        verbose_name_plural = 'Удалённые сущности'
+        indexes = [
+            models.Index(fields=['board', 'board_version'], name='tombstone_sync_idx'),
+        ]
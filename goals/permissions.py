@@ -5,9 +5,30 @@ from rest_framework.request import Request
 from rest_framework.views import APIView
 
 from goals.models.board import BoardParticipant
-from goals.models.category import GoalCategory
-from goals.models.comment import Comment
-from goals.models.goal import Goal
+
+
+# ----------------------------------------------------------------
+# role checks
+def has_role(request: Request, board_id: int, min_role: int | None = None) -> bool:
+    """
+    Function to check that user of request participates in board with at least given role
+
+    Params:
+        - request: HttpRequest
+        - board_id: id of board
+        - min_role: the least privileged role required (BoardParticipant.Role), any role if None
+
+    Returns:
+        - bool
+    """
+    return BoardParticipant.objects.with_role(request.user, min_role).filter(board=board_id).exists()
+
+
+def has_method_role(request: Request, board_id: int, write_role: int = BoardParticipant.Role.writer) -> bool:
+    """Any participant may read, changes require write_role or a more privileged one"""
+    if request.method in permissions.SAFE_METHODS:
+        return has_role(request, board_id)
+    return has_role(request, board_id, write_role)
 
 
 # ----------------------------------------------------------------
@@ -27,13 +48,25 @@ class BoardPermissions(permissions.BasePermission):
         """
         if not request.user.is_authenticated:
             return False
-        if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(
-                user=request.user, board=obj
-            ).exists()
-        return BoardParticipant.objects.filter(
-            user=request.user, board=obj, role=BoardParticipant.Role.owner
-        ).exists()
+        return has_method_role(request, obj.id, BoardParticipant.Role.owner)
+
+
+class BoardImportPermissions(permissions.BasePermission):
+    message: str = 'You are allowed only to read, not to create'
+
+    def has_object_permission(self, request: Request, view: APIView, obj: Any) -> bool:
+        """
+        Method to check permission to import goals into board (same roles as goal creation)
+
+        Attrs:
+            - request: HttpRequest
+            - view: APIView
+            - obj: Board object
+
+        Returns:
+            - bool: True if user is owner or writer of board
+        """
+        return has_role(request, obj.id, BoardParticipant.Role.writer)
 
 
 # ----------------------------------------------------------------
@@ -51,20 +84,7 @@ class CategoryPermissions(permissions.BasePermission):
         Returns:
             - bool: Result of queryset (queryset depends on request method)
         """
-        if request.method in permissions.SAFE_METHODS:
-            return GoalCategory.objects.select_related('board').filter(
-                board__participants__user=request.user,
-                board=obj.board
-            ).exists()
-        else:
-            return GoalCategory.objects.select_related('board').filter(
-                board__participants__user=request.user,
-                board=obj.board,
-                board__participants__role__in=[
-                    BoardParticipant.Role.owner,
-                    BoardParticipant.Role.writer
-                ]
-            ).exists()
+        return has_method_role(request, obj.board_id)
 
 
 # ----------------------------------------------------------------
@@ -82,20 +102,7 @@ class GoalPermissions(permissions.BasePermission):
         Returns:
             - bool: Result of queryset (queryset depends on request method)
         """
-        if request.method in permissions.SAFE_METHODS:
-            return Goal.objects.select_related('category').filter(
-                category__board__participants__user=request.user,
-                category__board=obj.category.board
-            ).exists()
-        else:
-            return Goal.objects.select_related('category').filter(
-                category__board__participants__user=request.user,
-                category__board=obj.category.board,
-                category__board__participants__role__in=[
-                    BoardParticipant.Role.owner,
-                    BoardParticipant.Role.writer
-                ]
-            ).exists()
+        return has_method_role(request, obj.board_id)
 
 
 # ----------------------------------------------------------------
@@ -113,17 +120,4 @@ class CommentPermissions(permissions.BasePermission):
         Returns:
             - bool: Result of queryset (queryset depends on request method)
         """
-        if request.method in permissions.SAFE_METHODS:
-            return Comment.objects.select_related('goal').filter(
-                goal__category__board__participants__user=request.user,
-                goal__category__board=obj.goal.category.board
-            ).exists()
-        else:
-            return Comment.objects.select_related('goal').filter(
-                goal__category__board__participants__user=request.user,
-                goal__category__board=obj.goal.category.board,
-                goal__category__board__participants__role__in=[
-                    BoardParticipant.Role.owner,
-                    BoardParticipant.Role.writer
-                ]
-            ).exists()
+        return has_method_role(request, obj.board_id)
@@ -0,0 +1,270 @@
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models import Count, Q, QuerySet
+from django.db.models.functions import Length
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+from rest_framework.exceptions import ValidationError
+
+from goals.models.category import GoalCategory, lock_categories
+from goals.models.goal import Goal
+from goals.versioning import touch
+
+# Position key is a fixed width integer part in base 36 followed by an optional fraction. Keys are
+# compared as strings (digits and lowercase letters sort the same in every collation), so a key between
+# any two keys exists and a goal is moved by changing its own key only
+DIGITS: str = '0123456789abcdefghijklmnopqrstuvwxyz'
+BASE: int = len(DIGITS)
+WIDTH: int = 6
+LIMIT: int = BASE ** WIDTH
+# gap between integer parts of appended goals, a few moves into the gap keep keys of WIDTH length
+STEP: int = BASE ** 2
+
+
+# ----------------------------------------------------------------
+# keys
+def encode(number: int) -> str:
+    """Integer part of key"""
+    digits: list[str] = []
+    for _ in range(WIDTH):
+        number, digit = divmod(number, BASE)
+        digits.append(DIGITS[digit])
+    return ''.join(reversed(digits))
+
+
+def split(key: str) -> tuple[int, str]:
+    """Integer part and fraction of key"""
+    return int(key[:WIDTH], BASE), key[WIDTH:]
+
+
+def midpoint(lower: str, upper: str | None) -> str:
+    """
+    Fraction between two fractions, fractions never end with '0', so there is always one below
+
+    Params:
+        - lower: lower fraction, '' for the lowest
+        - upper: upper fraction, None for unbounded
+
+    Returns:
+        - fraction
+    """
+    if upper is not None:
+        common: int = 0
+        while common < len(upper) and (lower[common] if common < len(lower) else '0') == upper[common]:
+            common += 1
+        if common:
+            return upper[:common] + midpoint(lower[common:], upper[common:])
+    low: int = DIGITS.index(lower[0]) if lower else 0
+    high: int = DIGITS.index(upper[0]) if upper is not None else BASE
+    if high - low > 1:
+        return DIGITS[(low + high) // 2]
+    if upper is not None and len(upper) > 1:
+        return upper[0]
+    return DIGITS[low] + midpoint(lower[1:], None)
+
+
+def key_between(lower: str | None, upper: str | None) -> str:
+    """
+    Function to make position key between two keys. Appended and prepended keys step the integer part,
+    keys between close neighbours get a fraction
+
+    Params:
+        - lower: key of the goal above, None for the top of column
+        - upper: key of the goal below, None for the bottom of column
+
+    Returns:
+        - key
+
+    Raises:
+        - ValueError (if lower key is not less than upper one)
+    """
+    if lower is not None and upper is not None and lower >= upper:
+        raise ValueError(f'Position key {lower!r} is not less than {upper!r}')
+    if lower is None and upper is None:
+        return encode(LIMIT // 2)
+    if upper is None:
+        number, fraction = split(lower)  # type: ignore
+        if number + 1 < LIMIT:
+            return encode(min(number + STEP, (number + LIMIT) // 2))
+        return encode(number) + midpoint(fraction, None)
+    if lower is None:
+        number, fraction = split(upper)
+        if number > 1:
+            return encode(max(number - STEP, number // 2))
+        return encode(0) + midpoint('', fraction if number == 0 else None)
+    low, low_fraction = split(lower)
+    high, high_fraction = split(upper)
+    if low == high:
+        return encode(low) + midpoint(low_fraction, high_fraction)
+    if high - low > 1:
+        return encode((low + high) // 2)
+    return encode(low) + midpoint(low_fraction, None)
+
+
+def spread(count: int) -> list[str]:
+    """Keys of count goals evenly spaced around the middle of key range"""
+    step: int = min(STEP, (LIMIT - 1) // (count + 1))
+    start: int = (LIMIT - step * (count - 1)) // 2
+    return [encode(start + step * index) for index in range(count)]
+
+
+# ----------------------------------------------------------------
+# columns
+def column(category_id: int, status: int) -> QuerySet[Goal]:
+    """Goals of a kanban column in display order"""
+    return Goal.objects.filter(category=category_id, status=status).order_by('position', 'id')
+
+
+def last_key(category_id: int, status: int) -> str | None:
+    return column(category_id, status).exclude(position='').values_list('position', flat=True).last()
+
+
+def append_positions(goals: Iterable[Goal]) -> None:
+    """
+    Function to give new goals keys at the bottom of their columns, used by writes which bypass
+    model signals (bulk_create)
+
+    Params:
+        - goals: new goals in display order, their categories are saved
+    """
+    last: dict[tuple[int, int], str | None] = {}
+    for goal in goals:
+        key: tuple[int, int] = (goal.category_id or goal.category.pk, goal.status)
+        if key not in last:
+            last[key] = last_key(*key)
+        goal.position = last[key] = key_between(last[key], None)
+
+
+def rebalance(category_id: int, status: int, batch_size: int = 500) -> int:
+    """
+    Function to give goals of a column evenly spaced short keys, keeping their order. Changed goals
+    get new board version, so sync clients read new keys
+
+    Params:
+        - category_id: id of category
+        - status: status of goals
+        - batch_size: goals updated by one statement
+
+    Returns:
+        - number of goals which keys were changed
+    """
+    with transaction.atomic():
+        lock_categories([category_id])
+        goals: list[Goal] = list(column(category_id, status).only('id', 'position'))
+        changed: list[Goal] = []
+        for goal, key in zip(goals, spread(len(goals))):
+            if goal.position != key:
+                goal.position = key
+                changed.append(goal)
+        Goal.objects.bulk_update(changed, ['position'], batch_size=batch_size)
+        for start in range(0, len(changed), batch_size):
+            touch(Goal.objects.filter(id__in=[goal.id for goal in changed[start:start + batch_size]]), resync=True)
+    return len(changed)
+
+
+def unbalanced(max_length: int) -> set[tuple[int, int]]:
+    """
+    Columns with long keys, goals without keys (bulk loaded) or goals with equal keys
+    (concurrently created at the bottom of a column)
+
+    Params:
+        - max_length: length of key which makes column rebalanced
+
+    Returns:
+        - category id and status of columns
+    """
+    goals: QuerySet[Goal] = Goal.objects.exclude(status=Goal.Status.archived)
+    long: QuerySet = goals.alias(key_length=Length('position')).filter(
+        Q(key_length__gt=max_length) | Q(position='')
+    ).values_list('category', 'status').distinct()
+    equal: QuerySet = goals.values('category', 'status', 'position').alias(same=Count('id')).filter(
+        same__gt=1
+    ).values_list('category', 'status')
+    return {*long, *equal}
+
+
+# ----------------------------------------------------------------
+# moving
+def gap(goals: QuerySet[Goal], after: int | None, before: int | None) -> tuple[str | None, str | None] | None:
+    """
+    Keys of neighbours of a place in column
+
+    Params:
+        - goals: goals of column except the moved one
+        - after: id of goal to place the moved one after
+        - before: id of goal to place the moved one before, used if after is None
+
+    Returns:
+        - keys above and below the place (None for the ends of column) or None if there is no key
+          between them (equal or missing keys) and column has to be rebalanced
+
+    Raises:
+        - ValidationError (if neighbour is not in column)
+    """
+    anchor: int | None = after if after is not None else before
+    tied: Q | None = None
+    if anchor is None:
+        lower, upper = goals.values_list('position', flat=True).last(), None
+    else:
+        key: str | None = goals.filter(id=anchor).values_list('position', flat=True).first()
+        if key is None:
+            raise ValidationError({'after' if after is not None else 'before': ['Goal is not in the target column']})
+        if after is not None:
+            lower, upper = key, goals.filter(position__gt=key).values_list('position', flat=True).first()
+            tied = Q(position=key, id__gt=anchor)
+        else:
+            lower, upper = goals.filter(position__lt=key).values_list('position', flat=True).last(), key
+            tied = Q(position=key, id__lt=anchor)
+    if '' in (lower, upper) or (tied is not None and goals.filter(tied).exists()):
+        return None
+    return lower, upper
+
+
+def move_goal(
+    goal: Goal, category: GoalCategory, status: int, after: int | None = None, before: int | None = None
+) -> Goal:
+    """
+    Function to move goal to a place in a column of kanban, status, category and key of the goal
+    are changed together. Moves into a category are serialized by the lock of its row, so concurrent
+    moves into the same place get different keys, counters are changed from the locked state of the goal
+
+    Params:
+        - goal: moved goal
+        - category: category of column
+        - status: status of column
+        - after: id of goal to place the moved one after
+        - before: id of goal to place the moved one before, the bottom of column if both are None
+
+    Returns:
+        - moved goal
+
+    Raises:
+        - ValidationError (if neighbour is not in column)
+    """
+    max_length: int = Goal._meta.get_field('position').max_length  # type: ignore
+    with transaction.atomic():
+        # boards and categories of both columns, then goal row, as other writes of board content lock them
+        goal.lock_rows(category.id)
+        goals: QuerySet[Goal] = column(category.id, status).exclude(id=goal.id)
+        bounds = gap(goals, after, before)
+        if bounds is None or len(key := key_between(*bounds)) > max_length:
+            rebalance(category.id, status)
+            key = key_between(*gap(goals, after, before))  # type: ignore
+        goal.category, goal.status, goal.position = category, status, key
+        goal.save(update_fields=('category', 'status', 'position', 'updated'))
+    return goal
+
+
+# ----------------------------------------------------------------
+# signal receivers
+@receiver(pre_save, sender=Goal, dispatch_uid='position_goal')
+def place_goal(sender: type, instance: Goal, update_fields: Any = None, **kwargs: Any) -> None:
+    """New goal and goal changing column without a new key go to the bottom of column"""
+    if update_fields is not None and 'position' not in update_fields:
+        return
+    moved: bool = (instance.category_id, instance.status) != (
+        getattr(instance, 'loaded_category_id', None), getattr(instance, 'loaded_status', None)
+    )
+    if instance.position == '' or (moved and instance.position == getattr(instance, 'loaded_position', None)):
+        instance.position = key_between(last_key(instance.category_id, instance.status), None)
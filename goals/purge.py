@@ -0,0 +1,127 @@
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Iterator
+
+from django.db import transaction
+from django.db.models import QuerySet
+
+from goals.archive import delete_dependents, delete_rows
+from goals.models.archive import ArchivedComment, ArchivedGoal
+from goals.models.board import Board, BoardParticipant, lock_boards
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.models.tombstone import Tombstone
+from goals.versioning import bury_many
+
+
+# ----------------------------------------------------------------
+# purge
+class Purge:
+    """
+    Hard delete of soft-deleted boards and categories with everything in them. Rows are deleted in
+    dependency order by batches of ids, each batch in its own short transaction followed by a pause.
+    Board or category row is deleted last, so an interrupted purge is continued by the next run
+
+    Attrs:
+        - batch_size: rows deleted in one transaction
+        - pause: seconds to sleep after each batch
+        - removed: number of removed rows by table
+    """
+    def __init__(self, batch_size: int = 500, pause: float = 0) -> None:
+        self.batch_size: int = batch_size
+        self.pause: float = pause
+        self.removed: Counter = Counter()
+
+    def rows(self, queryset: QuerySet, entity: str | None = None) -> int:
+        """
+        Method to delete rows of queryset by batches
+
+        Params:
+            - queryset: rows to delete
+            - entity: Tombstone.Entity to record removals for sync clients, None for rows of deleted board
+
+        Returns:
+            - number of removed rows
+        """
+        model = queryset.model
+        removed: int = 0
+        while batch := list(queryset.order_by('id').values_list('id', 'board_id')[:self.batch_size]):
+            ids: list[int] = [row_id for row_id, _ in batch]
+            with transaction.atomic():
+                # boards before their content, as other writes of board content lock them
+                lock_boards({board_id for _, board_id in batch})
+                delete_dependents(model, ids, handled=(Comment, ArchivedComment, Goal, ArchivedGoal))
+                delete_rows(model, ids)
+                if entity is not None:
+                    bury_many([(board_id, entity, row_id) for row_id, board_id in batch])
+            removed += len(ids)
+            self.removed[model._meta.db_table] += len(ids)
+            if self.pause:
+                time.sleep(self.pause)
+        return removed
+
+    def board(self, board_id: int) -> int:
+        """
+        Method to delete soft-deleted board with its content and participants
+
+        Params:
+            - board_id: id of board
+
+        Returns:
+            - number of removed rows
+        """
+        removed: int = sum((
+            self.rows(Comment.objects.filter(board=board_id)),
+            self.rows(ArchivedComment.objects.filter(board=board_id)),
+            self.rows(Goal.objects.filter(board=board_id)),
+            self.rows(ArchivedGoal.objects.filter(board=board_id)),
+            self.rows(GoalCategory.objects.filter(board=board_id)),
+            self.rows(BoardParticipant.objects.filter(board=board_id)),
+        ))
+        with transaction.atomic():
+            board: Board | None = Board.objects.select_for_update().filter(id=board_id, is_deleted=True).first()
+            if board is None:
+                return removed
+            self.removed[Tombstone._meta.db_table] += Tombstone.objects.filter(board=board_id).delete()[0]
+            delete_rows(Board, [board_id])
+        self.removed[Board._meta.db_table] += 1
+        return removed + 1
+
+    def category(self, category_id: int) -> int:
+        """
+        Method to delete soft-deleted category of a board which is not deleted, with its goals and comments.
+        Removals are recorded as tombstones
+
+        Params:
+            - category_id: id of category
+
+        Returns:
+            - number of removed rows
+        """
+        return sum((
+            self.rows(Comment.objects.filter(goal__category=category_id), Tombstone.Entity.comment),
+            self.rows(ArchivedComment.objects.filter(goal__category=category_id)),
+            self.rows(Goal.objects.filter(category=category_id), Tombstone.Entity.goal),
+            self.rows(ArchivedGoal.objects.filter(category=category_id)),
+            self.rows(GoalCategory.objects.filter(id=category_id, is_deleted=True), Tombstone.Entity.category),
+        ))
+
+
+def deleted_boards(cutoff: datetime) -> QuerySet[Board]:
+    """Boards deleted before cutoff"""
+    return Board.objects.filter(is_deleted=True, updated__lt=cutoff)
+
+
+def deleted_categories(cutoff: datetime) -> QuerySet[GoalCategory]:
+    """Categories deleted before cutoff from boards which are not deleted (those are purged with boards)"""
+    return GoalCategory.objects.filter(is_deleted=True, updated__lt=cutoff, board__is_deleted=False)
+
+
+def walk(queryset: QuerySet, batch_size: int = 100) -> Iterator[int]:
+    """Ids of queryset in ascending order, read by keyset pages"""
+    last_id: int = 0
+    while page := list(queryset.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]):
+        yield from page
+        last_id = page[-1]
@@ -0,0 +1,44 @@
+from rest_framework import serializers
+
+from core.serializers import UserDetailSerializer
+from goals.models.archive import ArchivedComment, ArchivedGoal
+
+
+# ----------------------------------------------------------------
+# archive serializers
+class ArchivedCommentSerializer(serializers.ModelSerializer):
+    """
+    Archived comment serializer
+
+    Attrs:
+        - user: UserDetailSerializer defines user
+    """
+    user = UserDetailSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedComment
+        exclude: tuple = ('goal', 'board')
+
+
+class ArchivedGoalSerializer(serializers.ModelSerializer):
+    """
+    Archived goal serializer
+
+    Attrs:
+        - user: UserDetailSerializer defines user
+    """
+    user = UserDetailSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedGoal
+        fields: str = '__all__'
+
+
+class ArchivedGoalDetailSerializer(ArchivedGoalSerializer):
+    """
+    Archived goal serializer with comments
+
+    Attrs:
+        - comments: ArchivedCommentSerializer defines comments of goal
+    """
+    comments = ArchivedCommentSerializer(many=True, read_only=True)
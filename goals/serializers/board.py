@@ -27,7 +27,7 @@ class BoardParticipantSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = BoardParticipant
-        fields: str = "__all__"
+        exclude: tuple = ("board_version",)
         read_only_fields: tuple = ("id", "created", "updated", "board")
 
 
@@ -39,7 +39,7 @@ class BoardListSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Board
-        fields: str = "__all__"
+        exclude: tuple = ("version",)
 
 
 class BoardCreateSerializer(serializers.ModelSerializer):
@@ -73,7 +73,7 @@ class BoardCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Board
         read_only_fields: tuple = ("id", "created", "updated")
-        fields: str = "__all__"
+        exclude: tuple = ("version",)
 
 
 class BoardSerializer(serializers.ModelSerializer):
@@ -131,5 +131,5 @@ class BoardSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Board
-        fields: str = "__all__"
+        exclude: tuple = ("version",)
         read_only_fields: tuple = ("id", "created", "updated")
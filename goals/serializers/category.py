@@ -54,7 +54,7 @@ class CategoryCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = GoalCategory
-        fields: str = '__all__'
+        exclude: tuple = ('board_version',)
         read_only_fields: tuple = ('id', 'created', 'updated', 'user')
 
 
@@ -73,5 +73,5 @@ class CategorySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = GoalCategory
-        fields: str = "__all__"
+        exclude: tuple = ("board_version",)
         read_only_fields: tuple = ("id", "created", "updated", "user", "board")
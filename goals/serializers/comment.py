@@ -38,7 +38,7 @@ class CommentCreateSerializer(serializers.ModelSerializer):
         """
         current_user = self.context.get('request').user  # type: ignore
         board_participant = BoardParticipant.objects.filter(
-            board=entity.category.board,
+            board=entity.board_id,
             user=current_user
         ).first()
         if not board_participant:
@@ -51,7 +51,7 @@ class CommentCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Comment
-        fields: str = '__all__'
+        exclude: tuple = ('board_version',)
         read_only_fields: tuple = ('id', 'created', 'updated', 'user')
 
 
@@ -68,5 +68,5 @@ class CommentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Comment
-        fields: str = '__all__'
+        exclude: tuple = ('board_version',)
         read_only_fields: tuple = ('id', 'created', 'updated', 'user', 'goal')
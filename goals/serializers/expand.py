@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from django.db.models import Prefetch, QuerySet
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from goals.models.comment import Comment
+from goals.serializers.board import BoardListSerializer
+from goals.serializers.category import CategorySerializer
+from goals.serializers.comment import CommentSerializer
+from goals.serializers.goal import GoalSerializer
+
+
+# ----------------------------------------------------------------
+# expansions
+@dataclass
+class Expansion:
+    """
+    Relation which can be inlined into output instead of its primary key
+
+    Attrs:
+        - serializer: serializer class of related entities
+        - relation: name of model relation
+        - joins: relations of related entity read by its serializer (e.g. nested user)
+        - queryset: queryset of visible related entities of to-many relation, None for foreign key
+        - children: expansions of related entity
+    """
+    serializer: type[serializers.ModelSerializer]
+    relation: str
+    joins: tuple[str, ...] = ()
+    queryset: Callable[[Any], QuerySet] | None = None
+    children: dict[str, 'Expansion'] = field(default_factory=dict)
+
+
+BOARD_EXPANSION: Expansion = Expansion(BoardListSerializer, 'board')
+GOAL_EXPANSIONS: dict[str, Expansion] = {
+    'board': BOARD_EXPANSION,
+    'category': Expansion(CategorySerializer, 'category', ('user',), children={'board': BOARD_EXPANSION}),
+    'comments': Expansion(
+        CommentSerializer, 'comment_set', ('user',),
+        queryset=lambda user: Comment.objects.visible_to(user).order_by('created', 'id'),
+    ),
+}
+COMMENT_EXPANSIONS: dict[str, Expansion] = {
+    'board': BOARD_EXPANSION,
+    'goal': Expansion(GoalSerializer, 'goal', ('user',), children=GOAL_EXPANSIONS),
+}
+
+
+def parse(value: str, expansions: dict[str, Expansion], max_depth: int) -> dict[str, dict]:
+    """
+    Function to parse expand parameter, e.g. 'category,category.board,comments'
+
+    Params:
+        - value: comma separated dotted paths of expansions
+        - expansions: expansions of the endpoint entity
+        - max_depth: number of relations in a path at most
+
+    Returns:
+        - tree of requested expansions, e.g. {'category': {'board': {}}, 'comments': {}}
+
+    Raises:
+        - ValidationError (if path is unknown or too deep)
+    """
+    tree: dict[str, dict] = {}
+    for path in filter(None, (path.strip() for path in value.split(','))):
+        names: list[str] = path.split('.')
+        if len(names) > max_depth:
+            raise ValidationError({'expand': [f'{path} is deeper than {max_depth} relations']})
+        node: dict[str, dict] = tree
+        available: dict[str, Expansion] = expansions
+        for name in names:
+            if name not in available:
+                raise ValidationError({'expand': [f'Unknown expansion: {path}']})
+            node = node.setdefault(name, {})
+            available = available[name].children
+    return tree
+
+
+def expand_serializer(
+    serializer: serializers.Serializer, tree: dict[str, dict], expansions: dict[str, Expansion]
+) -> None:
+    """
+    Function to replace fields of expanded relations by nested serializers
+
+    Params:
+        - serializer: serializer of entity (child of list serializer)
+        - tree: tree of requested expansions
+        - expansions: expansions of the entity
+    """
+    for name, children in tree.items():
+        expansion: Expansion = expansions[name]
+        kwargs: dict = {'read_only': True, 'many': expansion.queryset is not None}
+        if expansion.relation != name:
+            kwargs['source'] = expansion.relation
+        nested: Any = expansion.serializer(**kwargs)
+        expand_serializer(nested.child if kwargs['many'] else nested, children, expansion.children)
+        serializer.fields[name] = nested
+
+
+def expand_queryset(
+    queryset: QuerySet, tree: dict[str, dict], expansions: dict[str, Expansion], user: Any, prefix: str = ''
+) -> QuerySet:
+    """
+    Function to load expanded relations with the queryset: foreign keys are joined by select_related, to-many
+    relations are prefetched by Prefetch of entities visible to the user. Entities reached by foreign keys
+    belong to the board of the visible entity, so they are visible too
+
+    Params:
+        - queryset: queryset of entities
+        - tree: tree of requested expansions
+        - expansions: expansions of the entities
+        - user: request user
+        - prefix: lookup of the entities from the queryset model, '' for the queryset entities
+
+    Returns:
+        - QuerySet
+    """
+    for name, children in tree.items():
+        expansion: Expansion = expansions[name]
+        lookup: str = prefix + expansion.relation
+        if expansion.queryset is None:
+            queryset = queryset.select_related(lookup, *(f'{lookup}__{join}' for join in expansion.joins))
+            queryset = expand_queryset(queryset, children, expansion.children, user, f'{lookup}__')
+            continue
+        related: QuerySet = expansion.queryset(user).select_related(*expansion.joins)
+        related = expand_queryset(related, children, expansion.children, user)
+        queryset = queryset.prefetch_related(Prefetch(lookup, queryset=related))
+    return queryset
@@ -1,3 +1,6 @@
+from typing import Any
+
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
@@ -56,10 +59,66 @@ class GoalCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Goal
-        fields: str = '__all__'
+        exclude: tuple = ('board_version',)
         read_only_fields: tuple = ('id', 'created', 'updated', 'user')
 
 
+class CategoryTitleField(serializers.RelatedField):
+    """
+    Field resolving category title to category of imported board.
+    Categories are taken from serializer context, so no query is made per row
+    """
+    default_error_messages: dict = {
+        'required': 'This field is required.',
+        'invalid': 'Category title must be a non-empty string of at most 255 characters.',
+    }
+
+    def __init__(self, **kwargs: dict) -> None:
+        kwargs['queryset'] = GoalCategory.objects.none()
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data: str) -> GoalCategory:
+        if not isinstance(data, str) or not data.strip() or len(data.strip()) > 255:
+            self.fail('invalid')
+        title: str = data.strip()
+        categories: dict[str, GoalCategory] = self.context['categories']
+        if title not in categories:
+            # missing category is created by importer together with the first valid goal in it
+            board = self.context['board']
+            categories[title] = GoalCategory(board=board, title=title, user=self.context['request'].user)
+        return categories[title]
+
+    def to_representation(self, value: GoalCategory) -> str:
+        return value.title
+
+
+class GoalImportSerializer(GoalCreateSerializer):
+    """
+    Goal create serializer for bulk import into a board. Category is given by title and is resolved
+    from categories of the board prepared by importer. Participant role is checked once per import
+
+    Attrs:
+        - category: CategoryTitleField defines related category by title
+    """
+    category = CategoryTitleField()
+
+    def validate_category(self, entity: GoalCategory) -> GoalCategory:
+        """
+        Redefined method to validate category entity
+
+        Validation:
+            - category belongs to imported board and is not deleted
+
+        Raises:
+            - ValidationError
+        """
+        if entity.board_id != self.context['board'].id:
+            raise ValidationError('Category does not belong to imported board')
+        if entity.is_deleted:
+            raise ValidationError("You can't create goal in deleted category")
+        return entity
+
+
 class GoalSerializer(serializers.ModelSerializer):
     """
     Goal serializer
@@ -73,5 +132,94 @@ class GoalSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Goal
-        fields: str = '__all__'
+        exclude: tuple = ('board_version',)
         read_only_fields: tuple = ('id', 'created', 'updated', 'user')
+
+
+class LastCommentSerializer(serializers.Serializer):
+    """
+    Serializer of the latest comment of goal, text is cut to a snippet
+    """
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+    created = serializers.DateTimeField()
+    user = serializers.CharField()
+
+
+class GoalCommentsSerializer(GoalSerializer):
+    """
+    Goal serializer with number of comments and the latest comment, read from annotations
+    of goals.models.comment.comment_summary
+
+    Attrs:
+        - comment_count: IntegerField defines number of comments
+        - last_comment: SerializerMethodField defines the latest comment or None
+    """
+    comment_count = serializers.IntegerField(read_only=True)
+    last_comment = serializers.SerializerMethodField()
+
+    @extend_schema_field(LastCommentSerializer(allow_null=True))
+    def get_last_comment(self, entity: Any) -> dict | None:
+        if entity.last_comment_id is None:
+            return None
+        return LastCommentSerializer({
+            'id': entity.last_comment_id,
+            'text': entity.last_comment_text,
+            'created': entity.last_comment_created,
+            'user': entity.last_comment_user,
+        }).data
+
+
+class GoalMoveSerializer(serializers.Serializer):
+    """
+    Serializer of goal move to a place in a kanban column. The column is given by status and category
+    (the current ones by default), the place by a neighbour in the column
+
+    Attrs:
+        - status: ChoiceField defines status of column
+        - category: PrimaryKeyRelatedField defines category of column, of the same board as goal
+        - after: IntegerField defines id of goal to place the moved one after
+        - before: IntegerField defines id of goal to place the moved one before
+    """
+    status = serializers.ChoiceField(choices=Goal.Status.choices[:3], required=False)
+    category = serializers.PrimaryKeyRelatedField(queryset=GoalCategory.objects.all(), required=False)
+    after = serializers.IntegerField(required=False, allow_null=True)
+    before = serializers.IntegerField(required=False, allow_null=True)
+
+    def validate_category(self, entity: GoalCategory) -> GoalCategory:
+        """
+        Redefined method to validate category entity
+
+        Validation:
+            - category belongs to the board of goal and is not deleted
+
+        Raises:
+            - ValidationError
+        """
+        if entity.board_id != self.context['goal'].board_id:
+            raise ValidationError('Goal can be moved only to a category of its board')
+        if entity.is_deleted:
+            raise ValidationError("You can't move goal to deleted category")
+        return entity
+
+    def validate(self, attrs: dict) -> dict:
+        """
+        Redefined method to validate neighbours
+
+        Validation:
+            - only one of after and before is given, neighbour is not the moved goal
+
+        Returns:
+            - attrs with status and category of column
+
+        Raises:
+            - ValidationError
+        """
+        goal: Goal = self.context['goal']
+        if attrs.get('after') is not None and attrs.get('before') is not None:
+            raise ValidationError('Pass either after or before')
+        if goal.id in (attrs.get('after'), attrs.get('before')):
+            raise ValidationError("Goal can't be placed next to itself")
+        attrs.setdefault('status', goal.status)
+        attrs.setdefault('category', goal.category)
+        return attrs
@@ -0,0 +1,40 @@
+from rest_framework import serializers
+
+from goals.models.tombstone import Tombstone
+from goals.serializers.board import BoardListSerializer, BoardParticipantSerializer
+from goals.serializers.category import CategorySerializer
+from goals.serializers.comment import CommentSerializer
+from goals.serializers.goal import GoalSerializer
+
+
+# ----------------------------------------------------------------
+# sync serializers
+class TombstoneSerializer(serializers.ModelSerializer):
+    """
+    Tombstone serializer
+    """
+    class Meta:
+        model = Tombstone
+        fields: tuple = ('board', 'entity', 'entity_id', 'created')
+
+
+class SyncSerializer(serializers.Serializer):
+    """
+    Serializer of changes since cursor (goals.sync.Changes), rows have the same fields as in lists
+
+    Attrs:
+        - cursor: cursor to pass to next sync
+        - boards: changed boards, deleted boards are dropped by client with their content
+        - participants, categories, goals, comments: created or changed rows, deleted categories and
+          archived goals included
+        - tombstones: rows removed from boards
+        - removed_boards: boards which user does not participate in anymore
+    """
+    cursor = serializers.CharField()
+    boards = BoardListSerializer(many=True)
+    participants = BoardParticipantSerializer(many=True)
+    categories = CategorySerializer(many=True)
+    goals = GoalSerializer(many=True)
+    comments = CommentSerializer(many=True)
+    tombstones = TombstoneSerializer(many=True)
+    removed_boards = serializers.ListField(child=serializers.IntegerField())
@@ -0,0 +1,167 @@
+from functools import lru_cache
+from typing import Any, Callable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from rest_framework import serializers
+
+# fields which output database values of values() rows as they are
+NATIVE_FIELDS: tuple = (
+    serializers.IntegerField, serializers.CharField, serializers.EmailField, serializers.SlugField,
+    serializers.BooleanField, serializers.ChoiceField,
+)
+
+
+# ----------------------------------------------------------------
+# values serializer
+class ValuesSerializer:
+    """
+    Read only counterpart of a ModelSerializer for values() rows. Fields of the serializer are resolved
+    once to columns (related fields through joins, e.g. user__username) and converters: values which
+    JSON has as they are (integers, strings, booleans, choices, primary keys) are copied, other values are
+    converted by to_representation of the serializer field, nested serializers of foreign keys are
+    rendered from joined columns. Output is the same as of the ModelSerializer without building model
+    instances and running serializer fields one by one
+
+    Attrs:
+        - columns: arguments of values()
+        - fields: output key, column, converter (None to copy) and nested ValuesSerializer of each field
+    """
+    def __init__(
+        self, serializer: serializers.Serializer, model: type[Model], prefix: str = '', only: frozenset | None = None
+    ) -> None:
+        self.columns: list[str] = []
+        self.fields: list[tuple[str, str, Callable | None, 'ValuesSerializer | None']] = []
+        self.key: str = f'{prefix}{model._meta.pk.name}'  # type: ignore
+        for field in serializer.fields.values():
+            if field.write_only or (only is not None and field.field_name not in only):
+                continue
+            source: list[str] = field.source_attrs
+            related: Any = resolve(model, source)
+            column: str = prefix + '__'.join(source)
+            if isinstance(field, serializers.ModelSerializer):
+                if related is None or not related.is_relation or related.many_to_many or related.one_to_many:
+                    raise TypeError(f'{field.field_name} is not a nested serializer of a foreign key')
+                nested = ValuesSerializer(field, related.related_model, f'{column}__')
+                self.columns.extend(nested.columns)
+                self.fields.append((field.field_name, nested.key, None, nested))
+                continue
+            if related is None or isinstance(field, (serializers.BaseSerializer, serializers.ManyRelatedField)):
+                raise TypeError(f'{field.field_name} is not a column')
+            if isinstance(field, serializers.PrimaryKeyRelatedField):
+                converter: Callable | None = None if field.pk_field is None else field.pk_field.to_representation
+            elif type(field) in NATIVE_FIELDS:
+                converter = None
+            else:
+                converter = field.to_representation
+            self.columns.append(column)
+            self.fields.append((field.field_name, column, converter, None))
+
+    def render(self, row: dict) -> dict:
+        """
+        Method to render one values() row
+
+        Params:
+            - row: values() row with columns
+
+        Returns:
+            - dict with the same keys and values as ModelSerializer output
+        """
+        data: dict = {}
+        for name, column, converter, nested in self.fields:
+            value: Any = row[column]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = nested.render(row)
+            elif converter is None:
+                data[name] = value
+            else:
+                data[name] = converter(value)
+        return data
+
+    def render_many(self, rows: list[dict]) -> list[dict]:
+        return [self.render(row) for row in rows]
+
+
+def resolve(model: type[Model], source: list[str]) -> Any:
+    """Model field reached by source attributes through foreign keys, None if source is not a field"""
+    field: Any = None
+    for attr in source:
+        if field is not None:
+            if not field.is_relation or field.many_to_many or field.one_to_many:
+                return None
+            model = field.related_model
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+    return field
+
+
+@lru_cache(maxsize=None)
+def values_serializer(
+    serializer_class: type[serializers.ModelSerializer], only: frozenset | None = None
+) -> ValuesSerializer | None:
+    """
+    ValuesSerializer of a ModelSerializer class, built once
+
+    Params:
+        - serializer_class: ModelSerializer class
+        - only: names of rendered fields, all readable fields if None
+
+    Returns:
+        - ValuesSerializer or None if serializer has fields which are not columns (e.g. SerializerMethodField)
+    """
+    try:
+        return ValuesSerializer(serializer_class(), serializer_class.Meta.model, only=only)
+    except TypeError:
+        return None
+
+
+def prune(queryset: QuerySet, serializer: serializers.Serializer, only: frozenset) -> QuerySet:
+    """
+    Function to load only columns of rendered fields: model fields with only(), foreign keys of nested
+    serializers with select_related() of their columns, relations of other fields are not joined.
+    Foreign keys are always loaded (permissions read board_id of entities), fields which are not columns
+    (e.g. SerializerMethodField, annotations) read what they need themselves
+
+    Params:
+        - queryset: queryset of serializer model
+        - serializer: serializer rendering entities of queryset
+        - only: names of rendered fields
+
+    Returns:
+        - QuerySet
+    """
+    model: type[Model] = queryset.model
+    columns: list[str] = [
+        field.name for field in model._meta.concrete_fields if field.primary_key or field.many_to_one
+    ]
+    related: list[str] = []
+    for field in serializer.fields.values():
+        if field.write_only or field.field_name not in only:
+            continue
+        source: str = '__'.join(field.source_attrs)
+        target: Any = resolve(model, field.source_attrs)
+        if target is None or isinstance(field, serializers.ManyRelatedField):
+            continue
+        if isinstance(field, serializers.ModelSerializer):
+            related.append(source)
+            columns.extend(
+                '__'.join([source, *nested.source_attrs]) for nested in field.fields.values()
+                if not nested.write_only and resolve(target.related_model, nested.source_attrs) is not None
+            )
+        elif not isinstance(field, serializers.BaseSerializer):
+            columns.append(source)
+    # select_related() without fields would join every foreign key
+    queryset = queryset.select_related(None)
+    if related:
+        queryset = queryset.select_related(*related)
+    return queryset.only(*columns)
+
+
+@lru_cache(maxsize=None)
+def readable_fields(serializer_class: type[serializers.Serializer]) -> tuple[str, ...]:
+    """Names of fields rendered by serializer class"""
+    return tuple(name for name, field in serializer_class().fields.items() if not field.write_only)
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.goal import Goal
+
+# statuses of goals which are not finished
+OPEN_STATUSES: tuple = (Goal.Status.to_do, Goal.Status.in_progress)
+
+
+# ----------------------------------------------------------------
+# board summary
+def board_summary(board: Board) -> tuple[dict[str, Any], datetime | None]:
+    """
+    Function to count goals of board by category, status and priority, overdue goals (of board and
+    of each category) and open goals of each participant. Counts are grouped by database, three queries in total
+
+    Params:
+        - board: board with loaded version
+
+    Returns:
+        - summary and nearest due date of open goal which is not overdue yet (summary changes then)
+    """
+    now: datetime = timezone.now()
+    is_open = Q(status__in=OPEN_STATUSES)
+    goals = Goal.objects.filter(board=board)
+    groups = goals.values('category', 'status', 'priority').annotate(
+        count=Count('id'),
+        overdue=Count('id', filter=is_open & Q(due_date__lt=now)),
+        next_due=Min('due_date', filter=is_open & Q(due_date__gte=now)),
+    ).order_by()
+    open_goals: dict[int, int] = dict(
+        goals.filter(is_open).values('user').annotate(count=Count('id')).order_by().values_list('user', 'count')
+    )
+
+    categories: dict[int, dict[str, Any]] = {
+        category['id']: {**category, 'total': 0, 'overdue': 0, 'counts': []}
+        for category in GoalCategory.objects.filter(board=board).values('id', 'title', 'is_deleted').order_by('id')
+    }
+    total: int = 0
+    overdue: int = 0
+    next_due: datetime | None = None
+    for group in groups:
+        category: dict[str, Any] = categories[group['category']]
+        category['total'] += group['count']
+        category['overdue'] += group['overdue']
+        category['counts'].append({key: group[key] for key in ('status', 'priority', 'count')})
+        total += group['count']
+        overdue += group['overdue']
+        if group['next_due'] and (next_due is None or group['next_due'] < next_due):
+            next_due = group['next_due']
+    for category in categories.values():
+        category['counts'].sort(key=lambda count: (count['status'], count['priority']))
+
+    members = BoardParticipant.objects.filter(board=board).order_by('role', 'user__username')
+    participants: list[dict[str, Any]] = [
+        {'user': user, 'username': username, 'role': role, 'open': open_goals.get(user, 0)}
+        for user, username, role in members.values_list('user', 'user__username', 'role')
+    ]
+    summary: dict[str, Any] = {
+        'board': board.id,
+        'version': board.version,
+        'generated': now,
+        'total': total,
+        'overdue': overdue,
+        'categories': list(categories.values()),
+        'participants': participants,
+    }
+    return summary, next_due
+
+
+def cached_board_summary(board: Board) -> dict[str, Any]:
+    """
+    Function to get board summary from cache. Cache key contains board version, so any change of
+    board content makes a new key. Entry expires after BOARD_SUMMARY_CACHE_SECONDS or when the
+    nearest due date passes, as overdue count depends on time
+
+    Params:
+        - board: board with loaded version
+
+    Returns:
+        - summary
+    """
+    key: str = f'board-summary:{board.id}:{board.version}'
+    summary: dict[str, Any] | None = cache.get(key)
+    if summary is None:
+        summary, next_due = board_summary(board)
+        timeout: int = settings.BOARD_SUMMARY_CACHE_SECONDS
+        if next_due is not None:
+            timeout = min(timeout, int((next_due - summary['generated']).total_seconds()))
+        if timeout > 0:
+            cache.set(key, summary, timeout)
+    return summary
@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.db.models import Q, QuerySet
+
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.models.tombstone import Tombstone
+
+
+# ----------------------------------------------------------------
+# cursor
+def parse_cursor(cursor: str) -> dict[int, int]:
+    """
+    Function to read sync cursor: versions of boards known to client, e.g. "12:5,40:17"
+
+    Params:
+        - cursor: cursor returned by previous sync, empty for initial sync
+
+    Returns:
+        - version by board id
+
+    Raises:
+        - ValueError
+    """
+    versions: dict[int, int] = {}
+    for item in filter(None, cursor.split(',')):
+        board, _, version = item.partition(':')
+        versions[int(board)] = int(version)
+    return versions
+
+
+def format_cursor(versions: dict[int, int]) -> str:
+    return ','.join(f'{board}:{version}' for board, version in sorted(versions.items()))
+
+
+# ----------------------------------------------------------------
+# changes
+@dataclass
+class Changes:
+    """
+    Changes of boards visible to user since cursor
+
+    Attrs:
+        - cursor: cursor to pass to next sync
+        - boards: changed boards, deleted ones included (client drops their content)
+        - participants, categories, goals, comments: created or changed rows
+        - tombstones: rows removed from known boards
+        - removed_boards: known boards which user does not participate in anymore
+    """
+    cursor: str = ''
+    boards: list[Board] = field(default_factory=list)
+    participants: list[BoardParticipant] = field(default_factory=list)
+    categories: list[GoalCategory] = field(default_factory=list)
+    goals: list[Goal] = field(default_factory=list)
+    comments: list[Comment] = field(default_factory=list)
+    tombstones: list[Tombstone] = field(default_factory=list)
+    removed_boards: list[int] = field(default_factory=list)
+
+
+def changes_since(user: Any, known: dict[int, int]) -> Changes:
+    """
+    Function to collect changes of user's boards since versions known to client.
+    Boards are compared by version first, so unchanged boards cost nothing. Boards new to client are
+    returned with all visible content, known boards with rows changed after the known version
+    (read by (board, board_version) indexes), including deleted categories and archived goals.
+    Versions are read before rows, rows changed meanwhile are returned again by next sync
+
+    Params:
+        - user: User
+        - known: version by board id, from parse_cursor
+
+    Returns:
+        - Changes
+    """
+    result = Changes()
+    versions: dict[int, int] = {}
+    new: list[int] = []
+    changed: dict[int, int] = {}
+    for board in Board.objects.participated_by(user).filter(Q(is_deleted=False) | Q(id__in=known)):
+        if board.version <= known.get(board.id, -1):
+            versions[board.id] = board.version
+            continue
+        result.boards.append(board)
+        if board.is_deleted:
+            # client drops the board, it is not in cursor anymore
+            continue
+        versions[board.id] = board.version
+        if board.id in known:
+            changed[board.id] = known[board.id]
+        else:
+            new.append(board.id)
+    result.cursor = format_cursor(versions)
+    result.removed_boards = sorted(set(known) - versions.keys() - {board.id for board in result.boards})
+
+    since: Q | None = None
+    if changed:
+        since = reduce(or_, (Q(board=board, board_version__gt=version) for board, version in changed.items()))
+        result.tombstones = list(Tombstone.objects.filter(since).order_by('id'))
+    for name, queryset in (
+        ('participants', BoardParticipant.objects.select_related('user')),
+        ('categories', GoalCategory.objects.select_related('user')),
+        ('goals', Goal.objects.select_related('user')),
+        ('comments', Comment.objects.select_related('user')),
+    ):
+        rows: list = []
+        if since is not None:
+            rows += queryset.filter(since).order_by('id')
+        if new:
+            # content of a new board is read as in lists, without deleted and archived rows
+            visible: QuerySet = queryset if name == 'participants' else queryset.visible_to(user)
+            rows += visible.filter(board__in=new).order_by('id')
+        setattr(result, name, rows)
+    return result
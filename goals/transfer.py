@@ -0,0 +1,322 @@
+import codecs
+import csv
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from django.db import connections, transaction
+from django.db.models import Prefetch, QuerySet
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from goals.counters import change_counters, contribution
+from goals.models.board import Board
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.positions import append_positions
+from goals.serializers.goal import GoalImportSerializer
+from goals.versioning import bump_board_version
+
+EXPORT_CHUNK_SIZE: int = 500
+CSV_COLUMNS: tuple = (
+    'record', 'goal_id', 'category', 'title', 'description', 'status', 'priority', 'due_date',
+    'author', 'created', 'updated', 'comment_id', 'text',
+)
+
+IMPORT_CHUNK_SIZE: int = 500
+IMPORT_FIELDS: tuple = ('category', 'title', 'description', 'status', 'priority', 'due_date')
+# errors of rows beyond this number are counted but not reported
+MAX_REPORTED_ERRORS: int = 1000
+
+encoder = JSONEncoder()
+
+
+# ----------------------------------------------------------------
+# reading
+def board_goals(board: Board) -> QuerySet[Goal]:
+    """
+    Function to build queryset of all goals of board with categories, authors and comments
+
+    Params:
+        - board: exported board
+
+    Returns:
+        - QuerySet ordered by id
+    """
+    return Goal.objects.filter(board=board).select_related('category', 'user').prefetch_related(
+        Prefetch('comment_set', queryset=Comment.objects.select_related('user').order_by('created', 'id'))
+    ).order_by('id')
+
+
+def iterate_goals(queryset: QuerySet[Goal], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Goal]:
+    """
+    Function to read goals by chunks, keeping memory flat regardless of board size.
+    Server-side cursor is used by default. Connections with DISABLE_SERVER_SIDE_CURSORS
+    (pgbouncer transaction pooling) would load the whole result into client memory instead,
+    so they read chunks by id (keyset) with separate queries
+
+    Params:
+        - queryset: goals ordered by id
+        - chunk_size: number of goals per fetch (and per comments prefetch)
+
+    Returns:
+        - iterator of goals
+    """
+    if not connections[queryset.db].settings_dict.get('DISABLE_SERVER_SIDE_CURSORS'):
+        yield from queryset.iterator(chunk_size=chunk_size)
+        return
+    last_id: int = 0
+    while True:
+        chunk: list[Goal] = list(queryset.filter(id__gt=last_id)[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        last_id = chunk[-1].id
+
+
+# ----------------------------------------------------------------
+# export
+def _text(value: Any) -> Any:
+    """Datetimes are written the same way as in API responses"""
+    return encoder.default(value) if hasattr(value, 'isoformat') else value
+
+
+class _Echo:
+    """File-like object returning written line instead of buffering it"""
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_csv(goals: Iterable[Goal]) -> Iterator[str]:
+    """
+    Function to stream goals as CSV, each goal row is followed by rows of its comments
+
+    Params:
+        - goals: goals with prefetched comments
+
+    Returns:
+        - iterator of CSV lines
+    """
+    writer: Any = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for goal in goals:
+        yield writer.writerow((
+            'goal', goal.id, goal.category.title, goal.title, goal.description, goal.status, goal.priority,
+            _text(goal.due_date), goal.user.username, _text(goal.created), _text(goal.updated), '', '',
+        ))
+        for comment in goal.comment_set.all():
+            yield writer.writerow((
+                'comment', goal.id, '', '', '', '', '', '',
+                comment.user.username, _text(comment.created), _text(comment.updated), comment.id, comment.text,
+            ))
+
+
+def export_jsonl(goals: Iterable[Goal]) -> Iterator[str]:
+    """
+    Function to stream goals as JSON lines, one goal with its comments per line
+
+    Params:
+        - goals: goals with prefetched comments
+
+    Returns:
+        - iterator of JSON lines
+    """
+    for goal in goals:
+        record: dict[str, Any] = {
+            'id': goal.id,
+            'category': goal.category.title,
+            'title': goal.title,
+            'description': goal.description,
+            'status': goal.status,
+            'priority': goal.priority,
+            'due_date': goal.due_date,
+            'author': goal.user.username,
+            'created': goal.created,
+            'updated': goal.updated,
+            'comments': [
+                {
+                    'id': comment.id,
+                    'author': comment.user.username,
+                    'created': comment.created,
+                    'updated': comment.updated,
+                    'text': comment.text,
+                }
+                for comment in goal.comment_set.all()
+            ],
+        }
+        yield json.dumps(record, cls=JSONEncoder, ensure_ascii=False) + '\n'
+
+
+# format -> content type and exporter
+EXPORT_FORMATS: dict[str, tuple[str, Any]] = {
+    'csv': ('text/csv; charset=utf-8', export_csv),
+    'jsonl': ('application/x-ndjson; charset=utf-8', export_jsonl),
+}
+
+
+# ----------------------------------------------------------------
+# import
+@dataclass
+class ImportResult:
+    """
+    Summary of import
+
+    Attrs:
+        - rows: number of read rows
+        - created: number of created goals
+        - categories_created: number of created categories
+        - failed: number of rejected rows
+        - skipped: number of rows which are not goals (comment rows of exported CSV)
+        - errors: errors of rejected rows by row number (first MAX_REPORTED_ERRORS rows)
+    """
+    rows: int = 0
+    created: int = 0
+    categories_created: int = 0
+    failed: int = 0
+    skipped: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def reject(self, row: int, errors: Any) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row, 'errors': errors})
+
+
+def _decode(lines: Iterable[bytes]) -> Iterator[str]:
+    """Lines of uploaded file as text, BOM is dropped"""
+    return codecs.iterdecode(lines, 'utf-8-sig')
+
+
+def read_csv(lines: Iterable[bytes]) -> Iterator[dict[str, Any] | None]:
+    """
+    Function to read goal records from CSV with header. Columns of board export are accepted,
+    rows with record other than "goal" are returned as None. Empty optional values are omitted
+
+    Params:
+        - lines: lines of file
+
+    Returns:
+        - iterator of records
+    """
+    for row in csv.DictReader(_decode(lines)):
+        if row.get('record', 'goal') not in ('goal', '', None):
+            yield None
+            continue
+        yield {
+            name: value for name, value in row.items()
+            if name in IMPORT_FIELDS and (value or name in ('title', 'description'))
+        }
+
+
+def read_jsonl(lines: Iterable[bytes]) -> Iterator[dict[str, Any] | ValueError]:
+    """
+    Function to read goal records from JSON lines, one goal object per line. Blank lines are ignored,
+    lines which are not JSON objects are returned as ValueError
+
+    Params:
+        - lines: lines of file
+
+    Returns:
+        - iterator of records
+    """
+    for line in _decode(lines):
+        if not line.strip():
+            continue
+        try:
+            record: Any = json.loads(line)
+        except ValueError as error:
+            yield ValueError(f'Invalid JSON: {error}')
+            continue
+        if not isinstance(record, dict):
+            yield ValueError('Expected JSON object')
+            continue
+        yield {name: value for name, value in record.items() if name in IMPORT_FIELDS}
+
+
+def import_goals(
+    board: Board, request: Any, records: Iterable[Any], chunk_size: int = IMPORT_CHUNK_SIZE
+) -> ImportResult:
+    """
+    Function to create goals of board from records by chunks. Each record is validated with the same
+    rules as goal creation, categories are referenced by title and missing ones are created.
+    Valid goals of a chunk are written with bulk_create in one transaction, invalid rows are
+    reported and do not abort the import. Caller checks that user can create goals in the board
+
+    Params:
+        - board: board to import goals into
+        - request: request (or object with user attribute) defining author of goals and categories
+        - records: dicts of goal fields, None for skipped rows or ValueError for unreadable rows
+        - chunk_size: number of rows validated and written together
+
+    Returns:
+        - ImportResult
+    """
+    result = ImportResult()
+    categories: dict[str, GoalCategory] = {}
+    for category in board.categories.filter(is_deleted=False).order_by('-id'):
+        categories[category.title] = category
+    context: dict[str, Any] = {'request': request, 'board': board, 'categories': categories}
+    chunk: list[Any] = []
+    try:
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                _import_chunk(chunk, context, result)
+                chunk = []
+    except UnicodeDecodeError:
+        _import_chunk(chunk, context, result)
+        chunk = []
+        result.reject(result.rows + 1, {
+            'non_field_errors': ['File is not UTF-8 encoded, rows from this one are not imported'],
+        })
+    _import_chunk(chunk, context, result)
+    return result
+
+
+def _import_chunk(records: list[Any], context: dict[str, Any], result: ImportResult) -> None:
+    """Validate records of chunk, then create new categories of valid goals and goals themselves"""
+    goals: list[Goal] = []
+    for record in records:
+        result.rows += 1
+        if record is None:
+            result.skipped += 1
+        elif isinstance(record, ValueError):
+            result.reject(result.rows, {'non_field_errors': [str(record)]})
+        else:
+            serializer = GoalImportSerializer(data=record, context=context)
+            if serializer.is_valid():
+                goals.append(Goal(**serializer.validated_data, board=context['board']))
+            else:
+                result.reject(result.rows, dict(serializer.errors))
+    if not goals:
+        return
+    new_categories: dict[str, GoalCategory] = {}
+    for goal in goals:
+        if goal.category.pk is None:
+            new_categories[goal.category.title] = goal.category
+    now = timezone.now()
+    with transaction.atomic():
+        bump_board_version(resync=True, id=context['board'].id)
+        version: int = Board.objects.values_list('version', flat=True).get(id=context['board'].id)
+        for entity in (*new_categories.values(), *goals):
+            entity.created = entity.updated = now
+            entity.board_version = version
+        GoalCategory.objects.bulk_create(new_categories.values())
+        append_positions(goals)
+        Goal.objects.bulk_create(goals)
+        deltas: dict[int, Counter] = defaultdict(Counter)
+        for goal in goals:
+            deltas[goal.category_id].update(contribution(goal.status))
+        for category_id, delta in deltas.items():
+            change_counters(category_id, context['board'].id, delta)
+    result.categories_created += len(new_categories)
+    result.created += len(goals)
+
+
+# format -> reader of uploaded file
+IMPORT_FORMATS: dict[str, Any] = {
+    'csv': read_csv,
+    'jsonl': read_jsonl,
+}
@@ -1,9 +1,31 @@
+from django.conf import settings
 from django.urls import path
 
-from goals.views.board import BoardCreateView, BoardListView, BoardDetailView
-from goals.views.category import CategoryCreateView, CategoryListView, CategoryDetailView
-from goals.views.comment import CommentCreateView, CommentListView, CommentDetailView
-from goals.views.goal import GoalCreateView, GoalListView, GoalDetailView
+from goals.views.archive import ArchivedGoalDetailView, ArchivedGoalListView, ArchivedGoalRestoreView
+from goals.views.board import BoardCreateView, BoardExportView, BoardImportView, BoardSummaryView
+from goals.views.category import CategoryCreateView
+from goals.views.comment import CommentCreateView, CommentLatestView
+from goals.views.goal import GoalCreateView, GoalMoveView
+from goals.views.sync import SyncView
+
+# ----------------------------------------------------------------
+# read views (async ORM variants for ASGI serving profile)
+if settings.ASYNC_VIEWS:
+    from goals.views.async_read import (
+        AsyncBoardListView as BoardListView,
+        AsyncBoardDetailView as BoardDetailView,
+        AsyncCategoryListView as CategoryListView,
+        AsyncCategoryDetailView as CategoryDetailView,
+        AsyncGoalListView as GoalListView,
+        AsyncGoalDetailView as GoalDetailView,
+        AsyncCommentListView as CommentListView,
+        AsyncCommentDetailView as CommentDetailView,
+    )
+else:
+    from goals.views.board import BoardListView, BoardDetailView
+    from goals.views.category import CategoryListView, CategoryDetailView
+    from goals.views.comment import CommentListView, CommentDetailView
+    from goals.views.goal import GoalListView, GoalDetailView
 
 # ----------------------------------------------------------------
 # urlpatterns
@@ -11,13 +33,22 @@ urlpatterns = [
     path('board/create', BoardCreateView.as_view(), name='board-create'),
     path('board/list', BoardListView.as_view(), name='board-list'),
     path('board/<int:pk>', BoardDetailView.as_view(), name='board-detail'),
+    path('board/<int:pk>/summary', BoardSummaryView.as_view(), name='board-summary'),
+    path('board/<int:pk>/export.<str:export_format>', BoardExportView.as_view(), name='board-export'),
+    path('board/<int:pk>/import.<str:import_format>', BoardImportView.as_view(), name='board-import'),
     path("goal_category/create", CategoryCreateView.as_view(), name="category-create"),
     path("goal_category/list", CategoryListView.as_view(), name="category-list"),
     path("goal_category/<int:pk>", CategoryDetailView.as_view(), name="category-detail"),
     path('goal/create', GoalCreateView.as_view(), name="goal-create"),
     path('goal/list', GoalListView.as_view(), name='goal-list'),
     path('goal/<int:pk>', GoalDetailView.as_view(), name='goal-detail'),
+    path('goal/<int:pk>/move', GoalMoveView.as_view(), name='goal-move'),
     path('goal_comment/create', CommentCreateView.as_view(), name='comment-create'),
     path('goal_comment/list', CommentListView.as_view(), name='comment-list'),
+    path('goal_comment/latest', CommentLatestView.as_view(), name='comment-latest'),
     path('goal_comment/<int:pk>', CommentDetailView.as_view(), name='comment-detail'),
+    path('sync', SyncView.as_view(), name='sync'),
+    path('archive/goal/list', ArchivedGoalListView.as_view(), name='archived-goal-list'),
+    path('archive/goal/<int:pk>', ArchivedGoalDetailView.as_view(), name='archived-goal-detail'),
+    path('archive/goal/<int:pk>/restore', ArchivedGoalRestoreView.as_view(), name='archived-goal-restore'),
 ]
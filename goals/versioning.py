@@ -0,0 +1,125 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models import F, Model, OuterRef, QuerySet, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from goals.live import publish_changed
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.models.tombstone import Tombstone
+
+
+# ----------------------------------------------------------------
+# board version
+def bump_board_version(resync: bool = False, **lookup: Any) -> None:
+    """
+    Function to increment version of boards, which content was changed. Runs in the transaction of
+    the change, so a version is never seen with content of an older one. Writes which do not send
+    model signals (QuerySet.update, bulk_create) call it explicitly with resync
+
+    Params:
+        - resync: publish board-level live event with the new version, changed rows have no events of their own
+        - lookup: filter of changed boards, e.g. id=1 or id__in=[1, 2]
+    """
+    Board.objects.filter(**lookup).update(version=F('version') + 1)
+    if resync:
+        publish_changed(Board.objects.filter(**lookup).values_list('id', 'version'))
+
+
+def current_version(board: Any = OuterRef('board_id')) -> Subquery:
+    """Version of board (of the updated row by default) as an expression for writes"""
+    return Subquery(Board.objects.filter(id=board).values('version')[:1])
+
+
+def touch(queryset: QuerySet, resync: bool = False) -> None:
+    """
+    Function to mark rows of board content as changed: versions of their boards are incremented
+    and rows get the new versions, so sync returns them. Row lock of the board, taken by the increment,
+    is held until rows are marked, concurrent changes of the board are marked with later versions
+
+    Params:
+        - queryset: changed rows of BoardParticipant, GoalCategory, Goal or Comment
+        - resync: rows were changed without model signals, see bump_board_version
+    """
+    with transaction.atomic(using=queryset.db, savepoint=False):
+        bump_board_version(resync=resync, id__in=queryset.values('board_id'))
+        queryset.update(board_version=current_version())
+
+
+def bury(board_id: int, entity: str, entity_id: int) -> None:
+    """
+    Function to record removal of entity from board as a tombstone with new version of board
+
+    Params:
+        - board_id: id of board
+        - entity: Tombstone.Entity
+        - entity_id: id of removed entity
+    """
+    with transaction.atomic(savepoint=False):
+        bump_board_version(id=board_id)
+        Tombstone.objects.create(
+            board_id=board_id, entity=entity, entity_id=entity_id, board_version=current_version(board_id)
+        )
+
+
+def bury_many(removed: list[tuple[int, str, int]]) -> None:
+    """
+    Function to record removal of many entities with one version increment per board,
+    used by writes which bypass model signals, so boards are resynced by live clients
+
+    Params:
+        - removed: board id, Tombstone.Entity and entity id of each removed entity
+    """
+    boards: set[int] = {board_id for board_id, _, _ in removed}
+    with transaction.atomic(savepoint=False):
+        bump_board_version(id__in=boards)
+        versions: dict[int, int] = dict(Board.objects.filter(id__in=boards).values_list('id', 'version'))
+        publish_changed(versions.items())
+        Tombstone.objects.bulk_create([
+            Tombstone(board_id=board_id, entity=entity, entity_id=entity_id, board_version=versions[board_id])
+            for board_id, entity, entity_id in removed
+        ])
+
+
+# ----------------------------------------------------------------
+# signal receivers
+ENTITIES: dict[type, str] = {
+    BoardParticipant: Tombstone.Entity.participant,
+    GoalCategory: Tombstone.Entity.category,
+    Goal: Tombstone.Entity.goal,
+    Comment: Tombstone.Entity.comment,
+}
+
+
+@receiver(post_save, sender=Board, dispatch_uid='version_board')
+def bump_board(sender: type, instance: Board, **kwargs: Any) -> None:
+    bump_board_version(id=instance.id)
+
+
+@receiver(post_save, sender=Comment, dispatch_uid='version_comment')
+@receiver(post_save, sender=BoardParticipant, dispatch_uid='version_participant')
+@receiver(post_save, sender=GoalCategory, dispatch_uid='version_category')
+def touch_saved(sender: type[Model], instance: Any, **kwargs: Any) -> None:
+    touch(sender.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Goal, dispatch_uid='version_goal')
+def touch_goal(sender: type, instance: Goal, **kwargs: Any) -> None:
+    former: int | None = getattr(instance, 'loaded_board_id', None)
+    with transaction.atomic(savepoint=False):
+        if former is not None and former != instance.board_id:
+            # goal moved to another board is removed from the former one
+            bury(former, Tombstone.Entity.goal, instance.pk)
+        touch(Goal.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Comment, dispatch_uid='tombstone_comment')
+@receiver(post_delete, sender=Goal, dispatch_uid='tombstone_goal')
+@receiver(post_delete, sender=BoardParticipant, dispatch_uid='tombstone_participant')
+@receiver(post_delete, sender=GoalCategory, dispatch_uid='tombstone_category')
+def bury_deleted(sender: type, instance: Any, **kwargs: Any) -> None:
+    bury(instance.board_id, ENTITIES[sender], instance.pk)
@@ -0,0 +1,124 @@
+from django.db.models import QuerySet
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions, filters, status
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals.archive import restore_goal
+from goals.models.archive import ArchivedGoal
+from goals.permissions import GoalPermissions
+from goals.serializers.archive import ArchivedGoalDetailSerializer, ArchivedGoalSerializer
+from goals.serializers.goal import GoalSerializer
+from goals.views.values import SPARSE_FIELDS_PARAMETERS, ValuesListMixin
+
+
+# ----------------------------------------------------------------
+# archive views
+@extend_schema(tags=['Archive'])
+class ArchivedGoalListView(ValuesListMixin, generics.ListAPIView):
+    """
+    View to handle GET request to get list of archived goal entities
+
+    Attrs:
+        - permission_classes: defines permissions for this APIView
+        - serializer_class: defines serializer class for this APIView
+        - pagination_class: defines pagination type for this APIView
+        - filter_backends: defines collection of filtering options for this APIView
+        - filterset_fields: defines collection of fields to filter
+        - ordering_fields: defines collection of ordering options for this APIView
+        - ordering: defines base ordering for this APIView
+        - search_fields: defines collection of search options for this APIView
+    """
+    permission_classes: list = [permissions.IsAuthenticated]
+    serializer_class = ArchivedGoalSerializer
+    pagination_class = LimitOffsetPagination
+    filter_backends: tuple = (
+        DjangoFilterBackend,
+        filters.OrderingFilter,
+        filters.SearchFilter,
+    )
+    filterset_fields: tuple = ('board', 'category')
+    ordering_fields: tuple = ('archived', 'updated', 'title')
+    ordering: tuple = ('-archived', '-id')
+    search_fields: tuple = ('title',)
+
+    def get_queryset(self) -> QuerySet[ArchivedGoal]:
+        """
+        Method to define queryset to get archived goals of user's boards
+
+        Returns:
+            - QuerySet
+        """
+        return ArchivedGoal.objects.select_related('user').visible_to(self.request.user)
+
+    @extend_schema(
+        description="Get list of goals moved to archive",
+        summary="Archived goals list",
+        parameters=SPARSE_FIELDS_PARAMETERS,
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        return super().get(request, *args, **kwargs)
+
+
+@extend_schema(tags=['Archive'])
+class ArchivedGoalDetailView(generics.RetrieveAPIView):
+    """
+    View to handle GET request of definite archived goal entity with its comments
+
+    Attrs:
+        - serializer_class: defines serializer class for this APIView
+        - permission_classes: defines permissions for this APIView
+    """
+    serializer_class = ArchivedGoalDetailSerializer
+    permission_classes: list = [permissions.IsAuthenticated, GoalPermissions]
+
+    def get_queryset(self) -> QuerySet[ArchivedGoal]:
+        """Method to redefine queryset for archived goal"""
+        return ArchivedGoal.objects.select_related('user').prefetch_related('comments__user').visible_to(
+            self.request.user
+        )
+
+    @extend_schema(
+        description="Get one archived goal with comments",
+        summary="Retrieve archived goal",
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        return super().get(request, *args, **kwargs)
+
+
+@extend_schema(tags=['Archive'])
+class ArchivedGoalRestoreView(generics.GenericAPIView):
+    """
+    View to handle POST request to move archived goal with its comments back to goals
+
+    Attrs:
+        - serializer_class: defines serializer class for this APIView
+        - permission_classes: defines permissions for this APIView
+    """
+    serializer_class = GoalSerializer
+    permission_classes: list = [permissions.IsAuthenticated, GoalPermissions]
+
+    def get_queryset(self) -> QuerySet[ArchivedGoal]:
+        """Method to redefine queryset for archived goal"""
+        return ArchivedGoal.objects.select_related('category').visible_to(self.request.user)
+
+    @extend_schema(
+        request=None,
+        description="Restore archived goal with its comments, goal gets 'to do' status",
+        summary="Restore archived goal",
+    )
+    def post(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to handle POST request
+
+        Returns:
+            - Response with restored goal
+
+        Raises:
+            - Http404 (if goal was restored by a concurrent request)
+            - ValidationError (if category of goal is deleted)
+        """
+        goal = restore_goal(self.get_object())
+        return Response(self.get_serializer(goal).data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,276 @@
+from typing import Any, Awaitable, Callable
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Prefetch, QuerySet
+from django.http import Http404
+from django.http.response import HttpResponseBase
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.serializers.values import ValuesSerializer
+from goals.views.board import BoardDetailView, BoardListView
+from goals.views.cache import ResponseCacheMixin
+from goals.views.category import CategoryDetailView, CategoryListView
+from goals.views.comment import CommentDetailView, CommentListView
+from goals.views.goal import GoalDetailView, GoalListView
+
+
+# ----------------------------------------------------------------
+# async pagination
+class AsyncLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination which evaluates count and page with Django's async ORM
+    """
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> list | None:
+        """
+        Async counterpart of LimitOffsetPagination.paginate_queryset
+
+        Params:
+            - queryset: filtered queryset of the view
+            - request: DRF Request
+            - view: APIView
+
+        Returns:
+            - list of entities of current page or None if pagination was not requested
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.count = await queryset.acount()
+        self.offset = self.get_offset(request)
+        if self.count == 0 or self.offset > self.count:
+            return []
+        return [entity async for entity in queryset[self.offset:self.offset + self.limit]]
+
+
+# ----------------------------------------------------------------
+# async mixins
+class AsyncReadMixin:
+    """
+    Mixin to serve GET and HEAD requests of a generic view with Django's async ORM
+
+    Authentication, permissions and filter backends are reused from the synchronous view and
+    run in a worker thread, the queries of the handler itself are awaited. Every other method
+    is delegated to the synchronous view as is, so write logic stays in one place.
+
+    Serializers are rendered on the event loop, so get_queryset of a concrete view must load
+    every relation its serializer touches (select_related/prefetch_related).
+    """
+    pagination_class = AsyncLimitOffsetPagination
+    # GET handler of concrete mixins (AsyncListMixin, AsyncRetrieveMixin)
+    aget: Callable[..., Awaitable[HttpResponseBase]]
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Callable:
+        """
+        Method to build async view function around the synchronous DRF view
+
+        Returns:
+            - coroutine function usable in urlpatterns
+        """
+        sync_view: Callable = super().as_view(**initkwargs)  # type: ignore
+
+        async def view(request: Any, *args: tuple, **kwargs: dict) -> Response:
+            if request.method not in ('GET', 'HEAD'):
+                return await sync_to_async(sync_view)(request, *args, **kwargs)
+            self = cls(**initkwargs)
+            self.setup(request, *args, **kwargs)  # type: ignore
+            return await self.adispatch(request, *args, **kwargs)
+
+        view.cls = cls  # type: ignore
+        view.initkwargs = initkwargs  # type: ignore
+        view.csrf_exempt = True  # type: ignore
+        view.__doc__ = cls.__doc__
+        view.__module__ = cls.__module__
+        return view
+
+    async def adispatch(self, request: Any, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Async counterpart of APIView.dispatch for safe methods
+
+        Params:
+            - request: HttpRequest
+            - args: positional arguments
+            - kwargs: named (keyword) arguments
+
+        Returns:
+            - finalized Response
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)  # type: ignore
+        self.request = request
+        self.headers = self.default_response_headers  # type: ignore
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)  # type: ignore
+            response = await self.aget(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)  # type: ignore
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)  # type: ignore
+        return self.response
+
+    async def afilter_queryset(self) -> QuerySet:
+        """
+        Method to build filtered queryset, filter backends may query database during validation
+
+        Returns:
+            - QuerySet
+        """
+        return await sync_to_async(self.filter_queryset)(self.get_queryset())  # type: ignore
+
+
+class AsyncListMixin(AsyncReadMixin):
+    """
+    Mixin to serve list endpoints with Django's async ORM, views are ValuesListMixin views
+    """
+    async def aget(self, request: Request, *args: tuple, **kwargs: dict) -> HttpResponseBase:
+        """
+        Method to serve list from response cache of ResponseCacheMixin views
+
+        Returns:
+            - cached or rendered response
+        """
+        if isinstance(self, ResponseCacheMixin):
+            return await self.acached_list(lambda: self.alist(request, *args, **kwargs))
+        return await self.alist(request, *args, **kwargs)
+
+    async def alist(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Async counterpart of ListModelMixin.list
+
+        Returns:
+            - Response with list of entities (paginated if limit was passed)
+        """
+        queryset: QuerySet = await self.afilter_queryset()
+        values: ValuesSerializer | None = self.values_serializer()  # type: ignore
+        if values is not None:
+            queryset = queryset.values(*values.columns)
+        page: list | None = await self.paginator.apaginate_queryset(  # type: ignore
+            queryset, request, view=self
+        )
+        rows: list = page if page is not None else [entity async for entity in queryset]
+        if values is not None:
+            data: list = values.render_many(rows)
+        else:
+            data = self.get_serializer(rows, many=True).data  # type: ignore
+        if page is not None:
+            return self.get_paginated_response(data)  # type: ignore
+        return Response(data)
+
+
+class AsyncRetrieveMixin(AsyncReadMixin):
+    """
+    Mixin to serve detail endpoints with Django's async ORM
+    """
+    async def aget_object(self) -> Model:
+        """
+        Async counterpart of GenericAPIView.get_object
+
+        Returns:
+            - entity found by lookup field
+
+        Raises:
+            - Http404
+            - PermissionDenied
+        """
+        queryset: QuerySet = await self.afilter_queryset()
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field  # type: ignore
+        filter_kwargs: dict = {self.lookup_field: self.kwargs[lookup_url_kwarg]}  # type: ignore
+        try:
+            entity: Model = await queryset.aget(**filter_kwargs)
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+        await sync_to_async(self.check_object_permissions)(self.request, entity)  # type: ignore
+        return entity
+
+    async def aget(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Async counterpart of RetrieveModelMixin.retrieve
+
+        Returns:
+            - Response with one entity
+        """
+        entity: Model = await self.aget_object()
+        return Response(self.get_serializer(entity).data)  # type: ignore
+
+
+# ----------------------------------------------------------------
+# board views
+class AsyncBoardListView(AsyncListMixin, BoardListView):
+    """
+    Async variant of BoardListView
+    """
+
+
+class AsyncBoardDetailView(AsyncRetrieveMixin, BoardDetailView):
+    """
+    Async variant of BoardDetailView
+    """
+    def get_queryset(self) -> QuerySet[Board]:
+        return super().get_queryset().prefetch_related(
+            Prefetch('participants', queryset=BoardParticipant.objects.select_related('user'))
+        )
+
+
+# ----------------------------------------------------------------
+# category views
+class AsyncCategoryListView(AsyncListMixin, CategoryListView):
+    """
+    Async variant of CategoryListView
+    """
+    def get_queryset(self) -> QuerySet[GoalCategory]:
+        return super().get_queryset().select_related('user')
+
+
+class AsyncCategoryDetailView(AsyncRetrieveMixin, CategoryDetailView):
+    """
+    Async variant of CategoryDetailView
+    """
+    def get_queryset(self) -> QuerySet[GoalCategory]:
+        return super().get_queryset().select_related('user')
+
+
+# ----------------------------------------------------------------
+# goal views
+class AsyncGoalListView(AsyncListMixin, GoalListView):
+    """
+    Async variant of GoalListView
+    """
+    def get_queryset(self) -> QuerySet[Goal]:
+        return super().get_queryset().select_related('user')
+
+
+class AsyncGoalDetailView(AsyncRetrieveMixin, GoalDetailView):
+    """
+    Async variant of GoalDetailView
+    """
+    def get_queryset(self) -> QuerySet[Goal]:
+        return super().get_queryset().select_related('user')
+
+
+# ----------------------------------------------------------------
+# comment views
+class AsyncCommentListView(AsyncListMixin, CommentListView):
+    """
+    Async variant of CommentListView
+    """
+    def get_queryset(self) -> QuerySet[Comment]:
+        return super().get_queryset().select_related('user')
+
+
+class AsyncCommentDetailView(AsyncRetrieveMixin, CommentDetailView):
+    """
+    Async variant of CommentDetailView
+    """
+    def get_queryset(self) -> QuerySet[Comment]:
+        return super().get_queryset().select_related('user')
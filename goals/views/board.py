@@ -1,15 +1,28 @@
+from dataclasses import asdict
+from typing import Iterable
+
 from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
-from drf_spectacular.utils import extend_schema
-from rest_framework import generics, permissions, status
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, inline_serializer
+from rest_framework import generics, permissions, serializers, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from goals.counters import clear_counters
 from goals.models.board import Board
 from goals.models.goal import Goal
-from goals.permissions import BoardPermissions
+from goals.permissions import BoardImportPermissions, BoardPermissions
 from goals.serializers.board import BoardCreateSerializer, BoardListSerializer, BoardSerializer
+from goals.summary import cached_board_summary
+from goals.transfer import EXPORT_FORMATS, IMPORT_FORMATS, ImportResult, board_goals, import_goals, iterate_goals
+from goals.versioning import touch
+from goals.views.values import SPARSE_FIELDS_PARAMETERS, ValuesListMixin
 
 
 # ----------------------------------------------------------------
@@ -37,7 +50,7 @@ class BoardCreateView(generics.CreateAPIView):
 
 
 @extend_schema(tags=['Board'])
-class BoardListView(generics.ListAPIView):
+class BoardListView(ValuesListMixin, generics.ListAPIView):
     """
     View to handle GET request to get list of board entities
 
@@ -59,14 +72,12 @@ class BoardListView(generics.ListAPIView):
         Returns:
             - QuerySet
         """
-        return Board.objects.filter(
-            participants__user=self.request.user,  # type: ignore
-            is_deleted=False
-        )
+        return Board.objects.visible_to(self.request.user)
 
     @extend_schema(
         description="Get list of boards",
         summary="Boards list",
+        parameters=SPARSE_FIELDS_PARAMETERS,
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
@@ -91,10 +102,7 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
         Returns:
             - QuerySet
         """
-        return Board.objects.filter(
-            participants__user=self.request.user,  # type: ignore
-            is_deleted=False
-        )
+        return Board.objects.visible_to(self.request.user)
 
     def update(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         """
@@ -127,12 +135,17 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
             - Board entity with updated field is_deleted and updated related entities (delete status fields)
         """
         with transaction.atomic():
+            # board row (by save), categories, then goals, as other writes of board content lock them
             entity.is_deleted = True
             entity.save()
-            entity.categories.update(is_deleted=True)
-            Goal.objects.filter(category__board=entity).update(
-                status=Goal.Status.archived
+            entity.categories.update(is_deleted=True, updated=timezone.now())
+            clear_counters(entity.categories.all())
+            Goal.objects.filter(board=entity).update(
+                status=Goal.Status.archived,
+                updated=timezone.now()
             )
+            touch(entity.categories.all(), resync=True)
+            touch(Goal.objects.filter(board=entity), resync=True)
 
     @extend_schema(
         description="Get one board",
@@ -162,3 +175,171 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
     )
     def delete(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().delete(request, *args, **kwargs)
+
+
+@extend_schema(tags=['Board'])
+class BoardSummaryView(generics.GenericAPIView):
+    """
+    View to handle GET request to get goal counts of board instead of downloading the goal list
+
+    Attrs:
+        - permission_classes: defines permissions for this APIView
+    """
+    permission_classes: tuple = (permissions.IsAuthenticated, BoardPermissions)
+
+    def get_queryset(self) -> QuerySet[Board]:
+        """
+        Method to define queryset to get board by some filters
+
+        Returns:
+            - QuerySet
+        """
+        return Board.objects.visible_to(self.request.user)
+
+    @extend_schema(
+        description="Get goal counts of board by category, status and priority, number of overdue goals "
+                    "(due date has passed, goal is not done or archived) and open goals of each participant. "
+                    "Summary is cached until board version changes",
+        summary="Board summary",
+        responses=inline_serializer('BoardSummary', {
+            'board': serializers.IntegerField(),
+            'version': serializers.IntegerField(),
+            'generated': serializers.DateTimeField(),
+            'total': serializers.IntegerField(),
+            'overdue': serializers.IntegerField(),
+            'categories': inline_serializer('BoardSummaryCategory', {
+                'id': serializers.IntegerField(),
+                'title': serializers.CharField(),
+                'is_deleted': serializers.BooleanField(),
+                'total': serializers.IntegerField(),
+                'overdue': serializers.IntegerField(),
+                'counts': inline_serializer('BoardSummaryCount', {
+                    'status': serializers.IntegerField(),
+                    'priority': serializers.IntegerField(),
+                    'count': serializers.IntegerField(),
+                }, many=True),
+            }, many=True),
+            'participants': inline_serializer('BoardSummaryParticipant', {
+                'user': serializers.IntegerField(),
+                'username': serializers.CharField(),
+                'role': serializers.IntegerField(),
+                'open': serializers.IntegerField(),
+            }, many=True),
+        }),
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        return Response(cached_board_summary(self.get_object()))
+
+
+@extend_schema(tags=['Board'])
+class BoardExportView(generics.GenericAPIView):
+    """
+    View to handle GET request to stream all goals of board with their comments as CSV or JSON lines
+
+    Attrs:
+        - permission_classes: defines permissions for this APIView
+    """
+    permission_classes: tuple = (permissions.IsAuthenticated, BoardPermissions)
+
+    def get_queryset(self) -> QuerySet[Board]:
+        """
+        Method to define queryset to get board by some filters
+
+        Returns:
+            - QuerySet
+        """
+        return Board.objects.visible_to(self.request.user)
+
+    @extend_schema(
+        description="Export goals of board with category, status, priority, due date, author and comments. "
+                    "Format is defined by extension: csv or jsonl",
+        summary="Export board",
+        responses={(200, 'text/csv'): bytes, (200, 'application/x-ndjson'): bytes},
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> StreamingHttpResponse:
+        """
+        Method to handle GET request
+
+        Returns:
+            - StreamingHttpResponse with file attachment
+
+        Raises:
+            - Http404 (unknown format or board is not available)
+        """
+        export_format: str = kwargs['export_format']
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+        board: Board = self.get_object()
+        content_type, exporter = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(exporter(iterate_goals(board_goals(board))), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="board-{board.id}.{export_format}"'
+        return response
+
+
+@extend_schema(tags=['Board'])
+class BoardImportView(generics.GenericAPIView):
+    """
+    View to handle POST request to create goals of board from uploaded CSV or JSON lines file
+
+    Attrs:
+        - permission_classes: defines permissions for this APIView
+        - parser_classes: multipart form with file field, other bodies are read as the file itself
+    """
+    permission_classes: tuple = (permissions.IsAuthenticated, BoardImportPermissions)
+    parser_classes: list = [MultiPartParser]
+
+    def get_queryset(self) -> QuerySet[Board]:
+        """
+        Method to define queryset to get board by some filters
+
+        Returns:
+            - QuerySet
+        """
+        return Board.objects.visible_to(self.request.user)
+
+    @extend_schema(
+        description="Create goals of board from file in format of board export (csv or jsonl, defined by extension). "
+                    "File is sent as 'file' field of multipart form or as request body. "
+                    "Categories are referenced by title, missing ones are created. "
+                    "Invalid rows are reported by number and do not abort the import",
+        summary="Import goals into board",
+        request={
+            'multipart/form-data': inline_serializer('BoardImportFile', {'file': serializers.FileField()}),
+            'text/csv': OpenApiTypes.BINARY,
+            'application/x-ndjson': OpenApiTypes.BINARY,
+        },
+        responses=inline_serializer('BoardImportResult', {
+            'rows': serializers.IntegerField(),
+            'created': serializers.IntegerField(),
+            'categories_created': serializers.IntegerField(),
+            'failed': serializers.IntegerField(),
+            'skipped': serializers.IntegerField(),
+            'errors': serializers.ListField(child=serializers.DictField()),
+        }),
+    )
+    def post(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to handle POST request
+
+        Returns:
+            - Response with status 200 and import summary
+
+        Raises:
+            - Http404 (unknown format or board is not available)
+            - PermissionDenied (user is reader of board)
+            - ValidationError (multipart form without file)
+        """
+        import_format: str = kwargs['import_format']
+        if import_format not in IMPORT_FORMATS:
+            raise Http404
+        board: Board = self.get_object()
+        if request.content_type.startswith('multipart/form-data'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                raise ValidationError({'file': ['No file was submitted.']})
+            lines: Iterable[bytes] = upload
+        else:
+            # body is read line by line from the input stream, not loaded at once
+            lines = request._request
+        result: ImportResult = import_goals(board, request, IMPORT_FORMATS[import_format](lines))
+        return Response(asdict(result), status=status.HTTP_200_OK)
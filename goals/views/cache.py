@@ -0,0 +1,147 @@
+import asyncio
+import time
+from hashlib import sha256
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.http.response import HttpResponseBase
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals.models.board import Board
+from todolist.db.routers import on_primary
+
+# interval of checks of a response rendered by another request
+POLL_SECONDS: float = 0.05
+
+
+def response_cache_key(request: Request, boards: list[tuple[int, int]]) -> str:
+    """
+    Cache key of list response: path, query parameters in order of names and visible boards with their
+    versions. Users seeing the same boards share entries, any change of a board makes new keys
+
+    Params:
+        - request: request of list
+        - boards: id and version of every board visible to the user
+
+    Returns:
+        - key
+    """
+    params: list[tuple[str, str]] = sorted(
+        ((name, value) for name, values in request.query_params.lists() for value in values), key=lambda item: item[0]
+    )
+    digest: str = sha256(f'{request.path}?{urlencode(params)}|{boards}'.encode()).hexdigest()
+    return f'list-response:{digest}'
+
+
+# ----------------------------------------------------------------
+# response cache mixin
+class ResponseCacheMixin:
+    """
+    Mixin of list views to serve rendered JSON responses from cache for RESPONSE_CACHE_SECONDS. A hit costs
+    one query of board versions, queryset and serializer are skipped. Concurrent misses of a key are
+    single-flight: the first request renders the response, others wait for it up to RESPONSE_CACHE_WAIT_SECONDS.
+    Versions and missed responses are read from primary, so an entry is never older than the versions of its key
+    """
+    def cache_key(self) -> str | None:
+        """
+        Method to get cache key of the request
+
+        Returns:
+            - key or None if the response is not cached
+        """
+        request: Request = self.request  # type: ignore
+        if not settings.RESPONSE_CACHE_SECONDS or request.accepted_renderer.format != 'json':
+            return None
+        with on_primary():
+            boards: list[tuple[int, int]] = list(
+                Board.objects.visible_to(request.user).order_by('id').values_list('id', 'version')
+            )
+        return response_cache_key(request, boards)
+
+    def rendered(self, response: Response) -> HttpResponseBase:
+        """Method to render response of the view, as dispatch does after the handler"""
+        response = self.finalize_response(self.request, response)  # type: ignore
+        response.render()
+        if response.status_code == 200:
+            response['X-Response-Cache'] = 'miss'
+        return response
+
+    def from_cache(self, entry: tuple[str, bytes]) -> HttpResponse:
+        content_type, content = entry
+        response: HttpResponse = HttpResponse(content, content_type=content_type)
+        response['X-Response-Cache'] = 'hit'
+        return response
+
+    def cached_list(self, render: Callable[[], Response]) -> HttpResponseBase:
+        """
+        Method to get response from cache or render it once for concurrent requests
+
+        Params:
+            - render: handler rendering the response
+
+        Returns:
+            - cached or rendered response
+        """
+        key: str | None = self.cache_key()
+        if key is None:
+            return render()
+        lock: str = f'{key}:lock'
+        entry: tuple[str, bytes] | None = cache.get(key)
+        owner: bool = entry is None and cache.add(lock, 1, settings.RESPONSE_CACHE_WAIT_SECONDS)
+        if entry is None and not owner:
+            deadline: float = time.monotonic() + settings.RESPONSE_CACHE_WAIT_SECONDS
+            while entry is None and time.monotonic() < deadline and cache.get(lock) is not None:
+                time.sleep(POLL_SECONDS)
+                entry = cache.get(key)
+        if entry is not None:
+            return self.from_cache(entry)
+        try:
+            with on_primary():
+                response: HttpResponseBase = self.rendered(render())
+            if response.status_code == 200:
+                cache.set(key, (response['Content-Type'], response.content), settings.RESPONSE_CACHE_SECONDS)
+        finally:
+            if owner:
+                cache.delete(lock)
+        return response
+
+    async def acached_list(self, render: Callable[[], Awaitable[Response]]) -> HttpResponseBase:
+        """
+        Async counterpart of cached_list
+
+        Params:
+            - render: async handler rendering the response
+
+        Returns:
+            - cached or rendered response
+        """
+        key: str | None = await sync_to_async(self.cache_key)()
+        if key is None:
+            return await render()
+        lock: str = f'{key}:lock'
+        entry: tuple[str, bytes] | None = await cache.aget(key)
+        owner: bool = entry is None and await cache.aadd(lock, 1, settings.RESPONSE_CACHE_WAIT_SECONDS)
+        if entry is None and not owner:
+            deadline: float = time.monotonic() + settings.RESPONSE_CACHE_WAIT_SECONDS
+            while entry is None and time.monotonic() < deadline and await cache.aget(lock) is not None:
+                await asyncio.sleep(POLL_SECONDS)
+                entry = await cache.aget(key)
+        if entry is not None:
+            return self.from_cache(entry)
+        try:
+            with on_primary():
+                response: HttpResponseBase = self.rendered(await render())
+            if response.status_code == 200:
+                await cache.aset(key, (response['Content-Type'], response.content), settings.RESPONSE_CACHE_SECONDS)
+        finally:
+            if owner:
+                await cache.adelete(lock)
+        return response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return self.cached_list(lambda: super(ResponseCacheMixin, self).list(request, *args, **kwargs))  # type: ignore
@@ -1,5 +1,6 @@
 from django.db import transaction
 from django.db.models import QuerySet
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, permissions, filters
@@ -7,10 +8,14 @@ from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from goals.models.category import GoalCategory
+from goals.counters import clear_counters
+from goals.models.category import GoalCategory, lock_categories
 from goals.models.goal import Goal
 from goals.permissions import CategoryPermissions
 from goals.serializers.category import CategoryCreateSerializer, CategorySerializer
+from goals.versioning import touch
+from goals.views.cache import ResponseCacheMixin
+from goals.views.values import SPARSE_FIELDS_PARAMETERS, SparseFieldsMixin, ValuesListMixin
 
 
 # ----------------------------------------------------------------
@@ -38,7 +43,7 @@ class CategoryCreateView(generics.CreateAPIView):
 
 
 @extend_schema(tags=['Category'])
-class CategoryListView(generics.ListAPIView):
+class CategoryListView(ResponseCacheMixin, ValuesListMixin, generics.ListAPIView):
     """
     View to handle GET request to get list of category entities
 
@@ -71,22 +76,19 @@ class CategoryListView(generics.ListAPIView):
         Returns:
             - QuerySet
         """
-        return GoalCategory.objects.select_related('board').filter(
-            board__participants__user=self.request.user,
-            board__is_deleted=False,
-            is_deleted=False
-        )
+        return GoalCategory.objects.select_related('board').visible_to(self.request.user)
 
     @extend_schema(
         description="Get list of categories",
         summary="Categories list",
+        parameters=SPARSE_FIELDS_PARAMETERS,
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
 
 
 @extend_schema(tags=['Category'])
-class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CategoryDetailView(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     View to handle GET, PUT, DELETE requests of definite category entity
 
@@ -104,11 +106,7 @@ class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
         Returns:
             - QuerySet
         """
-        return GoalCategory.objects.select_related('board').filter(
-            board__participants__user=self.request.user,
-            board__is_deleted=False,
-            is_deleted=False
-        )
+        return GoalCategory.objects.select_related('board').visible_to(self.request.user)
 
     def perform_destroy(self, entity: GoalCategory) -> None:
         """
@@ -121,13 +119,18 @@ class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
             - Category entity with updated field is_deleted and updated related entities (delete status fields)
         """
         with transaction.atomic():
+            # board and category rows before goals, as other writes of board content lock them
+            lock_categories([entity.id])
             entity.is_deleted = True
-            entity.save(update_fields=('is_deleted',))
-            entity.goal_set.update(status=Goal.Status.archived)
+            entity.save(update_fields=('is_deleted', 'updated'))
+            clear_counters(GoalCategory.objects.filter(id=entity.id))
+            entity.goal_set.update(status=Goal.Status.archived, updated=timezone.now())
+            touch(entity.goal_set.all(), resync=True)
 
     @extend_schema(
         description="Get one category",
         summary="Retrieve category",
+        parameters=SPARSE_FIELDS_PARAMETERS,
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
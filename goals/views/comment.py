@@ -1,15 +1,20 @@
 from django.db.models import QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
-from rest_framework import generics, permissions, filters
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
+from rest_framework import generics, permissions, filters, serializers
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from goals.filters import CommentFilter
 from goals.models.comment import Comment
-from goals.models.goal import Goal
 from goals.permissions import CommentPermissions
 from goals.serializers.comment import CommentCreateSerializer, CommentSerializer
+from goals.serializers.expand import COMMENT_EXPANSIONS
+from goals.views.cache import ResponseCacheMixin
+from goals.views.expand import ExpandMixin, expand_parameter
+from goals.views.values import SPARSE_FIELDS_PARAMETERS, ValuesListMixin
 
 
 # ----------------------------------------------------------------
@@ -37,7 +42,7 @@ class CommentCreateView(generics.CreateAPIView):
 
 
 @extend_schema(tags=['Comment'])
-class CommentListView(generics.ListAPIView):
+class CommentListView(ResponseCacheMixin, ExpandMixin, ValuesListMixin, generics.ListAPIView):
     """
     View to handle GET request to get list of comment entities
 
@@ -46,18 +51,20 @@ class CommentListView(generics.ListAPIView):
         - serializer_class: defines serializer class for this APIView
         - pagination_class: defines pagination type for this APIView
         - filter_backends: defines collection of filtering options for this APIView
-        - filterset_fields: defines collection of fields to filter
+        - filterset_class: defines fields to filter
         - ordering_fields: defines collection of ordering options for this APIView
         - ordering: defines base ordering for this APIView
+        - expansions: defines relations which can be expanded
     """
     permission_classes: list = [permissions.IsAuthenticated, CommentPermissions]
     serializer_class = CommentSerializer
+    expansions: dict = COMMENT_EXPANSIONS
     pagination_class = LimitOffsetPagination
     filter_backends: tuple = (
         DjangoFilterBackend,
         filters.OrderingFilter,
     )
-    filterset_fields: tuple = ('goal__category__board', 'goal')
+    filterset_class = CommentFilter
     ordering_fields: tuple = ('created', 'updated')
     ordering: tuple = ('-created',)
 
@@ -68,31 +75,30 @@ class CommentListView(generics.ListAPIView):
         Returns:
             - QuerySet
         """
-        return Comment.objects.select_related('goal').filter(
-            goal__category__board__participants__user=self.request.user,
-            goal__category__board__is_deleted=False,
-            goal__category__is_deleted=False,
-        ).exclude(goal__status=Goal.Status.archived)
+        return Comment.objects.select_related('goal').visible_to(self.request.user)
 
     @extend_schema(
         description="Get list of comments",
         summary="Comments list",
+        parameters=[*SPARSE_FIELDS_PARAMETERS, expand_parameter(COMMENT_EXPANSIONS)],
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
 
 
 @extend_schema(tags=['Comment'])
-class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CommentDetailView(ExpandMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     View to handle GET, PUT, DELETE requests of definite comment entity
 
     Attrs:
         - serializer_class: defines serializer class for this APIView
         - permission_classes: defines permissions for this APIView
+        - expansions: defines relations which can be expanded
     """
     serializer_class = CommentSerializer
     permission_classes: list = [permissions.IsAuthenticated, CommentPermissions]
+    expansions: dict = COMMENT_EXPANSIONS
 
     def get_queryset(self) -> QuerySet[Comment]:
         """
@@ -101,15 +107,12 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
         Returns:
             - QuerySet
         """
-        return Comment.objects.select_related('goal').filter(
-            goal__category__board__participants__user=self.request.user,
-            goal__category__board__is_deleted=False,
-            goal__category__is_deleted=False,
-        ).exclude(goal__status=Goal.Status.archived)
+        return Comment.objects.select_related('goal').visible_to(self.request.user)
 
     @extend_schema(
         description="Get one comment",
         summary="Retrieve comment",
+        parameters=[*SPARSE_FIELDS_PARAMETERS, expand_parameter(COMMENT_EXPANSIONS)],
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
@@ -135,3 +138,93 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
     )
     def delete(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().delete(request, *args, **kwargs)
+
+
+@extend_schema(tags=['Comment'])
+class CommentLatestView(generics.GenericAPIView):
+    """
+    View to handle GET request to get the latest comments of several goals with one query
+
+    Attrs:
+        - permission_classes: defines permissions for this APIView
+        - serializer_class: defines serializer class for this APIView
+        - max_goals: maximum number of goals in one request
+        - max_limit: maximum number of comments per goal
+    """
+    permission_classes: list = [permissions.IsAuthenticated]
+    serializer_class = CommentSerializer
+    max_goals: int = 100
+    max_limit: int = 20
+
+    def get_goals(self) -> list[int]:
+        """
+        Method to parse goal ids from repeated or comma separated goal parameter
+
+        Returns:
+            - list of unique goal ids in requested order
+
+        Raises:
+            - ValidationError
+        """
+        values: list[str] = [
+            value for param in self.request.query_params.getlist('goal') for value in param.split(',') if value
+        ]
+        try:
+            goals: list[int] = list(dict.fromkeys(int(value) for value in values))
+        except ValueError:
+            raise ValidationError({'goal': ['Goal ids must be integers']})
+        if not goals:
+            raise ValidationError({'goal': ['This parameter is required']})
+        if len(goals) > self.max_goals:
+            raise ValidationError({'goal': [f'Ensure there are no more than {self.max_goals} goals']})
+        return goals
+
+    def get_limit(self) -> int:
+        """
+        Method to parse number of comments per goal
+
+        Returns:
+            - limit, 3 by default
+
+        Raises:
+            - ValidationError
+        """
+        try:
+            limit: int = int(self.request.query_params.get('limit', 3))
+        except ValueError:
+            raise ValidationError({'limit': ['A valid integer is required']})
+        if not 1 <= limit <= self.max_limit:
+            raise ValidationError({'limit': [f'Ensure limit is between 1 and {self.max_limit}']})
+        return limit
+
+    @extend_schema(
+        description="Get the latest comments of each of given goals (up to 100), comments of all goals "
+                    "are read by one window query. Goals which are not visible have no comments",
+        summary="Latest comments of goals",
+        parameters=[
+            OpenApiParameter('goal', int, many=True, description='goal ids, repeated or comma separated'),
+            OpenApiParameter('limit', int, description='comments per goal, 3 by default, 20 at most'),
+        ],
+        responses=inline_serializer('GoalLatestComments', {
+            'goal': serializers.IntegerField(),
+            'comments': CommentSerializer(many=True),
+        }, many=True),
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to handle GET request
+
+        Returns:
+            - Response with goal ids and their comments from the latest one, in requested order
+
+        Raises:
+            - ValidationError (if goal ids or limit are malformed)
+        """
+        goals: list[int] = self.get_goals()
+        comments: dict[int, list[Comment]] = {goal: [] for goal in goals}
+        latest = Comment.objects.visible_to(request.user).filter(goal__in=goals).latest_per_goal(self.get_limit())
+        for comment in latest.prefetch_related('user'):
+            comments[comment.goal_id].append(comment)
+        return Response([
+            {'goal': goal, 'comments': self.get_serializer(rows, many=True).data} for goal, rows in comments.items()
+        ])
@@ -0,0 +1,77 @@
+from django.conf import settings
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import permissions
+from rest_framework.request import Request
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+from goals.serializers.expand import Expansion, expand_queryset, expand_serializer, parse
+from goals.serializers.values import ValuesSerializer
+from goals.views.values import SparseFieldsMixin
+
+
+def expand_parameter(expansions: dict[str, Expansion]) -> OpenApiParameter:
+    """OpenAPI parameter of expand with the top level expansions of an endpoint"""
+    return OpenApiParameter(
+        'expand', str,
+        description=f'comma separated relations to inline ({", ".join(expansions)}), '
+                    f'nested by dots up to {settings.EXPAND_MAX_DEPTH} relations, e.g. category.board'
+    )
+
+
+# ----------------------------------------------------------------
+# expand mixin
+class ExpandMixin(SparseFieldsMixin):
+    """
+    Mixin of read views to inline related entities listed in expand parameter instead of their ids.
+    Expanded relations are loaded with the queryset, so no query is made per rendered entity
+
+    Attrs:
+        - expansions: relations of the view entity which can be expanded
+    """
+    expansions: dict[str, Expansion] = {}
+
+    def expanded(self) -> dict[str, dict]:
+        """
+        Method to parse expand parameter of GET request, relations not selected by sparse fields are skipped
+
+        Returns:
+            - tree of expansions
+
+        Raises:
+            - ValidationError (if expansion is unknown or too deep)
+        """
+        if hasattr(self, '_expanded'):
+            return self._expanded
+        request: Request = self.request  # type: ignore
+        self._expanded: dict[str, dict] = {}
+        if request.method not in permissions.SAFE_METHODS or 'expand' not in request.query_params:
+            return self._expanded
+        tree: dict[str, dict] = parse(request.query_params['expand'], self.expansions, settings.EXPAND_MAX_DEPTH)
+        selected: frozenset | None = self.selected_fields()
+        self._expanded = {name: tree[name] for name in tree if selected is None or name in selected}
+        return self._expanded
+
+    def available_fields(self) -> tuple[str, ...]:
+        fields: tuple[str, ...] = super().available_fields()
+        return fields + tuple(name for name in self.expansions if name not in fields)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.expanded():
+            return queryset
+        return expand_queryset(queryset, self.expanded(), self.expansions, self.request.user)  # type: ignore
+
+    def get_serializer(self, *args, **kwargs) -> BaseSerializer:
+        serializer: BaseSerializer = super().get_serializer(*args, **kwargs)
+        if self.expanded():
+            expand_serializer(
+                serializer.child if isinstance(serializer, ListSerializer) else serializer,  # type: ignore
+                self.expanded(), self.expansions
+            )
+        return serializer
+
+    def values_serializer(self) -> ValuesSerializer | None:
+        """Expanded lists are rendered by the serializer"""
+        if self.expanded():
+            return None
+        return super().values_serializer()  # type: ignore
@@ -1,16 +1,22 @@
 from django.db import transaction
 from django.db.models import QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import generics, permissions, filters
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from goals.filters import GoalDateFilter
+from goals.models.comment import comment_summary
 from goals.models.goal import Goal
 from goals.permissions import GoalPermissions
-from goals.serializers.goal import GoalCreateSerializer, GoalSerializer
+from goals.positions import move_goal
+from goals.serializers.expand import GOAL_EXPANSIONS
+from goals.serializers.goal import GoalCommentsSerializer, GoalCreateSerializer, GoalMoveSerializer, GoalSerializer
+from goals.views.cache import ResponseCacheMixin
+from goals.views.expand import ExpandMixin, expand_parameter
+from goals.views.values import SPARSE_FIELDS_PARAMETERS, ValuesListMixin
 
 
 # ----------------------------------------------------------------
@@ -38,7 +44,7 @@ class GoalCreateView(generics.CreateAPIView):
 
 
 @extend_schema(tags=['Goal'])
-class GoalListView(generics.ListAPIView):
+class GoalListView(ResponseCacheMixin, ExpandMixin, ValuesListMixin, generics.ListAPIView):
     """
     View to handle GET request to get list of goal entities
 
@@ -51,21 +57,30 @@ class GoalListView(generics.ListAPIView):
         - ordering_fields: defines collection of ordering options for this APIView
         - ordering: defines base ordering for this APIView
         - search_fields: defines collection of search options for this APIView
+        - expansions: defines relations which can be expanded
     """
     permission_classes: list = [permissions.IsAuthenticated, GoalPermissions]
     serializer_class = GoalSerializer
+    expansions: dict = GOAL_EXPANSIONS
     pagination_class = LimitOffsetPagination
     filter_backends: tuple = (
         DjangoFilterBackend,
         filters.OrderingFilter,
         filters.SearchFilter,
     )
-    filterset_fields: tuple = ('category__board', 'category')
+    filterset_fields: tuple = ('board', 'category')
     filterset_class = GoalDateFilter
-    ordering_fields: tuple = ('priority', 'due_date')
+    ordering_fields: tuple = ('priority', 'due_date', 'status', 'position')
     ordering: tuple = ('title',)
     search_fields: tuple = ('title',)
 
+    def with_comments(self) -> bool:
+        """Method to check if number of comments and the latest comment are requested"""
+        return self.request.query_params.get('comments', '').lower() in ('1', 'true')
+
+    def get_serializer_class(self) -> type[GoalSerializer]:
+        return GoalCommentsSerializer if self.with_comments() else GoalSerializer
+
     def get_queryset(self) -> QuerySet[Goal]:
         """
         Method to define queryset to get goal by some filters
@@ -73,39 +88,42 @@ class GoalListView(generics.ListAPIView):
         Returns:
             - QuerySet
         """
-        return Goal.objects.select_related('category').filter(
-            category__board__participants__user=self.request.user,
-            category__board__is_deleted=False,
-            category__is_deleted=False
-        ).exclude(status=Goal.Status.archived)
+        queryset: QuerySet[Goal] = Goal.objects.select_related('category').visible_to(self.request.user)
+        if self.with_comments():
+            queryset = queryset.annotate(**comment_summary())
+        return queryset
 
     @extend_schema(
-        description="Get list of goals",
+        description="Get list of goals. With comments=true each goal has number of comments and the latest "
+                    "comment, read in the same query",
         summary="Goals list",
+        parameters=[
+            OpenApiParameter('comments', bool, description='add comment_count and last_comment'),
+            *SPARSE_FIELDS_PARAMETERS,
+            expand_parameter(GOAL_EXPANSIONS),
+        ],
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
 
 
 @extend_schema(tags=['Goal'])
-class GoalDetailView(generics.RetrieveUpdateDestroyAPIView):
+class GoalDetailView(ExpandMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     View to handle GET, PUT, DELETE requests of definite goal entity
 
     Attrs:
         - serializer_class: defines serializer class for this APIView
         - permission_classes: defines permissions for this APIView
+        - expansions: defines relations which can be expanded
     """
     serializer_class = GoalSerializer
     permission_classes: list = [permissions.IsAuthenticated, GoalPermissions]
+    expansions: dict = GOAL_EXPANSIONS
 
     def get_queryset(self) -> QuerySet[Goal]:
         """Method to redefine queryset for goal"""
-        return Goal.objects.select_related('category').filter(
-            category__board__participants__user=self.request.user,
-            category__board__is_deleted=False,
-            category__is_deleted=False
-        ).exclude(status=Goal.Status.archived)
+        return Goal.objects.select_related('category').visible_to(self.request.user)
 
     def perform_destroy(self, entity: Goal) -> None:
         """
@@ -119,13 +137,14 @@ class GoalDetailView(generics.RetrieveUpdateDestroyAPIView):
         """
         with transaction.atomic():
             entity.status = Goal.Status.archived
-            entity.save(update_fields=('status',))
+            entity.save(update_fields=('status', 'updated'))
             for comment in entity.comment_set.all():
                 comment.delete()
 
     @extend_schema(
         description="Get one goal",
         summary="Retrieve goal",
+        parameters=[*SPARSE_FIELDS_PARAMETERS, expand_parameter(GOAL_EXPANSIONS)],
     )
     def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().get(request, *args, **kwargs)
@@ -151,3 +170,43 @@ class GoalDetailView(generics.RetrieveUpdateDestroyAPIView):
     )
     def delete(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
         return super().delete(request, *args, **kwargs)
+
+
+@extend_schema(tags=['Goal'])
+class GoalMoveView(generics.GenericAPIView):
+    """
+    View to handle POST request to move goal to a place in a kanban column
+
+    Attrs:
+        - serializer_class: defines serializer class for this APIView
+        - permission_classes: defines permissions for this APIView
+    """
+    serializer_class = GoalMoveSerializer
+    permission_classes: list = [permissions.IsAuthenticated, GoalPermissions]
+
+    def get_queryset(self) -> QuerySet[Goal]:
+        """Method to redefine queryset for goal"""
+        return Goal.objects.select_related('category').visible_to(self.request.user)
+
+    @extend_schema(
+        description="Change status, category and position of goal together. Goal is placed after or before "
+                    "a goal of the target column, at the bottom of the column without both. Only the moved goal "
+                    "is changed",
+        summary="Move goal",
+        responses=GoalSerializer,
+    )
+    def post(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to handle POST request
+
+        Returns:
+            - Response with moved goal
+
+        Raises:
+            - ValidationError (if column or neighbour are not valid)
+        """
+        goal: Goal = self.get_object()
+        serializer = self.get_serializer(data=request.data, context={**self.get_serializer_context(), 'goal': goal})
+        serializer.is_valid(raise_exception=True)
+        goal = move_goal(goal, **serializer.validated_data)
+        return Response(GoalSerializer(goal, context=self.get_serializer_context()).data)
@@ -0,0 +1,107 @@
+import asyncio
+import io
+import json
+from typing import Any, Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+
+from goals.live import OVERFLOW, broker, get_backend
+from goals.models.board import Board
+
+
+# ----------------------------------------------------------------
+# server-sent events
+def authorize(scope: dict) -> list[int] | None:
+    """
+    Function to authenticate session of stream request and get boards to stream. Runs in a worker thread,
+    which database connections are closed before return: open streams do not hold connections
+
+    Params:
+        - scope: ASGI scope of request
+
+    Returns:
+        - ids of boards which user participates in (filtered by ?board=) or None if user is not authenticated
+    """
+    try:
+        request: ASGIRequest = ASGIRequest(scope, io.BytesIO())
+        SessionMiddleware(lambda _: None).process_request(request)
+        user: Any = auth.get_user(request)
+        if not user.is_authenticated:
+            return None
+        boards: Any = Board.objects.visible_to(user)
+        if request.GET.getlist('board'):
+            boards = boards.filter(id__in=[int(board) for board in request.GET.getlist('board') if board.isdigit()])
+        return list(boards.values_list('id', flat=True))
+    finally:
+        connections.close_all()
+
+
+def encode(event: dict) -> bytes:
+    return f'event: change\ndata: {json.dumps(event)}\n\n'.encode()
+
+
+async def respond(send: Callable, status: int, body: bytes) -> None:
+    await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', b'text/plain')]})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def disconnected(receive: Callable) -> None:
+    """Waits until client disconnects"""
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def events(scope: dict, receive: Callable, send: Callable) -> None:
+    """
+    ASGI application of GET /goals/events: stream of changes of goals, categories and comments of user's boards.
+    Each event has board, entity, id and action (created, updated, deleted), clients fetch the changes by
+    /goals/sync. Bulk changes of a board are sent as one event of board entity with changed action and
+    new version. Event with overflow entity ends the stream, when client does not keep up with changes.
+    Served from process memory of the broker, boards joined after stream start need a reconnect
+
+    Params:
+        - scope: ASGI scope of request
+        - receive: ASGI receive callable
+        - send: ASGI send callable
+    """
+    if scope['method'] != 'GET':
+        return await respond(send, 405, b'Method not allowed')
+    boards: list[int] | None = await sync_to_async(authorize, thread_sensitive=False)(scope)
+    if boards is None:
+        return await respond(send, 401, b'Authentication credentials were not provided')
+
+    get_backend().start()
+    subscription: Any = broker.subscribe(boards, settings.LIVE_EVENTS_QUEUE_SIZE)
+    disconnect: asyncio.Future = asyncio.ensure_future(disconnected(receive))
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', b'text/event-stream'),
+            (b'cache-control', b'no-cache'),
+            (b'x-accel-buffering', b'no'),
+        ]})
+        await send({'type': 'http.response.body', 'body': b'retry: 3000\n\n', 'more_body': True})
+        while True:
+            event: asyncio.Future = asyncio.ensure_future(subscription.queue.get())
+            done, _ = await asyncio.wait(
+                {event, disconnect}, timeout=settings.LIVE_EVENTS_KEEPALIVE_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnect in done:
+                event.cancel()
+                return
+            if event not in done:
+                event.cancel()
+                await send({'type': 'http.response.body', 'body': b': keepalive\n\n', 'more_body': True})
+                continue
+            await send({'type': 'http.response.body', 'body': encode(event.result()), 'more_body': True})
+            if event.result() is OVERFLOW:
+                await send({'type': 'http.response.body', 'body': b''})
+                return
+    finally:
+        broker.unsubscribe(subscription)
+        disconnect.cancel()
@@ -0,0 +1,46 @@
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals.serializers.sync import SyncSerializer
+from goals.sync import changes_since, parse_cursor
+
+
+# ----------------------------------------------------------------
+# sync view
+@extend_schema(tags=['Sync'])
+class SyncView(generics.GenericAPIView):
+    """
+    View to handle GET request to get changes of user's boards since cursor
+
+    Attrs:
+        - permission_classes: defines permissions for this APIView
+        - serializer_class: defines serializer class for this APIView
+    """
+    permission_classes: tuple = (permissions.IsAuthenticated,)
+    serializer_class = SyncSerializer
+
+    @extend_schema(
+        description="Get boards, participants, categories, goals and comments changed since cursor and tombstones "
+                    "of removed ones. Without cursor all visible content is returned. Pass returned cursor "
+                    "to next request",
+        summary="Changes since cursor",
+        parameters=[OpenApiParameter('cursor', str, description='cursor returned by previous sync')],
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to handle GET request
+
+        Returns:
+            - Response with changes
+
+        Raises:
+            - ValidationError (if cursor is malformed)
+        """
+        try:
+            known: dict[int, int] = parse_cursor(request.query_params.get('cursor', ''))
+        except ValueError:
+            raise ValidationError({'cursor': ['Malformed cursor, start with empty one']})
+        return Response(self.get_serializer(changes_since(request.user, known)).data)
@@ -0,0 +1,108 @@
+from django.conf import settings
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+from goals.serializers.values import ValuesSerializer, prune, readable_fields, values_serializer
+
+SPARSE_FIELDS_PARAMETERS: list[OpenApiParameter] = [
+    OpenApiParameter('fields', str, description='comma separated fields to render, all by default'),
+    OpenApiParameter('exclude', str, description='comma separated fields not to render'),
+]
+
+
+# ----------------------------------------------------------------
+# sparse fields mixin
+class SparseFieldsMixin:
+    """
+    Mixin of read views to render only fields listed in fields parameter (or all except ones listed in
+    exclude parameter). Columns of other fields are not loaded and relations of other nested serializers
+    are not joined
+    """
+    def available_fields(self) -> tuple[str, ...]:
+        """Method to get names of fields which can be selected"""
+        return readable_fields(self.get_serializer_class())  # type: ignore
+
+    def selected_fields(self) -> frozenset | None:
+        """
+        Method to parse fields and exclude parameters of GET request
+
+        Returns:
+            - names of rendered fields or None if all fields are rendered
+
+        Raises:
+            - ValidationError (if unknown field is given)
+        """
+        if hasattr(self, '_selected_fields'):
+            return self._selected_fields
+        request: Request = self.request  # type: ignore
+        self._selected_fields: frozenset | None = None
+        if request.method not in permissions.SAFE_METHODS:
+            return None
+        available: tuple[str, ...] = self.available_fields()
+        selected: set[str] = set(available)
+        for param in ('fields', 'exclude'):
+            if param not in request.query_params:
+                continue
+            names: set[str] = {name.strip() for name in request.query_params[param].split(',') if name.strip()}
+            if unknown := names - set(available):
+                raise ValidationError({param: [f'Unknown fields: {", ".join(sorted(unknown))}']})
+            selected = selected & names if param == 'fields' else selected - names
+        if len(selected) < len(available):
+            self._selected_fields = frozenset(selected)
+        return self._selected_fields
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)  # type: ignore
+        selected: frozenset | None = self.selected_fields()
+        if selected is None:
+            return queryset
+        return prune(queryset, self.get_serializer_class()(), selected)  # type: ignore
+
+    def get_serializer(self, *args, **kwargs) -> BaseSerializer:
+        serializer: BaseSerializer = super().get_serializer(*args, **kwargs)  # type: ignore
+        selected: frozenset | None = self.selected_fields()
+        if selected is not None:
+            fields = (serializer.child if isinstance(serializer, ListSerializer) else serializer).fields  # type: ignore
+            for name in [name for name in fields if name not in selected]:
+                fields.pop(name)
+        return serializer
+
+
+# ----------------------------------------------------------------
+# values mixin
+class ValuesListMixin(SparseFieldsMixin):
+    """
+    Mixin of list views to render values() rows of the filtered queryset with ValuesSerializer
+    of the view serializer. Views with serializers which fields are not columns (or with FAST_LISTS
+    turned off) are rendered by the serializer as usual
+    """
+    def values_serializer(self) -> ValuesSerializer | None:
+        """
+        Method to get ValuesSerializer of the view serializer
+
+        Returns:
+            - ValuesSerializer or None if list is rendered by the serializer
+        """
+        if not settings.FAST_LISTS:
+            return None
+        return values_serializer(self.get_serializer_class(), self.selected_fields())  # type: ignore
+
+    def list(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to render list of entities, paginated if limit was passed
+
+        Returns:
+            - Response with the same data as ListModelMixin.list
+        """
+        serializer: ValuesSerializer | None = self.values_serializer()
+        if serializer is None:
+            return super().list(request, *args, **kwargs)  # type: ignore
+        queryset = self.filter_queryset(self.get_queryset()).values(*serializer.columns)  # type: ignore
+        page: list | None = self.paginate_queryset(queryset)  # type: ignore
+        if page is not None:
+            return self.get_paginated_response(serializer.render_many(page))  # type: ignore
+        return Response(serializer.render_many(list(queryset)))
@@ -0,0 +1,97 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.utils import timezone
+
+from bot.models import Reminder, TgUser
+from bot.tg.reminders import RateLimiter, collect_digests, deliver
+from goals.models.goal import Goal
+from tests.factories import BoardParticipantFactory, CategoryFactory, GoalFactory, UserFactory
+
+
+class Client:
+    """Telegram client which records messages, responses are returned in order and ok afterwards"""
+    def __init__(self, *responses: Any) -> None:
+        self.messages: list[tuple[int, str]] = []
+        self.responses: list = list(responses)
+
+    def send_message(self, chat_id: int, text: str) -> Any:
+        self.messages.append((chat_id, text))
+        return self.responses.pop(0) if self.responses else type('Response', (), {'ok': True})()
+
+
+def tg_user(user: Any, chat_id: int, status: int = TgUser.Status.verified) -> TgUser:
+    return TgUser.objects.create(
+        tg_chat_id=chat_id, tg_user_id=chat_id, user=user, verification_code='code', status=status
+    )
+
+
+# ----------------------------------------------------------------
+# reminders tests
+class TestReminders:
+    @pytest.mark.django_db
+    def test_reminders(self) -> None:
+        """
+        Due date reminders test
+
+        Checks:
+            - active goals due within windows are sent to verified users of their boards in one digest per chat
+            - next run sends nothing, goal entering smaller window or with changed due date is sent again
+
+        Raises:
+            AssertionError
+        """
+        now: Any = timezone.now()
+        user: Any = UserFactory.create()
+        board: Any = BoardParticipantFactory.create(user=user).board
+        tg_user(user, 10)
+        member: Any = BoardParticipantFactory.create(board=board, user=UserFactory.create()).user
+        tg_user(member, 20, TgUser.Status.not_verified)
+        category: Any = CategoryFactory.create(board=board, user=user)
+        soon, later = (GoalFactory.create(category=category, user=user, due_date=now + timedelta(hours=hours))
+                       for hours in (2, 5))
+        GoalFactory.create(category=category, user=user, due_date=now + timedelta(hours=1), status=Goal.Status.done)
+        GoalFactory.create(category=category, user=user, due_date=now + timedelta(hours=30))
+        GoalFactory.create(category=CategoryFactory.create(user=user), user=user, due_date=now + timedelta(hours=1))
+        client: Client = Client()
+
+        def run(at: Any) -> int:
+            return deliver(collect_digests(at, (24, 1)), client, RateLimiter(1000))
+
+        first: int = run(now)
+        repeated: int = run(now + timedelta(minutes=10))
+        entered: int = run(now + timedelta(hours=1, minutes=30))
+        later.due_date = now + timedelta(hours=3)
+        later.save()
+        moved: int = run(now + timedelta(hours=1, minutes=30))
+
+        assert (first, repeated, entered, moved) == (1, 0, 1, 1), 'Wrong digests are sent'
+        assert [chat for chat, _ in client.messages] == [10, 10, 10], 'Messages are sent to wrong chats'
+        assert f'#{soon.id} ' in client.messages[0][1] and f'#{later.id} ' in client.messages[0][1], \
+            'Digest has no due goals'
+        assert f'#{soon.id} ' in client.messages[1][1] and f'#{later.id} ' not in client.messages[1][1], \
+            'Goal entering smaller window is not reminded'
+        assert Reminder.objects.count() == 4, 'Reminders are not recorded'
+
+    @pytest.mark.django_db
+    def test_retry(self) -> None:
+        """
+        Reminders test for rate limited sending
+
+        Checks:
+            - digest is sent again after 429 response and not recorded until sent
+
+        Raises:
+            AssertionError
+        """
+        user: Any = UserFactory.create()
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        tg_user(user, 10)
+        GoalFactory.create(category=category, user=user, due_date=timezone.now() + timedelta(hours=2))
+        client: Client = Client({'ok': False, 'error_code': 429, 'parameters': {'retry_after': 0}})
+
+        delivered: int = deliver(collect_digests(timezone.now(), (24,)), client, RateLimiter(1000))
+
+        assert delivered == 1 and len(client.messages) == 2, 'Digest is not retried'
+        assert Reminder.objects.count() == 1, 'Reminder is not recorded'
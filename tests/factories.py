@@ -57,6 +57,7 @@ class GoalFactory(AbstractFactory):
         model: Type[Goal] = Goal
 
     category: factory.SubFactory = factory.SubFactory(CategoryFactory)
+    board: factory.SelfAttribute = factory.SelfAttribute('category.board')
 
 
 # ----------------------------------------------------------------
@@ -67,3 +68,4 @@ class CommentFactory(factory.django.DjangoModelFactory):
 
     text: factory.Sequence = factory.Sequence(lambda x: f"testComment_{x}")
     goal: factory.SubFactory = factory.SubFactory(GoalFactory)
+    board: factory.SelfAttribute = factory.SelfAttribute('goal.board')
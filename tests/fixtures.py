@@ -1,6 +1,7 @@
 from typing import Any
 
 import pytest
+from django.core.cache import cache
 
 from core.models import User
 from tests.factories import UserFactory
@@ -65,3 +66,10 @@ def user_not_auth(client: Any) -> User:
     )
     user_db: User = User.objects.get(username=user_factory.username)
     return user_db
+
+
+# ----------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> None:
+    """Cached list responses of previous tests may have the same board ids and versions"""
+    cache.clear()
@@ -0,0 +1,166 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.http import Http404
+from django.utils import timezone
+
+from goals.archive import restore_goal
+from goals.models.archive import ArchivedComment, ArchivedGoal
+from goals.models.board import BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.models.tombstone import Tombstone
+from tests.factories import BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory, UserFactory
+
+
+def archive(goal: Goal, days: int) -> None:
+    goal.status = Goal.Status.archived
+    goal.save()
+    Goal.objects.filter(id=goal.id).update(updated=timezone.now() - timedelta(days=days))
+
+
+# ----------------------------------------------------------------
+# archive tests
+class TestArchive:
+    @pytest.mark.django_db
+    def test_archive_goals(self, user_auth: dict[str, Any]) -> None:
+        """
+        Archive command test
+
+        Params:
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - goals archived longer than given days are moved with comments to archive tables
+            - recently archived and active goals stay
+            - removals are recorded as tombstones
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        old, recent, active = GoalFactory.create_batch(3, category=category, user=user)
+        comments: list = CommentFactory.create_batch(2, goal=old, user=user)
+        archive(old, 40)
+        archive(recent, 10)
+
+        call_command('archive_goals', days=30, batch_size=1)
+
+        assert list(Goal.objects.values_list('id', flat=True).order_by('id')) == [recent.id, active.id], \
+            'Wrong goals are archived'
+        assert list(ArchivedGoal.objects.values_list('id', 'title')) == [(old.id, old.title)], 'Goal is not moved'
+        assert sorted(ArchivedComment.objects.values_list('id', flat=True)) == [comment.id for comment in comments], \
+            'Comments are not moved'
+        assert not Comment.objects.exists(), 'Comments stay in hot table'
+        assert sorted(Tombstone.objects.values_list('entity', 'entity_id')) == sorted(
+            [('comment', comment.id) for comment in comments] + [('goal', old.id)]
+        ), 'Removals are not recorded'
+
+    @pytest.mark.django_db
+    def test_archived_goal_list(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Archived goal list and detail test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - archived goals of user's boards are listed, goals of other boards are not
+            - detail has comments of archived goal
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        goal: Any = GoalFactory.create(category=category, user=user)
+        comment: Any = CommentFactory.create(goal=goal, user=user)
+        stranger: Any = UserFactory.create()
+        other: Any = GoalFactory.create(category=CategoryFactory.create(user=stranger), user=stranger)
+        archive(goal, 40)
+        archive(other, 40)
+        call_command('archive_goals', days=30)
+
+        response: Any = client.get('/goals/archive/goal/list', {'limit': 10})
+        detail: Any = client.get(f'/goals/archive/goal/{goal.id}')
+        hidden: Any = client.get(f'/goals/archive/goal/{other.id}')
+
+        assert [row['id'] for row in response.data['results']] == [goal.id], 'Wrong archived goals are listed'
+        assert [row['id'] for row in detail.data['comments']] == [comment.id], 'Comments are not shown'
+        assert hidden.status_code == 404, 'Archived goal of other board is shown'
+
+    @pytest.mark.django_db
+    def test_restore(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Archived goal restore test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - reader can not restore goal
+            - restored goal gets to_do status and is counted, its comments are restored
+            - goal of deleted category can not be restored
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(user=user).board
+        category: Any = CategoryFactory.create(board=board, user=user)
+        goal, deleted = GoalFactory.create_batch(2, category=category, user=user)
+        deleted.category = CategoryFactory.create(board=board, user=user)
+        deleted.save()
+        comment: Any = CommentFactory.create(goal=goal, user=user)
+        archive(goal, 40)
+        archive(deleted, 40)
+        call_command('archive_goals', days=30)
+        GoalCategory.objects.filter(id=deleted.category_id).update(is_deleted=True)
+
+        BoardParticipant.objects.filter(board=board, user=user).update(role=BoardParticipant.Role.reader)
+        forbidden: Any = client.post(f'/goals/archive/goal/{goal.id}/restore')
+        BoardParticipant.objects.filter(board=board, user=user).update(role=BoardParticipant.Role.writer)
+        response: Any = client.post(f'/goals/archive/goal/{goal.id}/restore')
+        rejected: Any = client.post(f'/goals/archive/goal/{deleted.id}/restore')
+
+        assert forbidden.status_code == 403, 'Reader restored goal'
+        assert response.status_code == 201, 'Goal is not restored'
+        assert response.data['id'] == goal.id and response.data['status'] == Goal.Status.to_do, 'Wrong goal restored'
+        assert list(Comment.objects.filter(goal=goal.id).values_list('id', flat=True)) == [comment.id], \
+            'Comments are not restored'
+        assert not ArchivedGoal.objects.filter(id=goal.id).exists(), 'Goal stays in archive'
+        assert GoalCategory.objects.get(id=category.id).goals_open == 1, 'Restored goal is not counted'
+        assert rejected.status_code == 400, 'Goal of deleted category is restored'
+
+    @pytest.mark.django_db
+    def test_restore_twice(self, user: Any) -> None:
+        """
+        Concurrent restore test: both requests read the archived goal, the second one restores it after the first
+
+        Params:
+            - user: A fixture that create user instance
+
+        Checks:
+            - the second restore finds no archived goal (404) and the goal is restored once
+
+        Raises:
+            AssertionError
+        """
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        goal: Any = GoalFactory.create(category=category, user=user)
+        archive(goal, 40)
+        call_command('archive_goals', days=30)
+        first, second = (ArchivedGoal.objects.get(id=goal.id) for _ in range(2))
+
+        restore_goal(first)
+        with pytest.raises(Http404):
+            restore_goal(second)
+
+        assert Goal.objects.filter(id=goal.id).count() == 1, 'Goal is not restored once'
+        assert GoalCategory.objects.get(id=category.id).goals_open == 1, 'Goal is counted twice'
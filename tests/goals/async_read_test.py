@@ -0,0 +1,169 @@
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from goals.serializers.board import BoardSerializer
+from goals.serializers.goal import GoalSerializer
+from goals.views.async_read import AsyncBoardDetailView, AsyncGoalDetailView, AsyncGoalListView
+from tests.factories import BoardParticipantFactory, CategoryFactory, GoalFactory, UserFactory
+
+
+# ----------------------------------------------------------------
+# async read views tests
+class TestAsyncRead:
+    factory: APIRequestFactory = APIRequestFactory()
+
+    def _call(self, view_class: Any, request: Any, **kwargs: Any) -> Any:
+        """
+        Helper to run async view function from synchronous test
+
+        Params:
+            - view_class: async view class
+            - request: request built by APIRequestFactory
+            - kwargs: url keyword arguments
+
+        Returns:
+            - rendered Response
+        """
+        response: Any = async_to_sync(view_class.as_view())(request, **kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    @pytest.mark.django_db(transaction=True)
+    def test_goal_list_paginated(self) -> None:
+        """
+        Async goal list test with limit/offset pagination
+
+        Checks:
+            - Response status code is 200
+            - count field equals to number of visible goals
+            - results field equals to GoalSerializer output of current page
+
+        Raises:
+            AssertionError
+        """
+        user: Any = UserFactory.create()
+        board_participant: Any = BoardParticipantFactory.create(user=user)
+        category: Any = CategoryFactory.create(board=board_participant.board, user=user)
+        goals: Any = GoalFactory.create_batch(3, category=category, user=user)
+        request: Any = self.factory.get('/goals/goal/list', {'limit': 2, 'ordering': 'title'})
+        force_authenticate(request, user=user)
+
+        response: Any = self._call(AsyncGoalListView, request)
+
+        assert response.status_code == 200, 'Status code error'
+        assert response.data.get('count') == 3, 'Wrong count'
+        assert response.data.get('results') == GoalSerializer(goals[:2], many=True).data, 'Wrong data expected'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_goal_detail_404(self) -> None:
+        """
+        Async goal retrieve test for user who is not a board participant
+
+        Checks:
+            - Response status code is 404
+
+        Raises:
+            AssertionError
+        """
+        goal: Any = GoalFactory.create(user=UserFactory.create(), category__user=UserFactory.create())
+        request: Any = self.factory.get(f'/goals/goal/{goal.id}')
+        force_authenticate(request, user=UserFactory.create())
+
+        response: Any = self._call(AsyncGoalDetailView, request, pk=goal.id)
+
+        assert response.status_code == 404, 'Status code error'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_board_detail(self) -> None:
+        """
+        Async board retrieve test with prefetched participants
+
+        Checks:
+            - Response status code is 200
+            - Response data equals to BoardSerializer output
+
+        Raises:
+            AssertionError
+        """
+        user: Any = UserFactory.create()
+        board_participant: Any = BoardParticipantFactory.create(user=user)
+        request: Any = self.factory.get(f'/goals/board/{board_participant.board.id}')
+        force_authenticate(request, user=user)
+
+        response: Any = self._call(AsyncBoardDetailView, request, pk=board_participant.board.id)
+
+        assert response.status_code == 200, 'Status code error'
+        assert response.data == BoardSerializer(board_participant.board).data, 'Wrong data expected'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_goal_list_403(self) -> None:
+        """
+        Async goal list test without authorization
+
+        Checks:
+            - Response status code is 403
+
+        Raises:
+            AssertionError
+        """
+        request: Any = self.factory.get('/goals/goal/list')
+
+        response: Any = self._call(AsyncGoalListView, request)
+
+        assert response.status_code == 403, 'Status code error'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_goal_sparse_fields(self) -> None:
+        """
+        Async goal list and retrieve test with fields parameter
+
+        Checks:
+            - Response status code is 200
+            - only requested fields are rendered, nested user is rendered from the joined row
+
+        Raises:
+            AssertionError
+        """
+        user: Any = UserFactory.create()
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        goal: Any = GoalFactory.create(category=category, user=user)
+        list_request: Any = self.factory.get('/goals/goal/list', {'fields': 'id,title'})
+        detail_request: Any = self.factory.get(f'/goals/goal/{goal.id}', {'fields': 'id,user'})
+        force_authenticate(list_request, user=user)
+        force_authenticate(detail_request, user=user)
+
+        listed: Any = self._call(AsyncGoalListView, list_request)
+        retrieved: Any = self._call(AsyncGoalDetailView, detail_request, pk=goal.id)
+
+        assert listed.status_code == 200 and retrieved.status_code == 200, 'Status code error'
+        assert listed.data == [{'id': goal.id, 'title': goal.title}], 'Wrong list fields'
+        assert retrieved.data == {
+            'id': goal.id, 'user': GoalSerializer(goal).data['user']
+        }, 'Wrong detail fields'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_goal_list_cached(self) -> None:
+        """
+        Async goal list test with response cache
+
+        Checks:
+            - repeated request is served from cache with the same content
+
+        Raises:
+            AssertionError
+        """
+        user: Any = UserFactory.create()
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        GoalFactory.create_batch(2, category=category, user=user)
+        responses: list = []
+        for _ in range(2):
+            request: Any = self.factory.get('/goals/goal/list', {'limit': 5})
+            force_authenticate(request, user=user)
+            responses.append(self._call(AsyncGoalListView, request))
+
+        assert [response['X-Response-Cache'] for response in responses] == ['miss', 'hit'], 'Response is not cached'
+        assert responses[0].content == responses[1].content, 'Cached response differs'
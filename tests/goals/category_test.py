@@ -340,7 +340,10 @@ class TestCategory:
             AssertionError
         """
         board_participant: Any = BoardParticipantFactory.create(user=user_auth.get('user'))
-        categories: Any = CategoryFactory.create_batch(3, board=board_participant.board, user=user_auth.get('user'))
+        categories: Any = [
+            CategoryFactory.create(board=board_participant.board, user=user_auth.get('user'), title=title)
+            for title in ('category_c', 'category_b', 'category_a')
+        ]
         categories[0].is_deleted = True
         categories[0].save()
         expected_response: list[ReturnDict] = [
@@ -0,0 +1,92 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories import BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory, UserFactory
+
+
+# ----------------------------------------------------------------
+# comment summary tests
+class TestCommentSummary:
+    @pytest.mark.django_db
+    def test_goal_list_comments(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Goal list with comments test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - with comments=true goals have number of comments and the latest comment
+            - goal without comments has zero count and no latest comment
+            - number of queries does not depend on number of goals
+            - without comments parameter the fields are not added
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        commented, empty = GoalFactory.create_batch(2, category=category, user=user)
+        comments: list = CommentFactory.create_batch(3, goal=commented, user=user)
+
+        with CaptureQueriesContext(connection) as few:
+            response: Any = client.get('/goals/goal/list', {'comments': 'true'})
+        GoalFactory.create_batch(5, category=category, user=user)
+        with CaptureQueriesContext(connection) as many:
+            client.get('/goals/goal/list', {'comments': 'true'})
+        plain: Any = client.get('/goals/goal/list')
+
+        rows: dict = {row['id']: row for row in response.data}
+        assert rows[commented.id]['comment_count'] == 3, 'Wrong number of comments'
+        assert rows[commented.id]['last_comment']['id'] == comments[-1].id, 'Wrong latest comment'
+        assert rows[commented.id]['last_comment']['user'] == user.username, 'Wrong author of latest comment'
+        assert rows[empty.id]['comment_count'] == 0 and rows[empty.id]['last_comment'] is None, \
+            'Goal without comments has comments'
+        assert len(many) == len(few), 'Comments are read by query per goal'
+        assert 'comment_count' not in plain.data[0], 'Comment fields are added without parameter'
+
+    @pytest.mark.django_db
+    def test_latest_comments(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Latest comments of goals test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - at most limit comments per goal from the latest one, goals in requested order
+            - goals of other boards have no comments
+            - malformed parameters are rejected
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        first, second = GoalFactory.create_batch(2, category=category, user=user)
+        comments: list = CommentFactory.create_batch(4, goal=first, user=user)
+        other: Any = CommentFactory.create(goal=second, user=user)
+        stranger: Any = UserFactory.create()
+        hidden: Any = GoalFactory.create(category=CategoryFactory.create(user=stranger), user=stranger)
+        CommentFactory.create(goal=hidden, user=stranger)
+
+        params: dict = {'goal': [f'{second.id},{first.id}', hidden.id], 'limit': 2}
+        response: Any = client.get('/goals/goal_comment/latest', params)
+        invalid: Any = client.get('/goals/goal_comment/latest', {'goal': 'abc'})
+        too_many: Any = client.get('/goals/goal_comment/latest', {'goal': ','.join(map(str, range(1, 102)))})
+        over_limit: Any = client.get('/goals/goal_comment/latest', {'goal': first.id, 'limit': 21})
+
+        assert response.status_code == 200, 'Latest comments are not returned'
+        assert [
+            (row['goal'], [comment['id'] for comment in row['comments']]) for row in response.data
+        ] == [
+            (second.id, [other.id]), (first.id, [comments[3].id, comments[2].id]), (hidden.id, []),
+        ], 'Wrong latest comments'
+        assert response.data[0]['comments'][0]['user']['username'] == user.username, 'Author is not shown'
+        assert {invalid.status_code, too_many.status_code, over_limit.status_code} == {400}, \
+            'Malformed parameters are accepted'
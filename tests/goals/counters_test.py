@@ -0,0 +1,183 @@
+import io
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from goals.models.board import Board
+from goals.models.category import GoalCategory
+from goals.models.goal import Goal
+from goals.positions import move_goal
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, GoalFactory
+
+
+def counters(entity: Any) -> tuple[int, int, int]:
+    """Counters of board or category as stored in database"""
+    entity.refresh_from_db()
+    return entity.goals_total, entity.goals_open, entity.goals_done
+
+
+# ----------------------------------------------------------------
+# goal counters tests
+class TestGoalCounters:
+    @pytest.mark.django_db
+    def test_goal_changes(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Goal counters test for goal writes through API
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - created, done, moved and archived goals change counters of categories and boards
+            - counters are returned in category list
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        work, home = CategoryFactory.create_batch(2, board=board, user=user)
+
+        goal: dict = client.post('/goals/goal/create', {'title': 'goal', 'category': work.id}).json()
+        client.post('/goals/goal/create', {'title': 'goal', 'category': work.id, 'status': 3})
+        client.patch(f'/goals/goal/{goal["id"]}', {'status': 2, 'category': home.id}, content_type='application/json')
+        after_move: tuple = (counters(work), counters(home), counters(board))
+        client.delete(f'/goals/goal/{goal["id"]}')
+        listed: list = client.get(f'/goals/goal_category/list?board={board.id}').json()
+
+        assert after_move == ((1, 0, 1), (1, 1, 0), (2, 1, 1)), 'Wrong counters after goal changes'
+        assert (counters(home), counters(board)) == ((0, 0, 0), (1, 0, 1)), 'Archived goal is counted'
+        assert [category['goals_done'] for category in listed] == [1, 0], 'Counters are not listed'
+
+    @pytest.mark.django_db
+    def test_stale_goal(self, user: Any) -> None:
+        """
+        Goal counters test for writes of goals read before a concurrent write
+
+        Params:
+            - user: A fixture that create user instance
+
+        Checks:
+            - goal changed after it was read by another write is counted from its stored state
+            - stale move of goal and deletion of stale goal leave counters consistent with goals
+
+        Raises:
+            AssertionError
+        """
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        work, home = CategoryFactory.create_batch(2, board=board, user=user)
+        created: Any = GoalFactory.create(category=work, user=user, status=Goal.Status.to_do)
+        first, second, third = (Goal.objects.get(id=created.id) for _ in range(3))
+
+        first.status = Goal.Status.done
+        first.save()
+        second.status = Goal.Status.done
+        second.save()
+        after_status: tuple = (counters(work), counters(board))
+        second.category = home
+        second.save()
+        third.delete()
+
+        assert after_status == ((1, 0, 1), (1, 0, 1)), 'Stale goal is counted twice'
+        assert (counters(work), counters(home), counters(board)) == ((0, 0, 0),) * 3, 'Counters drift'
+
+    @pytest.mark.django_db
+    def test_lock_order(self, user: Any) -> None:
+        """
+        Lock order test for writes of goals (SQLite drops FOR UPDATE, order of locking reads is checked)
+
+        Params:
+            - user: A fixture that create user instance
+
+        Checks:
+            - update, move and deletion of goal read board, then categories, then the goal row
+
+        Raises:
+            AssertionError
+        """
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        work, home = CategoryFactory.create_batch(2, board=board, user=user)
+        goal: Any = GoalFactory.create(category=work, user=user)
+        locks: list[str] = [
+            'FROM "goals_board" WHERE "goals_board"."id" IN',
+            'FROM "goals_goalcategory" WHERE "goals_goalcategory"."id" IN',
+            'SELECT "goals_goal"."category_id", "goals_goal"."board_id", "goals_goal"."status"',
+        ]
+
+        def order(change: Any) -> list[int]:
+            with CaptureQueriesContext(connection) as queries:
+                change()
+            sql: list[str] = [query['sql'] for query in queries.captured_queries]
+            return [next(number for number, text in enumerate(sql) if lock in text) for lock in locks]
+
+        goal.title = 'changed'
+        updated: list[int] = order(goal.save)
+        moved: list[int] = order(lambda: move_goal(goal, home, Goal.Status.done))
+        deleted: list[int] = order(goal.delete)
+
+        assert updated == sorted(updated), 'Updated goal is locked before its board and category'
+        assert moved == sorted(moved), 'Moved goal is locked before its board and categories'
+        assert deleted == sorted(deleted), 'Deleted goal is locked before its board and category'
+
+    @pytest.mark.django_db
+    def test_bulk_archive(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Goal counters test for categories and boards deleted with bulk archiving of goals
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - deleted category is subtracted from board
+            - deleted board and its categories have no goals counted
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        work, home = CategoryFactory.create_batch(2, board=board, user=user)
+        GoalFactory.create_batch(3, category=work, user=user, status=Goal.Status.to_do)
+        GoalFactory.create_batch(2, category=home, user=user, status=Goal.Status.done)
+
+        client.delete(f'/goals/goal_category/{work.id}')
+        after_category: tuple = (counters(work), counters(board))
+        client.delete(f'/goals/board/{board.id}')
+
+        assert after_category == ((0, 0, 0), (2, 0, 2)), 'Wrong counters after category deletion'
+        assert (counters(home), counters(board)) == ((0, 0, 0), (0, 0, 0)), 'Wrong counters of deleted board'
+
+    @pytest.mark.django_db
+    def test_reconcile(self, user: Any) -> None:
+        """
+        Reconciliation command test
+
+        Params:
+            - user: A fixture that create user instance
+
+        Checks:
+            - drifted counters are repaired, overdue goal is counted as open
+            - counters of boards without goals stay zero
+
+        Raises:
+            AssertionError
+        """
+        boards: list = BoardFactory.create_batch(3)
+        category: Any = CategoryFactory.create(board=boards[0], user=user)
+        GoalFactory.create(category=category, user=user, due_date=timezone.now() - timedelta(days=1))
+        GoalFactory.create(category=category, user=user, status=Goal.Status.archived)
+        GoalCategory.objects.update(goals_total=7, goals_open=0)
+        Board.objects.filter(id=boards[0].id).update(goals_done=5)
+
+        call_command('reconcile_counters', batch_size=2, stdout=io.StringIO())
+
+        assert counters(category) == (1, 1, 0), 'Category counters are not repaired'
+        assert counters(boards[0]) == (1, 1, 0), 'Board counters are not repaired'
+        assert counters(boards[2]) == (0, 0, 0), 'Wrong counters of empty board'
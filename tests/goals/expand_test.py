@@ -0,0 +1,90 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories import BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory
+
+
+def fill(user: Any, goals: int) -> Any:
+    """Goals of two categories with two comments each, returns the board"""
+    board: Any = BoardParticipantFactory.create(user=user).board
+    for category in CategoryFactory.create_batch(2, board=board, user=user):
+        for goal in GoalFactory.create_batch(goals, category=category, user=user):
+            CommentFactory.create_batch(2, goal=goal, user=user)
+    return board
+
+
+# ----------------------------------------------------------------
+# expand tests
+class TestExpand:
+    @pytest.mark.django_db
+    def test_goal_list(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Expanded goal list test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - category, its board and comments are inlined as rendered by their own endpoints
+            - number of queries does not depend on number of goals
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = fill(user, 1)
+        url: str = '/goals/goal/list?expand=category,category.board,comments'
+        with CaptureQueriesContext(connection) as few:
+            client.get(url)
+        fill(user, 3)
+        with CaptureQueriesContext(connection) as many:
+            response: Any = client.get(url)
+
+        goal: dict = next(goal for goal in response.json() if goal['category']['board']['id'] == board.id)
+        category: dict = client.get(f'/goals/goal_category/{goal["category"]["id"]}').json()
+        comments: list = client.get(f'/goals/goal_comment/list?goal={goal["id"]}&ordering=created').json()
+        listed_board: dict = next(entry for entry in client.get('/goals/board/list').json() if entry['id'] == board.id)
+
+        assert response.status_code == 200 and len(response.json()) == 8, 'Expanded list is not rendered'
+        assert goal['category'] == {**category, 'board': listed_board}, 'Wrong expanded category'
+        assert goal['comments'] == comments, 'Wrong expanded comments'
+        assert len(many) == len(few), 'Queries are made per goal'
+
+    @pytest.mark.django_db
+    def test_comment_detail(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Expanded comment test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - goal of comment and comments of the goal are inlined
+            - sparse fields select expansions, unknown and too deep expansions are rejected
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        fill(user, 1)
+        comment: Any = CommentFactory.create(goal=GoalFactory.create(user=user, category=CategoryFactory.create(
+            board=BoardParticipantFactory.create(user=user).board, user=user
+        )), user=user)
+
+        expanded: Any = client.get(f'/goals/goal_comment/{comment.id}?expand=goal.comments,board')
+        sparse: Any = client.get(f'/goals/goal/{comment.goal.id}?fields=id,comments&expand=comments,category')
+        unknown: Any = client.get(f'/goals/goal_comment/{comment.id}?expand=goal.owner')
+        deep: Any = client.get(f'/goals/goal_comment/{comment.id}?expand=goal.category.board')
+
+        assert expanded.json()['goal']['id'] == comment.goal.id, 'Goal is not expanded'
+        assert [entry['id'] for entry in expanded.json()['goal']['comments']] == [comment.id], 'Wrong comments'
+        assert expanded.json()['board']['id'] == comment.board_id, 'Board is not expanded'
+        assert sparse.json() == {
+            'id': comment.goal.id, 'comments': [expanded.json()['goal']['comments'][0]]
+        }, 'Wrong sparse expanded fields'
+        assert unknown.status_code == 400 and deep.status_code == 400, 'Wrong expansion is accepted'
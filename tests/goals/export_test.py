@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from typing import Any
+
+import pytest
+
+from goals.models.board import BoardParticipant
+from goals.transfer import board_goals, iterate_goals
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory
+
+
+# ----------------------------------------------------------------
+# board export tests
+class TestBoardExport:
+    def _board(self, user: Any, role: int = BoardParticipant.Role.reader) -> Any:
+        """
+        Helper to create board with 3 goals, first of them has 2 comments
+
+        Returns:
+            - board
+        """
+        participant: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user, role=role)
+        category: Any = CategoryFactory.create(board=participant.board, user=user, title='Работа')
+        goals: list = GoalFactory.create_batch(3, category=category, user=user)
+        CommentFactory.create_batch(2, goal=goals[0], user=user)
+        return participant.board
+
+    @pytest.mark.django_db
+    def test_export_csv(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Board export test in CSV format
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - reader of board gets streaming CSV attachment
+            - each goal row is followed by rows of its comments
+
+        Raises:
+            AssertionError
+        """
+        board: Any = self._board(user_auth.get('user'))
+
+        response: Any = client.get(f'/goals/board/{board.id}/export.csv')
+        rows: list[dict] = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+
+        assert response.status_code == 200, 'Board was not exported'
+        assert response['Content-Disposition'] == f'attachment; filename="board-{board.id}.csv"', 'Wrong file name'
+        assert [row['record'] for row in rows] == ['goal', 'comment', 'comment', 'goal', 'goal'], 'Wrong rows'
+        assert rows[0]['category'] == 'Работа', 'Wrong category'
+        assert rows[0]['author'] == user_auth.get('user').username, 'Wrong author'
+
+    @pytest.mark.django_db
+    def test_export_jsonl(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Board export test in JSON lines format
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - one line per goal with nested comments
+            - unknown format and board of other users are not found
+
+        Raises:
+            AssertionError
+        """
+        board: Any = self._board(user_auth.get('user'))
+        other_board: Any = BoardFactory.create()
+
+        response: Any = client.get(f'/goals/board/{board.id}/export.jsonl')
+        lines: list[dict] = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+        assert len(lines) == 3, 'Wrong number of goals'
+        assert [len(line['comments']) for line in lines] == [2, 0, 0], 'Wrong comments'
+        assert client.get(f'/goals/board/{board.id}/export.xml').status_code == 404, 'Unknown format exported'
+        assert client.get(f'/goals/board/{other_board.id}/export.csv').status_code == 404, 'Foreign board exported'
+
+    @pytest.mark.django_db
+    def test_keyset_chunks(self, user: Any, settings: Any) -> None:
+        """
+        Chunked reading test without server-side cursors (pgbouncer transaction pooling mode)
+
+        Params:
+            - user: user fixture
+            - settings: pytest-django settings fixture
+
+        Checks:
+            - keyset chunks return the same goals and comments as cursor iteration
+
+        Raises:
+            AssertionError
+        """
+        board: Any = self._board(user)
+        with_cursor: list = [(goal.id, len(goal.comment_set.all())) for goal in iterate_goals(board_goals(board), 2)]
+
+        settings.DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+        try:
+            keyset: list = [(goal.id, len(goal.comment_set.all())) for goal in iterate_goals(board_goals(board), 2)]
+        finally:
+            settings.DATABASES['default'].pop('DISABLE_SERVER_SIDE_CURSORS')
+
+        assert keyset == with_cursor, 'Keyset chunks differ from cursor iteration'
+        assert [comments for _, comments in keyset] == [2, 0, 0], 'Comments were not prefetched'
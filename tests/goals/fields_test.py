@@ -0,0 +1,90 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from goals.models.goal import Goal
+from tests.factories import BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory
+
+
+# ----------------------------------------------------------------
+# sparse fields tests
+class TestSparseFields:
+    @pytest.mark.django_db
+    @pytest.mark.parametrize('fast_lists', [True, False])
+    def test_goal_list(self, client: Any, user_auth: dict[str, Any], settings: Any, fast_lists: bool) -> None:
+        """
+        Sparse goal list test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+            - settings: A fixture to change settings
+            - fast_lists: render lists from values() rows or by serializer
+
+        Checks:
+            - only requested fields are rendered, values are the same as of the full list
+            - description column is not selected and user table is not joined
+            - excluded fields are not rendered, unknown fields are rejected
+
+        Raises:
+            AssertionError
+        """
+        settings.FAST_LISTS = fast_lists
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        GoalFactory.create_batch(3, category=category, user=user, description='long text')
+        requested: list[str] = ['id', 'title', 'status', 'due_date']
+
+        full: list[dict] = client.get('/goals/goal/list').json()
+        with CaptureQueriesContext(connection) as queries:
+            response: Any = client.get(f'/goals/goal/list?fields={",".join(requested)}')
+        sql: str = ' '.join(query['sql'] for query in queries.captured_queries if 'goals_goal' in query['sql'])
+
+        assert response.status_code == 200, 'Sparse list is not rendered'
+        assert response.json() == [{name: goal[name] for name in requested} for goal in full], 'Wrong fields'
+        assert '"description"' not in sql, 'Description column is selected'
+        assert 'core_user' not in sql, 'User table is joined'
+
+        excluded: Any = client.get('/goals/goal/list?exclude=description,user')
+        unknown: Any = client.get('/goals/goal/list?fields=id,password')
+        assert all(
+            set(goal) == set(full[0]) - {'description', 'user'} for goal in excluded.json()
+        ), 'Excluded fields are rendered'
+        assert unknown.status_code == 400, 'Unknown field is accepted'
+
+    @pytest.mark.django_db
+    def test_detail(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Sparse detail test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - detail views of goal and comment render requested fields only
+            - update renders all fields and writes are not affected by fields parameter
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        goal: Any = GoalFactory.create(category=category, user=user)
+        comment: Any = CommentFactory.create(goal=goal, user=user)
+
+        goal_response: Any = client.get(f'/goals/goal/{goal.id}?fields=id,category,user')
+        comment_response: Any = client.get(f'/goals/goal_comment/{comment.id}?exclude=text')
+        updated: Any = client.patch(
+            f'/goals/goal/{goal.id}?fields=id', {'title': 'renamed'}, content_type='application/json'
+        )
+
+        assert goal_response.json() == {
+            'id': goal.id, 'category': category.id, 'user': goal_response.json()['user']
+        }, 'Wrong goal fields'
+        assert goal_response.json()['user']['id'] == user.id, 'Nested user is not rendered'
+        assert 'text' not in comment_response.json() and 'id' in comment_response.json(), 'Wrong comment fields'
+        assert updated.json()['title'] == 'renamed', 'Update is not rendered in full'
+        assert Goal.objects.get(id=goal.id).title == 'renamed', 'Goal is not updated'
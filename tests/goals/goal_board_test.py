@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory
+
+
+# ----------------------------------------------------------------
+# board of goals and comments tests
+class TestGoalBoard:
+    @pytest.mark.django_db
+    def test_goal_moves(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Board of goal and its comments test when goal moves to category of another board
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - goal and comments take board of new category
+            - goals and comments are filtered by board (and former board filter name)
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board, other = (BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board for _ in '12')
+        goal: Any = GoalFactory.create(category=CategoryFactory.create(board=board, user=user), user=user)
+        CommentFactory.create_batch(2, goal=goal, user=user)
+
+        response: Any = client.patch(
+            f'/goals/goal/{goal.id}', {'category': CategoryFactory.create(board=other, user=user).id},
+            content_type='application/json',
+        )
+        listed: list = client.get(f'/goals/goal/list?board={other.id}').json()
+        former: list = client.get(f'/goals/goal_comment/list?goal__category__board={board.id}').json()
+
+        assert response.status_code == 200 and response.json()['board'] == other.id, 'Goal was not moved'
+        assert set(Comment.objects.values_list('board', flat=True)) == {other.id}, 'Comments were not moved'
+        assert [item['id'] for item in listed] == [goal.id], 'Goal is not listed by board'
+        assert former == [], 'Comments are listed by former board'
+
+    @pytest.mark.django_db
+    def test_visibility_without_categories(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Goal and comment visibility test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - permission checks of goal and comment read participants of board without joins
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        goal: Any = GoalFactory.create(category=CategoryFactory.create(board=board, user=user), user=user)
+        comment: Any = CommentFactory.create(goal=goal, user=user)
+
+        with CaptureQueriesContext(connection) as context:
+            statuses: list = [client.get(f'/goals/goal/{goal.id}').status_code,
+                              client.get(f'/goals/goal_comment/{comment.id}').status_code]
+        permission_queries: list = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT 1 AS "a" FROM "goals_boardparticipant"')
+        ]
+
+        assert statuses == [200, 200], 'Goal or comment is not available'
+        assert len(permission_queries) == 2, 'Permissions were not checked'
+        assert all('JOIN' not in sql for sql in permission_queries), 'Permissions join other tables'
@@ -0,0 +1,136 @@
+import io
+import json
+from typing import Any
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+
+from goals.models.board import BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, GoalFactory
+
+
+# ----------------------------------------------------------------
+# board import tests
+class TestBoardImport:
+    def _board(self, user: Any, role: int = BoardParticipant.Role.writer) -> Any:
+        """
+        Helper to create board with category "Работа"
+
+        Returns:
+            - board
+        """
+        participant: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user, role=role)
+        CategoryFactory.create(board=participant.board, user=user, title='Работа')
+        return participant.board
+
+    @pytest.mark.django_db
+    def test_import_csv(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Board import test in CSV format, exported file of another board is imported
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - goals are created in existing and new categories, comment rows are skipped
+            - invalid rows are reported by number and do not abort the import
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        source: Any = self._board(user)
+        GoalFactory.create(category=source.categories.get(), user=user, title='Первая', priority=4)
+        exported: bytes = b''.join(client.get(f'/goals/board/{source.id}/export.csv').streaming_content)
+        board: Any = self._board(user)
+        file: bytes = exported + (
+            'goal,,Дом,Вторая,,1,2,,,,,,\r\n'
+            'goal,,Дом,,,1,2,,,,,,\r\n'
+            'comment,1,,,,,,,,,,,text\r\n'
+            'goal,,Дом,Третья,,7,2,,,,,,\r\n'
+        ).encode()
+
+        response: Any = client.post(
+            f'/goals/board/{board.id}/import.csv', {'file': SimpleUploadedFile('goals.csv', file)}
+        )
+        result: dict[str, Any] = response.json()
+        goals: list = list(Goal.objects.filter(category__board=board).order_by('id').values_list(
+            'title', 'category__title', 'priority', 'user'
+        ))
+
+        assert response.status_code == 200, 'Goals were not imported'
+        assert goals == [('Первая', 'Работа', 4, user.id), ('Вторая', 'Дом', 2, user.id)], 'Wrong goals'
+        assert result['created'] == 2 and result['categories_created'] == 1, 'Wrong summary'
+        assert result['skipped'] == 1 and result['failed'] == 2, 'Wrong summary'
+        assert [error['row'] for error in result['errors']] == [3, 5], 'Wrong rows reported'
+        assert set(result['errors'][0]['errors']) == {'title'}, 'Wrong error reported'
+        assert set(result['errors'][1]['errors']) == {'status'}, 'Wrong error reported'
+
+    @pytest.mark.django_db
+    def test_import_jsonl(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Board import test in JSON lines format sent as request body
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - each chunk is written separately, missing category is created once
+            - unreadable lines are reported
+            - reader of board and unknown format are rejected
+
+        Raises:
+            AssertionError
+        """
+        board: Any = self._board(user_auth.get('user'))
+        lines: list[str] = [json.dumps({'category': 'Дом', 'title': f'Цель {number}'}) for number in range(3)]
+        body: str = '\n'.join(lines[:2] + ['[1]', '{broken', '', lines[2]])
+
+        response: Any = client.post(
+            f'/goals/board/{board.id}/import.jsonl', body, content_type='application/x-ndjson'
+        )
+        result: dict[str, Any] = response.json()
+        reader_board: Any = self._board(user_auth.get('user'), BoardParticipant.Role.reader)
+
+        assert response.status_code == 200, 'Goals were not imported'
+        assert result['created'] == 3 and result['categories_created'] == 1, 'Wrong summary'
+        assert [error['row'] for error in result['errors']] == [3, 4], 'Wrong rows reported'
+        assert GoalCategory.objects.filter(board=board, title='Дом').count() == 1, 'Category duplicated'
+        assert client.post(
+            f'/goals/board/{reader_board.id}/import.jsonl', body, content_type='application/x-ndjson'
+        ).status_code == 403, 'Reader imported goals'
+        assert client.post(
+            f'/goals/board/{board.id}/import.xml', body, content_type='application/xml'
+        ).status_code == 404, 'Unknown format imported'
+
+    @pytest.mark.django_db
+    def test_import_command(self, tmp_path: Any, user: Any) -> None:
+        """
+        Import management command test with chunks smaller than file
+
+        Params:
+            - tmp_path: temporary directory
+            - user: A fixture that create user instance
+
+        Checks:
+            - valid rows of all chunks are created
+
+        Raises:
+            AssertionError
+        """
+        board: Any = self._board(user)
+        path: Any = tmp_path / 'goals.csv'
+        path.write_text('category,title,priority\n' + ''.join(f'Работа,Цель {n},{n % 5}\n' for n in range(10)))
+        output = io.StringIO()
+
+        call_command(
+            'import_goals', board.id, str(path), user=user.username, chunk_size=3, stdout=output, stderr=io.StringIO()
+        )
+
+        assert Goal.objects.filter(category__board=board).count() == 8, 'Wrong number of goals'
+        assert 'rejected 2' in output.getvalue(), 'Wrong summary'
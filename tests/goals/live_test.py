@@ -0,0 +1,174 @@
+import asyncio
+import json
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings as django_settings
+from django.utils import timezone
+
+from goals.archive import archive_goals
+from goals.live import OVERFLOW, Broker
+from goals.models.board import Board
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, GoalFactory, UserFactory
+from todolist.asgi import application
+
+
+async def stream(cookies: dict, change: Any = None, query: bytes = b'') -> list[dict]:
+    """
+    Helper to open stream of board changes, make change while it is open and disconnect
+
+    Params:
+        - cookies: cookies of test client with session
+        - change: function making changes in database
+        - query: query string of request
+
+    Returns:
+        - ASGI messages sent by application
+    """
+    messages: list[dict] = []
+    received: asyncio.Queue = asyncio.Queue()
+    started: asyncio.Event = asyncio.Event()
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+        if message['type'] == 'http.response.start' or b'event: change' in message.get('body', b''):
+            started.set()
+
+    async def receive() -> dict:
+        return await received.get()
+
+    scope: dict = {
+        'type': 'http', 'method': 'GET', 'path': django_settings.LIVE_EVENTS_PATH, 'query_string': query,
+        'headers': [(b'cookie', '; '.join(f'{key}={value.value}' for key, value in cookies.items()).encode())],
+    }
+    task: asyncio.Task = asyncio.ensure_future(application(scope, receive, send))
+    await asyncio.wait_for(started.wait(), 5)
+    if change is not None:
+        started.clear()
+        await sync_to_async(change)()
+        await asyncio.wait_for(started.wait(), 5)
+    await received.put({'type': 'http.disconnect'})
+    await asyncio.wait_for(task, 5)
+    return messages
+
+
+def changes(messages: list[dict]) -> list[dict]:
+    body: str = b''.join(message.get('body', b'') for message in messages).decode()
+    return [json.loads(line[len('data: '):]) for line in body.splitlines() if line.startswith('data: ')]
+
+
+# ----------------------------------------------------------------
+# live events tests
+class TestLive:
+    @pytest.mark.django_db(transaction=True)
+    def test_events(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Stream of board changes test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - stream is a text/event-stream response
+            - created goal of user's board is streamed, changes of other boards are not
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        other: Any = CategoryFactory.create(board=BoardFactory.create(), user=UserFactory.create())
+        created: list = []
+
+        def change() -> None:
+            GoalFactory.create(category=other, user=other.user)
+            created.append(GoalFactory.create(category=category, user=user))
+
+        messages: list[dict] = async_to_sync(stream)(client.cookies, change)
+
+        assert messages[0]['status'] == 200, 'Status code error'
+        assert (b'content-type', b'text/event-stream') in messages[0]['headers'], 'Not an event stream'
+        assert changes(messages) == [
+            {'board': category.board_id, 'entity': 'goal', 'id': created[0].id, 'action': 'created'}
+        ], 'Wrong events are streamed'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_bulk_events(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Stream of board changes test for writes without model signals
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - archiving of goals is streamed as one board event with new version of board
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        goals: list = GoalFactory.create_batch(2, category=category, user=user)
+        Goal.objects.filter(category=category).update(
+            status=Goal.Status.archived, updated=timezone.now() - timedelta(days=40)
+        )
+
+        messages: list[dict] = async_to_sync(stream)(
+            client.cookies, lambda: archive_goals([goal.id for goal in goals], timezone.now() - timedelta(days=30))
+        )
+
+        assert changes(messages) == [{
+            'board': category.board_id, 'entity': 'board', 'id': category.board_id, 'action': 'changed',
+            'version': Board.objects.get(id=category.board_id).version,
+        }], 'Bulk change is not streamed'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_unauthorized(self, client: Any) -> None:
+        """
+        Stream of board changes test for anonymous user
+
+        Params:
+            - client: A Django test client instance
+
+        Checks:
+            - response status code is 401
+
+        Raises:
+            AssertionError
+        """
+        messages: list[dict] = async_to_sync(stream)(client.cookies)
+
+        assert messages[0]['status'] == 401, 'Anonymous user is streamed'
+
+    def test_broker(self) -> None:
+        """
+        Broker test
+
+        Checks:
+            - events are passed to subscriptions of their boards only
+            - subscription which does not keep up gets overflow event and no more events
+
+        Raises:
+            AssertionError
+        """
+        async def run() -> tuple:
+            broker: Broker = Broker()
+            first, second = broker.subscribe([1, 2], size=3), broker.subscribe([2], size=3)
+            for number in range(4):
+                broker.dispatch({'board': 1, 'id': number})
+            broker.dispatch({'board': 3, 'id': 0})
+            await asyncio.sleep(0)
+            broker.unsubscribe(first)
+            broker.unsubscribe(second)
+            return [first.queue.get_nowait() for _ in range(first.queue.qsize())], second.queue.qsize(), broker.streams
+
+        events, other, streams = asyncio.run(run())
+
+        assert events == [{'board': 1, 'id': 0}, {'board': 1, 'id': 1}, OVERFLOW], 'Overflow is not signalled'
+        assert other == 0, 'Events of other boards are passed'
+        assert streams == 0, 'Subscriptions are not removed'
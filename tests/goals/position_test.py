@@ -0,0 +1,133 @@
+import random
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal
+from goals.positions import key_between, spread
+from tests.factories import BoardParticipantFactory, CategoryFactory, GoalFactory
+
+
+def order(category: Any, status: int = Goal.Status.to_do) -> list[int]:
+    return list(
+        Goal.objects.filter(category=category, status=status).order_by('position', 'id').values_list('id', flat=True)
+    )
+
+
+# ----------------------------------------------------------------
+# position tests
+class TestPosition:
+    def test_key_between(self) -> None:
+        """
+        Position key test
+
+        Checks:
+            - key between two keys is greater than the lower and less than the upper one
+            - appended keys stay short, evenly spaced keys are ordered
+
+        Raises:
+            AssertionError
+        """
+        rng: random.Random = random.Random(0)
+        keys: list[str] = []
+        for _ in range(2000):
+            index: int = rng.randint(0, len(keys))
+            lower: str | None = keys[index - 1] if index else None
+            upper: str | None = keys[index] if index < len(keys) else None
+            key: str = key_between(lower, upper)
+            assert (lower is None or lower < key) and (upper is None or key < upper), 'Key is out of its place'
+            keys.insert(index, key)
+        appended: str | None = None
+        for _ in range(1000):
+            appended = key_between(appended, None)
+        assert len(appended) == 6, 'Appended keys grow'  # type: ignore
+        assert spread(100) == sorted(set(spread(100))), 'Spread keys are not ordered'
+
+    @pytest.mark.django_db
+    def test_move(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Goal move test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - new goals are placed at the bottom of column
+            - goal is placed after or before a goal of target column, other goals are not changed
+            - goal changing status by update goes to the bottom of new column
+            - neighbour of another column and both neighbours are rejected, reader can not move goals
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(user=user).board
+        category: Any = CategoryFactory.create(board=board, user=user)
+        first, second, third = GoalFactory.create_batch(3, category=category, user=user)
+        assert order(category) == [first.id, second.id, third.id], 'New goals are not at the bottom'
+        keys: dict = dict(Goal.objects.values_list('id', 'position'))
+
+        moved: Any = client.post(f'/goals/goal/{third.id}/move', {'after': first.id}, content_type='application/json')
+        assert moved.status_code == 200, 'Goal is not moved'
+        assert order(category) == [first.id, third.id, second.id], 'Goal is not placed after neighbour'
+        assert {
+            goal_id: key for goal_id, key in Goal.objects.values_list('id', 'position') if goal_id != third.id
+        } == {goal_id: key for goal_id, key in keys.items() if goal_id != third.id}, 'Other goals are changed'
+
+        column: dict = {'status': Goal.Status.in_progress}
+        client.post(f'/goals/goal/{second.id}/move', column, content_type='application/json')
+        client.post(
+            f'/goals/goal/{first.id}/move', {'status': Goal.Status.in_progress, 'before': second.id},
+            content_type='application/json'
+        )
+        client.patch(f'/goals/goal/{third.id}', {'status': Goal.Status.in_progress}, content_type='application/json')
+        assert order(category, Goal.Status.in_progress) == [first.id, second.id, third.id], 'Wrong order of column'
+
+        other: Any = GoalFactory.create(category=category, user=user)
+        wrong_column: Any = client.post(
+            f'/goals/goal/{first.id}/move', {'after': other.id}, content_type='application/json'
+        )
+        both: Any = client.post(
+            f'/goals/goal/{first.id}/move', {'after': second.id, 'before': third.id}, content_type='application/json'
+        )
+        BoardParticipant.objects.filter(board=board, user=user).update(role=BoardParticipant.Role.reader)
+        forbidden: Any = client.post(f'/goals/goal/{first.id}/move', {}, content_type='application/json')
+        assert wrong_column.status_code == 400 and both.status_code == 400, 'Wrong neighbours are accepted'
+        assert forbidden.status_code == 403, 'Reader moved goal'
+
+    @pytest.mark.django_db
+    def test_rebalance(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Rebalance test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - move between goals with equal keys rebalances the column and places the goal
+            - command gives columns with long and missing keys short keys in the same order
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        category: Any = CategoryFactory.create(board=BoardParticipantFactory.create(user=user).board, user=user)
+        goals: list = GoalFactory.create_batch(4, category=category, user=user)
+        Goal.objects.filter(id__in=[goals[1].id, goals[2].id]).update(position=goals[1].position)
+
+        client.post(f'/goals/goal/{goals[3].id}/move', {'after': goals[1].id}, content_type='application/json')
+        assert order(category) == [goals[0].id, goals[1].id, goals[3].id, goals[2].id], 'Goal is not placed'
+
+        Goal.objects.filter(id=goals[0].id).update(position='')
+        Goal.objects.filter(id=goals[2].id).update(position=goals[3].position + 'i' * 20)
+        expected: list[int] = order(category)
+        call_command('rebalance_positions', length=12)
+
+        assert order(category) == expected, 'Order is changed by rebalance'
+        assert all(
+            len(key) == 6 for key in Goal.objects.values_list('position', flat=True)
+        ), 'Keys are not rebalanced'
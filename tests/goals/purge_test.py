@@ -0,0 +1,104 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from bot.models import TgUser
+from goals.models.archive import ArchivedGoal
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.models.tombstone import Tombstone
+from tests.factories import BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory
+
+
+def fill(board: Board, user: Any) -> GoalCategory:
+    """Category with two goals and a comment, one goal moved to archive tables"""
+    category: GoalCategory = CategoryFactory.create(board=board, user=user)
+    goal, archived = GoalFactory.create_batch(2, category=category, user=user)
+    CommentFactory.create(goal=goal, user=user)
+    Goal.objects.filter(id=archived.id).update(status=Goal.Status.archived, updated=timezone.now() - timedelta(days=60))
+    call_command('archive_goals', days=30)
+    return category
+
+
+def age(queryset: Any, days: int) -> None:
+    queryset.update(updated=timezone.now() - timedelta(days=days))
+
+
+# ----------------------------------------------------------------
+# purge tests
+class TestPurge:
+    @pytest.mark.django_db
+    def test_purge_boards(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Purge test for deleted boards
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - board deleted before retention period is removed with categories, goals, comments,
+              archived goals, participants and tombstones, category selected in bot is cleared
+            - recently deleted and not deleted boards stay
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        old, recent, kept = (BoardParticipantFactory.create(user=user).board for _ in '123')
+        categories: list = [fill(board, user) for board in (old, recent, kept)]
+        tg_user: TgUser = TgUser.objects.create(
+            tg_chat_id=1, tg_user_id=1, user=user, verification_code='code', selected_category=categories[0]
+        )
+        client.delete(f'/goals/board/{old.id}')
+        client.delete(f'/goals/board/{recent.id}')
+        age(Board.objects.filter(id=old.id), 100)
+
+        call_command('purge_deleted', days=90, batch_size=1, pause=0)
+
+        assert list(Board.objects.order_by('id').values_list('id', flat=True)) == [recent.id, kept.id], \
+            'Wrong boards are purged'
+        for model in (BoardParticipant, GoalCategory, Goal, Comment, ArchivedGoal, Tombstone):
+            assert not model.objects.filter(board=old.id).exists(), f'{model.__name__} rows are not purged'
+            assert model.objects.filter(board=recent.id).exists(), f'{model.__name__} rows of recent board purged'
+        tg_user.refresh_from_db()
+        assert tg_user.selected_category is None, 'Selected category is not cleared'
+
+    @pytest.mark.django_db
+    def test_purge_categories(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Purge test for deleted categories
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - category deleted before retention period is removed with its goals, comments and archived goals
+            - removals are recorded as tombstones, other categories of the board stay
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(user=user).board
+        deleted, kept = fill(board, user), fill(board, user)
+        goals: list = list(Goal.objects.filter(category=deleted).values_list('id', flat=True))
+        client.delete(f'/goals/goal_category/{deleted.id}')
+        age(GoalCategory.objects.filter(id=deleted.id), 100)
+
+        call_command('purge_deleted', days=90)
+
+        assert list(GoalCategory.objects.values_list('id', flat=True)) == [kept.id], 'Category is not purged'
+        assert not Goal.objects.filter(category=deleted.id).exists(), 'Goals are not purged'
+        assert not ArchivedGoal.objects.filter(category=deleted.id).exists(), 'Archived goals are not purged'
+        assert Comment.objects.filter(goal__category=kept).exists(), 'Comments of other category are purged'
+        assert Tombstone.objects.filter(entity=Tombstone.Entity.category, entity_id=deleted.id).exists(), \
+            'Category removal is not recorded'
+        assert Tombstone.objects.filter(entity=Tombstone.Entity.goal, entity_id__in=goals).count() == 1, \
+            'Goal removals are not recorded'
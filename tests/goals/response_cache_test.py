@@ -0,0 +1,88 @@
+import threading
+from typing import Any
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from goals.views.cache import ResponseCacheMixin
+from tests.factories import BoardParticipantFactory, CategoryFactory, GoalFactory, UserFactory
+
+
+# ----------------------------------------------------------------
+# response cache tests
+class TestResponseCache:
+    @pytest.mark.django_db
+    def test_goal_list(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Cached goal list test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - repeated request (with parameters in other order) is served from cache without goal queries
+            - participants of the same boards share cached response, new participant changes the key
+            - change of a board makes the next response rendered again
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(user=user).board
+        category: Any = CategoryFactory.create(board=board, user=user)
+        GoalFactory.create_batch(3, category=category, user=user)
+
+        first: Any = client.get('/goals/goal/list?ordering=title&limit=2')
+        with CaptureQueriesContext(connection) as queries:
+            second: Any = client.get('/goals/goal/list?limit=2&ordering=title')
+        assert first['X-Response-Cache'] == 'miss' and second['X-Response-Cache'] == 'hit', 'Response is not cached'
+        assert second.content == first.content, 'Cached response differs'
+        assert not [query for query in queries.captured_queries if 'goals_goal' in query['sql']], 'Goals are read'
+
+        other: Any = UserFactory.create()
+        BoardParticipantFactory.create(user=other, board=board)
+        client.force_login(other)
+        joined: Any = client.get('/goals/goal/list?ordering=title&limit=2')
+        client.force_login(user)
+        shared: Any = client.get('/goals/goal/list?ordering=title&limit=2')
+        GoalFactory.create(category=category, user=user, title='a')
+        changed: Any = client.get('/goals/goal/list?ordering=title&limit=2')
+        assert joined['X-Response-Cache'] == 'miss', 'New participant of board is served from old entry'
+        assert shared['X-Response-Cache'] == 'hit', 'Participants of the same boards do not share response'
+        assert changed['X-Response-Cache'] == 'miss', 'Changed board is served from cache'
+        assert changed.json()['results'][0]['title'] == 'a', 'New goal is not listed'
+
+    @pytest.mark.django_db
+    def test_single_flight(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Single-flight test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - request of a key rendered by another request waits for its response
+            - request renders the response itself when another request released the key without response
+
+        Raises:
+            AssertionError
+        """
+        key: str = 'list-response:test'
+        with mock.patch.object(ResponseCacheMixin, 'cache_key', return_value=key):
+            cache.add(f'{key}:lock', 1)
+            threading.Timer(0.2, cache.set, (key, ('application/json', b'[1]'))).start()
+            waited: Any = client.get('/goals/goal_category/list')
+
+            cache.delete(key)
+            cache.add(f'{key}:lock', 1)
+            threading.Timer(0.2, cache.delete, (f'{key}:lock',)).start()
+            rendered: Any = client.get('/goals/goal_category/list')
+
+        assert waited['X-Response-Cache'] == 'hit' and waited.content == b'[1]', 'Response is rendered twice'
+        assert rendered['X-Response-Cache'] == 'miss' and rendered.json() == [], 'Response is not rendered'
+        assert cache.get(key) == ('application/json', rendered.content), 'Rendered response is not cached'
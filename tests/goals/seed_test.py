@@ -0,0 +1,54 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from core.models import User
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal
+
+
+# ----------------------------------------------------------------
+# seed command tests
+class TestSeedCommand:
+    def _seed(self, seed: int) -> list[tuple]:
+        """
+        Helper to run seed command in a rolled back transaction
+
+        Returns:
+            - shape of generated goals: category title, title, status, priority
+        """
+        with transaction.atomic():
+            call_command('seed', users=20, boards=8, chunk_boards=3, workers=1, seed=seed, stdout=StringIO())
+            shape: list[tuple] = list(
+                Goal.objects.order_by('id').values_list('category__title', 'title', 'status', 'priority')
+            )
+            counts: tuple = (User.objects.count(), Board.objects.count())
+            owners: int = BoardParticipant.objects.filter(role=BoardParticipant.Role.owner).count()
+            dated: bool = not Goal.objects.filter(created__isnull=True).exists()
+            transaction.set_rollback(True)
+        assert counts == (20, 8), 'Wrong number of users or boards'
+        assert owners == 8, 'Every board must have one owner'
+        assert dated, 'Dates were not set'
+        return shape
+
+    @pytest.mark.django_db
+    def test_seed_is_reproducible(self) -> None:
+        """
+        Seed command test
+
+        Checks:
+            - requested numbers of users and boards are created, each board has an owner
+            - the same seed generates the same data, another seed generates different data
+
+        Raises:
+            AssertionError
+        """
+        first: list[tuple] = self._seed(1)
+        second: list[tuple] = self._seed(1)
+        other: list[tuple] = self._seed(2)
+
+        assert first, 'No goals were generated'
+        assert first == second, 'Same seed generated different data'
+        assert first != other, 'Different seeds generated same data'
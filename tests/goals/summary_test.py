@@ -0,0 +1,103 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, GoalFactory, UserFactory
+
+
+# ----------------------------------------------------------------
+# board summary tests
+class TestBoardSummary:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        """Summaries of boards of previous tests may have the same ids and versions"""
+        cache.clear()
+
+    @pytest.mark.django_db
+    def test_summary(self, client: Any, user_auth: dict[str, Any], django_assert_max_num_queries: Any) -> None:
+        """
+        Board summary test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+            - django_assert_max_num_queries: A fixture to count queries
+
+        Checks:
+            - goals are counted by category, status and priority
+            - overdue goals (of board and of categories) are open goals with passed due date
+            - open goals are counted by participant, participants without goals are listed
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        colleague: Any = UserFactory.create()
+        BoardParticipantFactory.create(board=board, user=colleague, role=BoardParticipant.Role.reader)
+        work, home = CategoryFactory.create_batch(2, board=board, user=user)
+        past = timezone.now() - timedelta(days=1)
+        GoalFactory.create_batch(2, category=work, user=user, status=1, priority=2, due_date=past)
+        GoalFactory.create(category=work, user=user, status=3, priority=2, due_date=past)
+        GoalFactory.create(category=home, user=colleague, status=2, priority=4)
+        GoalFactory.create(category=CategoryFactory.create(user=user), user=user)
+
+        with django_assert_max_num_queries(8):
+            response: Any = client.get(f'/goals/board/{board.id}/summary')
+        summary: dict[str, Any] = response.json()
+
+        assert response.status_code == 200, 'Summary was not received'
+        assert summary['total'] == 4 and summary['overdue'] == 2, 'Wrong totals'
+        assert [category['overdue'] for category in summary['categories']] == [2, 0], 'Wrong overdue of categories'
+        assert [category['counts'] for category in summary['categories']] == [
+            [{'status': 1, 'priority': 2, 'count': 2}, {'status': 3, 'priority': 2, 'count': 1}],
+            [{'status': 2, 'priority': 4, 'count': 1}],
+        ], 'Wrong counts'
+        assert [(item['user'], item['open']) for item in summary['participants']] == [
+            (user.id, 2), (colleague.id, 1),
+        ], 'Wrong open goals of participants'
+        assert client.get(f'/goals/board/{BoardFactory.create().id}/summary').status_code == 404, 'Foreign board'
+
+    @pytest.mark.django_db
+    def test_summary_cache(self, client: Any, user_auth: dict[str, Any], django_assert_num_queries: Any) -> None:
+        """
+        Board summary cache test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+            - django_assert_num_queries: A fixture to count queries
+
+        Checks:
+            - repeated request does not count goals again
+            - goal changes and participant changes make new board version
+            - goal moved to another board changes both boards
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board, other = (BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board for _ in '12')
+        category: Any = CategoryFactory.create(board=board, user=user)
+        goal: Any = GoalFactory.create(category=category, user=user)
+
+        first: dict[str, Any] = client.get(f'/goals/board/{board.id}/summary').json()
+        with django_assert_num_queries(4):
+            # session, user, board and permission check only
+            assert client.get(f'/goals/board/{board.id}/summary').json() == first, 'Summary was not cached'
+        BoardParticipantFactory.create(board=board, user=UserFactory.create(), role=BoardParticipant.Role.writer)
+        second: dict[str, Any] = client.get(f'/goals/board/{board.id}/summary').json()
+        other_version: int = client.get(f'/goals/board/{other.id}/summary').json()['version']
+        goal = Goal.objects.get(id=goal.id)
+        goal.category = CategoryFactory.create(board=other, user=user)
+        goal.save()
+        third: dict[str, Any] = client.get(f'/goals/board/{board.id}/summary').json()
+
+        assert second['version'] > first['version'] and len(second['participants']) == 2, 'Version was not changed'
+        assert third['total'] == 0, 'Moved goal is counted'
+        assert client.get(f'/goals/board/{other.id}/summary').json()['version'] > other_version, 'Version not changed'
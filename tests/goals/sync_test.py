@@ -0,0 +1,132 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory, \
+    UserFactory
+
+
+def ids(rows: list) -> list:
+    return [row['id'] for row in rows]
+
+
+# ----------------------------------------------------------------
+# sync tests
+class TestSync:
+    @pytest.mark.django_db
+    def test_sync(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Delta sync test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - sync without cursor returns visible content of boards
+            - sync with returned cursor returns nothing until boards change, reading only boards
+            - changed rows and tombstones of deleted comments are returned, unchanged rows are not
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        category: Any = CategoryFactory.create(board=board, user=user)
+        goals: list = GoalFactory.create_batch(2, category=category, user=user)
+        GoalFactory.create(category=category, user=user, status=Goal.Status.archived)
+        comment: Any = CommentFactory.create(goal=goals[0], user=user)
+
+        initial: dict = client.get('/goals/sync').json()
+        with CaptureQueriesContext(connection) as context:
+            unchanged: dict = client.get('/goals/sync', {'cursor': initial['cursor']}).json()
+        sync_queries: list = [query for query in context.captured_queries if 'goals_' in query['sql']]
+        client.patch(f'/goals/goal/{goals[1].id}', {'title': 'changed'}, content_type='application/json')
+        client.delete(f'/goals/goal_comment/{comment.id}')
+        delta: dict = client.get('/goals/sync', {'cursor': initial['cursor']}).json()
+
+        assert ids(initial['boards']) == [board.id], 'Boards are not synced'
+        assert ids(initial['categories']) == [category.id], 'Categories are not synced'
+        assert ids(initial['goals']) == [goal.id for goal in goals], 'Wrong goals are synced'
+        assert ids(initial['comments']) == [comment.id], 'Comments are not synced'
+        assert [row['user'] for row in initial['participants']] == [user.username], 'Participants are not synced'
+        assert unchanged['boards'] == unchanged['goals'] == unchanged['tombstones'] == [], 'Unchanged boards synced'
+        assert unchanged['cursor'] == initial['cursor'], 'Cursor changed without changes'
+        assert len(sync_queries) == 1, 'Rows of unchanged boards are read'
+        assert ids(delta['boards']) == [board.id], 'Changed board is not synced'
+        assert ids(delta['goals']) == [goals[1].id] and delta['goals'][0]['title'] == 'changed', \
+            'Changed goal is not synced'
+        assert delta['categories'] == delta['comments'] == [], 'Unchanged rows are synced'
+        assert [(row['entity'], row['entity_id']) for row in delta['tombstones']] == [('comment', comment.id)], \
+            'Deleted comment is not synced'
+        assert delta['cursor'] != initial['cursor'], 'Cursor is not moved'
+
+    @pytest.mark.django_db
+    def test_removed(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Sync test for removed participants, deleted boards and moved goals
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - removed participant is returned as tombstone, its board as removed for the participant
+            - deleted board is returned once and dropped from cursor
+            - goal moved to another board is a tombstone of former board
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board, other = (BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board for _ in '12')
+        member: Any = BoardParticipantFactory.create(
+            board=board, user=UserFactory.create(), role=BoardParticipant.Role.reader
+        )
+        goal: Any = GoalFactory.create(category=CategoryFactory.create(board=board, user=user), user=user)
+        cursor: str = client.get('/goals/sync').json()['cursor']
+        member_cursor: str = f'{board.id}:0'
+        member_id: int = member.id
+
+        member.delete()
+        goal.category = CategoryFactory.create(board=other, user=user)
+        goal.save()
+        delta: dict = client.get('/goals/sync', {'cursor': cursor}).json()
+        client.force_login(member.user)
+        removed: dict = client.get('/goals/sync', {'cursor': member_cursor}).json()
+        client.force_login(user)
+        client.delete(f'/goals/board/{other.id}')
+        deleted: dict = client.get('/goals/sync', {'cursor': delta['cursor']}).json()
+
+        assert sorted((row['board'], row['entity'], row['entity_id']) for row in delta['tombstones']) == [
+            (board.id, 'goal', goal.id), (board.id, 'participant', member_id)
+        ], 'Wrong tombstones'
+        assert [(row['id'], row['board']) for row in delta['goals']] == [(goal.id, other.id)], 'Moved goal not synced'
+        assert removed['removed_boards'] == [board.id] and removed['cursor'] == '', 'Board of member is not removed'
+        assert [(row['id'], row['is_deleted']) for row in deleted['boards']] == [(other.id, True)], \
+            'Deleted board is not synced'
+        assert deleted['cursor'] == f'{board.id}:{Board.objects.get(id=board.id).version}', \
+            'Deleted board is in cursor'
+
+    @pytest.mark.django_db
+    def test_malformed_cursor(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Malformed cursor test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - response status code is 400
+
+        Raises:
+            AssertionError
+        """
+        response: Any = client.get('/goals/sync', {'cursor': 'abc'})
+
+        assert response.status_code == 400, 'Malformed cursor is accepted'
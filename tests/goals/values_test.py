@@ -0,0 +1,106 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from goals.models.archive import ArchivedGoal
+from goals.models.board import Board
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from goals.serializers.archive import ArchivedGoalSerializer
+from goals.serializers.board import BoardListSerializer
+from goals.serializers.category import CategorySerializer
+from goals.serializers.comment import CommentSerializer
+from goals.serializers.goal import GoalCommentsSerializer, GoalSerializer
+from goals.serializers.values import values_serializer
+from tests.factories import BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory
+
+LISTS: tuple = (
+    (BoardListSerializer, Board),
+    (CategorySerializer, GoalCategory),
+    (GoalSerializer, Goal),
+    (CommentSerializer, Comment),
+    (ArchivedGoalSerializer, ArchivedGoal),
+)
+
+
+def fill(user: Any) -> None:
+    """Rows with empty and filled optional fields, deleted category and an archived goal"""
+    board: Any = BoardParticipantFactory.create(user=user).board
+    category, deleted = CategoryFactory.create_batch(2, board=board, user=user)
+    deleted.is_deleted = True
+    deleted.save()
+    due, undated, archived = GoalFactory.create_batch(3, category=category, user=user)
+    due.due_date = timezone.now() + timedelta(days=3)
+    due.description = 'line separator'
+    due.save()
+    CommentFactory.create_batch(2, goal=due, user=user)
+    CommentFactory.create(goal=archived, user=user)
+    archived.status = Goal.Status.archived
+    archived.save()
+    Goal.objects.filter(id=archived.id).update(updated=timezone.now() - timedelta(days=60))
+    call_command('archive_goals', days=30)
+
+
+# ----------------------------------------------------------------
+# values serializer tests
+class TestValuesSerializer:
+    @pytest.mark.django_db
+    def test_conformance(self, user_auth: dict[str, Any]) -> None:
+        """
+        Values serializer conformance test
+
+        Params:
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - JSON of values() rows rendered by ValuesSerializer is the same as of ModelSerializer
+              for serializers of list endpoints
+            - serializer with fields which are not columns is not rendered from values()
+
+        Raises:
+            AssertionError
+        """
+        fill(user_auth.get('user'))
+        renderer: JSONRenderer = JSONRenderer()
+        for serializer_class, model in LISTS:
+            values: Any = values_serializer(serializer_class)
+            queryset: Any = model.objects.order_by('id')
+            assert queryset.exists(), f'No {model.__name__} rows to compare'
+            expected: bytes = renderer.render(serializer_class(queryset, many=True).data)
+            rendered: bytes = renderer.render(values.render_many(list(queryset.values(*values.columns))))
+            assert rendered == expected, f'{serializer_class.__name__} output differs'
+        assert values_serializer(GoalCommentsSerializer) is None, 'Method fields are rendered from values()'
+
+    @pytest.mark.django_db
+    def test_list_endpoints(self, client: Any, user_auth: dict[str, Any], settings: Any) -> None:
+        """
+        List endpoints test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+            - settings: A fixture to change settings
+
+        Checks:
+            - responses of list endpoints are the same with and without FAST_LISTS
+
+        Raises:
+            AssertionError
+        """
+        fill(user_auth.get('user'))
+        urls: tuple = (
+            '/goals/board/list', '/goals/goal_category/list?limit=1&offset=1', '/goals/goal/list?ordering=-due_date',
+            '/goals/goal_comment/list', '/goals/archive/goal/list?limit=10', '/goals/goal/list?comments=true',
+        )
+        settings.RESPONSE_CACHE_SECONDS = 0
+        settings.FAST_LISTS = True
+        fast: list[bytes] = [client.get(url).content for url in urls]
+        settings.FAST_LISTS = False
+        slow: list[bytes] = [client.get(url).content for url in urls]
+        for url, fast_content, slow_content in zip(urls, fast, slow):
+            assert fast_content == slow_content, f'Response of {url} differs'
@@ -0,0 +1,93 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from goals.models.board import Board, BoardParticipant
+from goals.models.category import GoalCategory
+from goals.models.comment import Comment
+from goals.models.goal import Goal
+from tests.factories import (BoardFactory, BoardParticipantFactory, CategoryFactory, CommentFactory, GoalFactory,
+                             UserFactory)
+
+
+# ----------------------------------------------------------------
+# visibility querysets tests
+class TestVisibility:
+    @pytest.mark.django_db
+    def test_visible_to(self) -> None:
+        """
+        Visibility of boards, categories, goals and comments test
+
+        Checks:
+            - only entities of boards where user participates are visible
+            - deleted boards and categories, archived goals and their comments are hidden
+            - min_role hides boards where user has a less privileged role
+
+        Raises:
+            AssertionError
+        """
+        user: Any = UserFactory.create()
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        read_only: Any = BoardParticipantFactory.create(
+            board=BoardFactory.create(), user=user, role=BoardParticipant.Role.reader
+        ).board
+        deleted: Any = BoardParticipantFactory.create(board=BoardFactory.create(is_deleted=True), user=user).board
+        foreign: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=UserFactory.create()).board
+        category: Any = CategoryFactory.create(board=board, user=user)
+        deleted_category: Any = CategoryFactory.create(board=board, user=user, is_deleted=True)
+        goal: Any = GoalFactory.create(category=category, user=user)
+        archived: Any = GoalFactory.create(category=category, user=user, status=Goal.Status.archived)
+        comment: Any = CommentFactory.create(goal=goal, user=user)
+        for hidden_goal in (
+            archived,
+            GoalFactory.create(category=deleted_category, user=user),
+            GoalFactory.create(category=CategoryFactory.create(board=deleted, user=user), user=user),
+            GoalFactory.create(category=CategoryFactory.create(board=foreign, user=user), user=user),
+        ):
+            CommentFactory.create(goal=hidden_goal, user=user)
+        reader_category: Any = CategoryFactory.create(board=read_only, user=user)
+
+        assert set(Board.objects.visible_to(user)) == {board, read_only}, 'Wrong boards are visible'
+        assert set(Board.objects.visible_to(user, min_role=BoardParticipant.Role.writer)) == {board}, \
+            'Board of reader is visible for writers'
+        assert set(GoalCategory.objects.visible_to(user)) == {category, reader_category}, \
+            'Wrong categories are visible'
+        assert list(Goal.objects.visible_to(user)) == [goal], 'Wrong goals are visible'
+        assert list(Comment.objects.visible_to(user)) == [comment], 'Wrong comments are visible'
+
+    @pytest.mark.django_db
+    def test_no_duplicates(self, client: Any, user_auth: dict[str, Any]) -> None:
+        """
+        Participation check test on boards with many participants
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: A fixture that create user instance and login
+
+        Checks:
+            - each goal is listed once and the page is limited by LIMIT of goals query
+            - participants are checked with subquery, not joined
+
+        Raises:
+            AssertionError
+        """
+        user: Any = user_auth.get('user')
+        board: Any = BoardParticipantFactory.create(board=BoardFactory.create(), user=user).board
+        for _ in range(3):
+            BoardParticipantFactory.create(board=board, user=UserFactory.create())
+        goals: list = GoalFactory.create_batch(4, category=CategoryFactory.create(board=board, user=user), user=user)
+
+        with CaptureQueriesContext(connection) as context:
+            response: Any = client.get('/goals/goal/list?limit=3&ordering=created')
+        goals_queries: list = [
+            query['sql'] for query in context.captured_queries if query['sql'].startswith('SELECT "goals_goal"')
+        ]
+
+        assert response.status_code == 200, 'Goals are not listed'
+        assert response.json()['count'] == 4, 'Goals are counted more than once'
+        assert [item['id'] for item in response.json()['results']] == [goal.id for goal in goals[:3]], \
+            'Wrong page of goals'
+        assert goals_queries and all('IN (SELECT' in sql for sql in goals_queries), 'Participation is not checked'
+        assert all('JOIN "goals_boardparticipant"' not in sql for sql in goals_queries), 'Participants are joined'
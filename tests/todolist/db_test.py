@@ -0,0 +1,123 @@
+from typing import Any
+
+import pytest
+
+from tests.factories import UserFactory
+from todolist.db.config import PoolMode, database_config, listener_database_url
+from todolist.db.stats import ConnectionStats, stats
+
+
+# ----------------------------------------------------------------
+# connection management tests
+class TestDatabaseConfig:
+    def test_transaction_pool_mode(self) -> None:
+        """
+        Database settings test for pgbouncer transaction pooling mode
+
+        Checks:
+            - engine is replaced with instrumented backend
+            - persistent connection options are set
+            - server-side cursors are disabled
+            - settings dict passed in is not modified
+
+        Raises:
+            AssertionError
+        """
+        parsed: dict[str, Any] = {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'todo_list'}
+
+        database: dict[str, Any] = database_config(
+            parsed, conn_max_age=300, pool_mode=PoolMode.transaction, connect_timeout=3
+        )
+
+        assert database['ENGINE'] == 'todolist.db.backends.postgresql', 'Wrong engine'
+        assert database['CONN_MAX_AGE'] == 300, 'Wrong CONN_MAX_AGE'
+        assert database['CONN_HEALTH_CHECKS'] is True, 'Health checks are disabled'
+        assert database['DISABLE_SERVER_SIDE_CURSORS'] is True, 'Server-side cursors are enabled'
+        assert database['OPTIONS'] == {'connect_timeout': 3}, 'Wrong options'
+        assert 'OPTIONS' not in parsed, 'Source settings were modified'
+
+    def test_unknown_pool_mode(self) -> None:
+        """
+        Database settings test with unknown pool mode
+
+        Checks:
+            - ValueError is raised
+
+        Raises:
+            AssertionError
+        """
+        with pytest.raises(ValueError):
+            database_config({'ENGINE': 'django.db.backends.sqlite3'}, pool_mode='statement')
+
+    def test_listener_database_url(self) -> None:
+        """
+        Live events listener connection test
+
+        Checks:
+            - PostgresBackend behind transaction pooling without direct listener url is rejected
+            - direct url is accepted, local backend and session pooling need no url
+
+        Raises:
+            AssertionError
+        """
+        backend: str = 'goals.live.PostgresBackend'
+        url: str = 'postgres://postgres:postgres@db/todo_list'
+
+        with pytest.raises(ValueError):
+            listener_database_url(backend, PoolMode.transaction, '')
+
+        assert listener_database_url(backend, PoolMode.transaction, url) == url, 'Direct url is not used'
+        assert listener_database_url(backend, PoolMode.session, '') == '', 'Session pooling is rejected'
+        assert listener_database_url('goals.live.LocalBackend', PoolMode.transaction, '') == '', \
+            'Local backend is rejected'
+
+
+class TestConnectionStats:
+    def test_snapshot(self) -> None:
+        """
+        Connection statistics snapshot test
+
+        Checks:
+            - reuse ratio and average connect time are derived from counters
+
+        Raises:
+            AssertionError
+        """
+        connection_stats = ConnectionStats()
+        for _ in range(4):
+            connection_stats.increment('requests')
+        for _ in range(3):
+            connection_stats.increment('reused')
+        connection_stats.record_connect(0.2)
+        connection_stats.record_connect(0.4)
+
+        snapshot: dict[str, Any] = connection_stats.snapshot()
+
+        assert snapshot['reuse_ratio'] == 0.75, 'Wrong reuse ratio'
+        assert snapshot['opened'] == 2, 'Wrong number of opened connections'
+        assert snapshot['connect_seconds_avg'] == pytest.approx(0.3), 'Wrong average connect time'
+        assert snapshot['connect_seconds_max'] == 0.4, 'Wrong max connect time'
+
+    @pytest.mark.django_db
+    def test_health_endpoint(self, client: Any) -> None:
+        """
+        Database health endpoint test
+
+        Checks:
+            - anonymous user gets only health flag
+            - staff user gets connection statistics
+            - requests are counted by instrumented backend
+
+        Raises:
+            AssertionError
+        """
+        stats.reset()
+
+        anonymous_response: Any = client.get('/health/db')
+        staff: Any = UserFactory.create(is_staff=True)
+        client.force_login(staff)
+        staff_response: Any = client.get('/health/db')
+
+        assert anonymous_response.status_code == 200, 'Status code error'
+        assert anonymous_response.data == {'healthy': True}, 'Wrong data expected'
+        assert staff_response.data.get('connections', {}).get('requests', 0) >= 2, 'Requests were not counted'
@@ -0,0 +1,66 @@
+from typing import Any
+
+import pytest
+
+from todolist.metrics.registry import Histogram
+
+
+# ----------------------------------------------------------------
+# request metrics tests
+class TestMetrics:
+    def test_histogram_render(self) -> None:
+        """
+        Histogram exposition test
+
+        Checks:
+            - buckets are cumulative and end with +Inf
+            - sum and count are rendered
+
+        Raises:
+            AssertionError
+        """
+        histogram = Histogram('test_queries', 'Test', (1, 5), ('view',))
+        for value in (0, 3, 3, 10):
+            histogram.observe(('goal-list',), value)
+
+        lines: list[str] = list(histogram.render())
+
+        assert 'test_queries_bucket{view="goal-list",le="1"} 1' in lines, 'Wrong first bucket'
+        assert 'test_queries_bucket{view="goal-list",le="5"} 3' in lines, 'Wrong second bucket'
+        assert 'test_queries_bucket{view="goal-list",le="+Inf"} 4' in lines, 'Wrong +Inf bucket'
+        assert 'test_queries_sum{view="goal-list"} 16' in lines, 'Wrong sum'
+        assert 'test_queries_count{view="goal-list"} 4' in lines, 'Wrong count'
+
+    @pytest.mark.django_db
+    def test_metrics_endpoint(self, client: Any, user_auth: dict, settings: Any) -> None:
+        """
+        Metrics endpoint test
+
+        Params:
+            - client: A Django test client instance
+            - user_auth: fixture with authenticated user
+            - settings: pytest-django settings fixture
+
+        Checks:
+            - access is denied without token and for non-staff user
+            - handled request is counted with its view name, SQL queries and response size
+
+        Raises:
+            AssertionError
+        """
+        settings.METRICS_TOKEN = 'secret'
+        client.get('/goals/board/list')
+
+        denied: Any = client.get('/metrics')
+        response: Any = client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        body: str = response.content.decode()
+        settings.METRICS_TOKEN = ''
+        not_staff: Any = client.get('/metrics')
+
+        assert denied.status_code == 403, 'Metrics are available without token'
+        assert not_staff.status_code == 403, 'Metrics are available for non-staff user'
+        assert response.status_code == 200, 'Metrics are not available with token'
+        assert 'todolist_requests_total{view="board-list",method="GET",status="200"}' in body, 'Request not counted'
+        assert 'todolist_request_db_queries_count{view="board-list",method="GET"}' in body, 'Queries not observed'
+        assert 'todolist_response_size_bytes_sum{view="board-list",method="GET"}' in body, 'Size not observed'
+        assert 'todolist_db_connection_requests' in body, 'Connection stats are not exported'
@@ -0,0 +1,123 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from goals.models.goal import Goal
+from goals.serializers.goal import GoalSerializer
+from tests.factories import GoalFactory
+from todolist.parsers import OrJSONParser
+from todolist.renderers import OrJSONRenderer
+
+
+# ----------------------------------------------------------------
+# orjson renderer and parser tests
+class TestOrJSON:
+    data: dict = {
+        'aware': datetime.datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        'naive': datetime.datetime(2023, 5, 1, 12, 30, 15, 999),
+        'offset': datetime.datetime(2023, 5, 1, 12, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=3))),
+        'date': datetime.date(2023, 5, 1),
+        'time': datetime.time(12, 30, 15, 123456),
+        'duration': datetime.timedelta(days=1, seconds=5),
+        'decimal': Decimal('10.25'),
+        'uuid': uuid.UUID(int=1),
+        'lazy': gettext_lazy('Invalid value'),
+        'label': Goal.Priority.high.label,
+        'choice': Goal.Priority.high,
+        'separators': 'line\u2028paragraph\u2029 кириллица',
+        'keys': {1: 'int', None: 'none', 2.5: 'float'},
+        'nested': [{'set': (1, 2)}, None, True, 1.5],
+    }
+
+    def test_render_matches_stdlib(self) -> None:
+        """
+        Renderer compatibility test
+
+        Checks:
+            - output is byte-identical to JSONRenderer for datetimes, Decimal, lazy strings, choices,
+              non-string keys and line separators
+            - indented output falls back to JSONRenderer
+
+        Raises:
+            AssertionError
+        """
+        renderer, stdlib = OrJSONRenderer(), JSONRenderer()
+
+        assert renderer.render(self.data) == stdlib.render(self.data), 'Output differs from JSONRenderer'
+        assert renderer.render(self.data, 'application/json; indent=4') == stdlib.render(
+            self.data, 'application/json; indent=4'
+        ), 'Indented output differs from JSONRenderer'
+        assert renderer.render({'big': 2 ** 70}) == stdlib.render({'big': 2 ** 70}), 'Big integer is not rendered'
+        assert renderer.render(None) == b'', 'None is not rendered as empty body'
+
+    def test_render_non_finite(self) -> None:
+        """
+        Renderer compatibility test for NaN and infinite numbers
+
+        Checks:
+            - with STRICT_JSON, ValueError is raised as by JSONRenderer
+            - without STRICT_JSON, output is byte-identical to JSONRenderer
+
+        Raises:
+            AssertionError
+        """
+        renderer, stdlib = OrJSONRenderer(), JSONRenderer()
+        cases: tuple = (
+            {'value': float('nan'), 'due_date': None}, [None, {'limit': -float('inf')}], {'rate': Decimal('NaN')}
+        )
+        for data in cases:
+            with pytest.raises(ValueError):
+                stdlib.render(data)
+            with pytest.raises(ValueError):
+                renderer.render(data)
+            renderer.strict = stdlib.strict = False
+            assert renderer.render(data) == stdlib.render(data), 'Output differs from JSONRenderer'
+            renderer.strict = stdlib.strict = True
+
+    @pytest.mark.django_db
+    def test_render_goal_page(self, user: Any) -> None:
+        """
+        Renderer compatibility test on serialized goals
+
+        Params:
+            - user: user fixture
+
+        Checks:
+            - paginated goal payload is rendered identically to JSONRenderer
+
+        Raises:
+            AssertionError
+        """
+        goals: list = GoalFactory.create_batch(5, user=user, category__user=user, due_date=timezone.now())
+        page: dict = {'count': 5, 'next': None, 'previous': None, 'results': GoalSerializer(goals, many=True).data}
+
+        assert OrJSONRenderer().render(page) == JSONRenderer().render(page), 'Goal page differs from JSONRenderer'
+
+    def test_parse_matches_stdlib(self) -> None:
+        """
+        Parser compatibility test
+
+        Checks:
+            - parsed data is equal to JSONParser result, including big integers
+            - invalid JSON and NaN raise ParseError
+
+        Raises:
+            AssertionError
+        """
+        body: bytes = '{"title": "цель", "priority": 3, "big": 123456789012345678901234, "due_date": null}'.encode()
+
+        parsed: Any = OrJSONParser().parse(io.BytesIO(body))
+
+        assert parsed == JSONParser().parse(io.BytesIO(body)), 'Parsed data differs from JSONParser'
+        for invalid in (b'{"title": ', b'{"value": NaN}'):
+            with pytest.raises(ParseError):
+                OrJSONParser().parse(io.BytesIO(invalid))
@@ -0,0 +1,130 @@
+from typing import Any, Iterator
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from goals.models.goal import Goal
+from todolist.db.middleware import ReplicaPinningMiddleware
+from todolist.db.routers import ReplicaRouter, use_replica, wrote
+
+
+# ----------------------------------------------------------------
+# read replica routing tests
+class TestReplicaRouting:
+    factory: RequestFactory = RequestFactory()
+
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings: Any) -> Iterator[None]:
+        """A fixture to configure one read replica, writes of previous tests do not pin reads"""
+        settings.DATABASE_REPLICAS = ['replica_1']
+        token = wrote.set(False)
+        yield
+        wrote.reset(token)
+
+    def _handle(self, request: Any, status: int = 200) -> tuple[Any, bool]:
+        """
+        Helper to pass request through ReplicaPinningMiddleware
+
+        Returns:
+            - response and use_replica flag seen by the view
+        """
+        seen: dict[str, bool] = {}
+
+        def view(_: Any) -> HttpResponse:
+            seen['use_replica'] = use_replica.get()
+            return HttpResponse(status=status)
+
+        response: Any = ReplicaPinningMiddleware(view)(request)
+        return response, seen['use_replica']
+
+    def test_router(self) -> None:
+        """
+        Router test
+
+        Checks:
+            - reads of routed apps go to replica only when allowed by current request
+            - writes go to primary
+            - models of other apps are not routed
+
+        Raises:
+            AssertionError
+        """
+        router = ReplicaRouter()
+
+        token = use_replica.set(True)
+        try:
+            assert router.db_for_read(Goal) == 'replica_1', 'Read was not routed to replica'
+            assert router.db_for_write(Goal) == 'default', 'Write was not routed to primary'
+            assert router.db_for_read(Session) is None, 'Session reads must not be routed'
+        finally:
+            use_replica.reset(token)
+        assert router.db_for_read(Goal) == 'default', 'Read outside request was routed to replica'
+
+    def test_safe_request_reads_replica(self) -> None:
+        """
+        Middleware test for GET request of a client without recent writes
+
+        Checks:
+            - view is allowed to read from replica
+            - pin cookie is not set
+            - flag is reset after response
+
+        Raises:
+            AssertionError
+        """
+        response, replica = self._handle(self.factory.get('/goals/goal/list'))
+
+        assert replica is True, 'Replica reads are not allowed'
+        assert 'db_pinned' not in response.cookies, 'Pin cookie was set'
+        assert use_replica.get() is False, 'Flag was not reset'
+
+    def test_write_pins_client_to_primary(self) -> None:
+        """
+        Middleware test for read-your-writes stickiness
+
+        Checks:
+            - successful POST sets pin cookie with REPLICA_PIN_SECONDS lifetime
+            - failed POST does not set pin cookie
+            - GET with pin cookie reads from primary
+
+        Raises:
+            AssertionError
+        """
+        response, replica = self._handle(self.factory.post('/goals/goal/create'), status=201)
+        failed_response, _ = self._handle(self.factory.post('/goals/goal/create'), status=400)
+        request: Any = self.factory.get('/goals/goal/list')
+        request.COOKIES['db_pinned'] = '1'
+        _, pinned_replica = self._handle(request)
+
+        assert replica is False, 'Unsafe request was allowed to read from replica'
+        assert response.cookies['db_pinned']['max-age'] == 5, 'Wrong pin window'
+        assert 'db_pinned' not in failed_response.cookies, 'Failed request pinned the client'
+        assert pinned_replica is False, 'Pinned client was allowed to read from replica'
+
+    def test_write_in_safe_request(self) -> None:
+        """
+        Middleware test for a GET request writing routed models (e.g. social auth callback)
+
+        Checks:
+            - reads after the write go to primary
+            - pin cookie is set, flags are reset after response
+
+        Raises:
+            AssertionError
+        """
+        router = ReplicaRouter()
+        seen: dict[str, str | None] = {}
+
+        def view(_: Any) -> HttpResponse:
+            seen['before'] = router.db_for_read(Goal)
+            router.db_for_write(Goal)
+            seen['after'] = router.db_for_read(Goal)
+            return HttpResponse()
+
+        response: Any = ReplicaPinningMiddleware(view)(self.factory.get('/oauth/complete/vk-oauth2/'))
+
+        assert seen == {'before': 'replica_1', 'after': 'default'}, 'Read after write was routed to replica'
+        assert response.cookies['db_pinned']['max-age'] == 5, 'Write of GET request did not pin the client'
+        assert use_replica.get() is False and wrote.get() is False, 'Flags were not reset'
@@ -0,0 +1,70 @@
+import gzip
+from typing import Any
+
+import pytest
+import yaml
+
+from todolist.schema import code_fingerprint, schema_cache
+
+
+# ----------------------------------------------------------------
+# cached schema tests
+class TestCachedSchema:
+    @pytest.fixture(autouse=True)
+    def cached_mode(self, settings: Any, tmp_path: Any) -> Any:
+        """A fixture to serve schema from cache with cache file in temporary directory"""
+        settings.SCHEMA_LIVE = False
+        settings.SCHEMA_CACHE_FILE = str(tmp_path / 'schema.json')
+        schema_cache.clear()
+        yield
+        schema_cache.clear()
+
+    def test_schema_served_from_cache(self, client: Any, settings: Any) -> None:
+        """
+        Cached schema test
+
+        Params:
+            - client: A Django test client instance
+            - settings: pytest-django settings fixture
+
+        Checks:
+            - schema is the same as generated live
+            - repeated request with ETag gets 304
+            - gzip is served when accepted
+            - cache file with code fingerprint is written
+
+        Raises:
+            AssertionError
+        """
+        response: Any = client.get('/schema/')
+        not_modified: Any = client.get('/schema/', HTTP_IF_NONE_MATCH=response['ETag'])
+        compressed: Any = client.get('/schema/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        settings.SCHEMA_LIVE = True
+        live: Any = client.get('/schema/')
+
+        assert response.status_code == 200, 'Schema is not available'
+        assert yaml.safe_load(response.content) == yaml.safe_load(live.content), 'Cached schema differs from live one'
+        assert not_modified.status_code == 304, 'ETag is not honoured'
+        assert compressed['Content-Encoding'] == 'gzip', 'Schema is not compressed'
+        assert gzip.decompress(compressed.content) == response.content, 'Wrong compressed schema'
+        assert code_fingerprint() in open(settings.SCHEMA_CACHE_FILE).read(), 'Cache file was not written'
+
+    def test_json_format(self, client: Any) -> None:
+        """
+        Cached schema content negotiation test
+
+        Params:
+            - client: A Django test client instance
+
+        Checks:
+            - JSON schema is served for ?format=json with its own ETag
+
+        Raises:
+            AssertionError
+        """
+        yaml_response: Any = client.get('/schema/')
+        json_response: Any = client.get('/schema/?format=json')
+
+        assert json_response['Content-Type'].startswith('application/vnd.oai.openapi+json'), 'Wrong content type'
+        assert json_response.json()['info']['title'] == 'TODOList API', 'Wrong schema'
+        assert json_response['ETag'] != yaml_response['ETag'], 'Representations share ETag'
@@ -8,9 +8,24 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
 
 import os
+from typing import Callable
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402 - needs configured apps
+
+from goals.views.live import events  # noqa: E402
+from todolist.schema import warm_schema_cache  # noqa: E402
+
+warm_schema_cache()
+
+
+async def application(scope: dict, receive: Callable, send: Callable) -> None:
+    # stream of board changes is a long-lived response served outside of Django's request handling
+    if scope['type'] == 'http' and scope['path'] == settings.LIVE_EVENTS_PATH:
+        return await events(scope, receive, send)
+    return await django_application(scope, receive, send)
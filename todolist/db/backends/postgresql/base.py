@@ -0,0 +1,11 @@
+from django.db.backends.postgresql import base
+
+from todolist.db.stats import InstrumentedConnectionMixin
+
+
+# ----------------------------------------------------------------
+# instrumented postgresql backend
+class DatabaseWrapper(InstrumentedConnectionMixin, base.DatabaseWrapper):
+    """
+    PostgreSQL backend collecting connection metrics
+    """
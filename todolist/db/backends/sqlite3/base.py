@@ -0,0 +1,11 @@
+from django.db.backends.sqlite3 import base
+
+from todolist.db.stats import InstrumentedConnectionMixin
+
+
+# ----------------------------------------------------------------
+# instrumented sqlite backend
+class DatabaseWrapper(InstrumentedConnectionMixin, base.DatabaseWrapper):
+    """
+    SQLite backend collecting connection metrics
+    """
@@ -0,0 +1,89 @@
+from typing import Any
+
+
+# ----------------------------------------------------------------
+# database settings builder
+INSTRUMENTED_ENGINES: dict[str, str] = {
+    'django.db.backends.postgresql': 'todolist.db.backends.postgresql',
+    'django.db.backends.postgresql_psycopg2': 'todolist.db.backends.postgresql',
+    'django.db.backends.sqlite3': 'todolist.db.backends.sqlite3',
+}
+
+
+class PoolMode:
+    """
+    Connection pooling modes
+
+    Attrs:
+        - session: persistent connections to PostgreSQL or to pgbouncer in session pooling mode
+        - transaction: pgbouncer in transaction pooling mode, a server connection is bound to the client
+          only for a transaction, so no server-side cursors and no session state are allowed
+    """
+    session: str = 'session'
+    transaction: str = 'transaction'
+    choices: tuple = (session, transaction)
+
+
+def database_config(
+    database: dict[str, Any],
+    conn_max_age: int | None = 0,
+    health_checks: bool = True,
+    pool_mode: str = PoolMode.session,
+    connect_timeout: int | None = None,
+) -> dict[str, Any]:
+    """
+    Function to add connection management options to database settings parsed from DATABASE_URL
+
+    Params:
+        - database: settings dict built by env.db()
+        - conn_max_age: lifetime of persistent connection in seconds (0 - close after each request,
+          None - unlimited)
+        - health_checks: check persistent connection before reusing it in a new request
+        - pool_mode: PoolMode value
+        - connect_timeout: seconds to wait for a new PostgreSQL connection
+
+    Returns:
+        - database settings dict
+
+    Raises:
+        - ValueError (in case of unknown pool mode)
+    """
+    if pool_mode not in PoolMode.choices:
+        raise ValueError(f'Unknown database pool mode: {pool_mode}')
+
+    database = {**database, 'OPTIONS': {**database.get('OPTIONS', {})}}
+    database['ENGINE'] = INSTRUMENTED_ENGINES.get(database['ENGINE'], database['ENGINE'])
+    database['CONN_MAX_AGE'] = conn_max_age
+    database['CONN_HEALTH_CHECKS'] = health_checks
+    is_postgresql: bool = database['ENGINE'].endswith('postgresql')
+    if is_postgresql and connect_timeout:
+        database['OPTIONS'].setdefault('connect_timeout', connect_timeout)
+    if pool_mode == PoolMode.transaction:
+        # named cursors (QuerySet.iterator) live on a server connection which pgbouncer
+        # may hand to another client after commit
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
+    return database
+
+
+def listener_database_url(live_events_backend: str, pool_mode: str, url: str) -> str:
+    """
+    Function to check connection of LISTEN/NOTIFY listener of live events. LISTEN is session state,
+    which pgbouncer in transaction pooling mode does not keep, so notifications would never arrive
+
+    Params:
+        - live_events_backend: LIVE_EVENTS_BACKEND setting
+        - pool_mode: PoolMode value of default database
+        - url: direct database url of the listener, '' to listen through default database
+
+    Returns:
+        - url
+
+    Raises:
+        - ValueError (in case PostgresBackend listens through transaction pooling)
+    """
+    if live_events_backend.endswith('PostgresBackend') and pool_mode == PoolMode.transaction and not url:
+        raise ValueError(
+            'PostgresBackend of live events needs LIVE_EVENTS_DATABASE_URL (direct connection to PostgreSQL) '
+            'with DB_POOL_MODE=transaction'
+        )
+    return url
@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+from rest_framework.permissions import SAFE_METHODS
+
+from todolist.db.routers import use_replica, wrote
+
+
+# ----------------------------------------------------------------
+# read-your-writes middleware
+class ReplicaPinningMiddleware(MiddlewareMixin):
+    """
+    Middleware to allow replica reads for safe-method requests only.
+    A successful unsafe request or any request which has written routed models (ReplicaRouter.db_for_write)
+    sets a short-lived cookie, while it is present the client reads from primary and sees its own writes
+    regardless of replication lag
+    """
+    def process_request(self, request: HttpRequest) -> None:
+        pinned: bool = settings.REPLICA_PIN_COOKIE in request.COOKIES
+        use_replica.set(request.method in SAFE_METHODS and not pinned)
+        wrote.set(False)
+
+    def process_response(self, request: HttpRequest, response: HttpResponse) -> Any:
+        written: bool = wrote.get() or (request.method not in SAFE_METHODS and response.status_code < 400)
+        use_replica.set(False)
+        wrote.set(False)
+        if written and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
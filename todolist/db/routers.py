@@ -0,0 +1,73 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# True only while a safe-method request of a client without recent writes is being handled,
+# everything else (unsafe requests, pinned clients, bot, management commands) reads from primary
+use_replica: ContextVar[bool] = ContextVar('use_replica', default=False)
+# set by the first write of routed models, reads of the rest of the request (or command) go to primary
+# and the client is pinned to primary, even if the request method is safe (e.g. social auth callback)
+wrote: ContextVar[bool] = ContextVar('wrote', default=False)
+
+
+@contextmanager
+def on_primary() -> Iterator[None]:
+    """Context manager sending reads of the block to primary, e.g. reads which must be consistent with each other"""
+    token = use_replica.set(False)
+    try:
+        yield
+    finally:
+        use_replica.reset(token)
+
+
+# ----------------------------------------------------------------
+# read replica router
+class ReplicaRouter:
+    """
+    Database router sending reads of REPLICA_ROUTED_APPS models to one of DATABASE_REPLICAS
+    and all writes to the primary (default) database
+    """
+    def _is_routed(self, model: Any) -> bool:
+        return model._meta.app_label in settings.REPLICA_ROUTED_APPS
+
+    def db_for_read(self, model: Any, **hints: Any) -> str | None:
+        """
+        Method to choose database for read query
+
+        Returns:
+            - alias of random replica if current request may read from replicas and has not written,
+              else primary alias
+        """
+        if not self._is_routed(model):
+            return None
+        if not settings.DATABASE_REPLICAS or not use_replica.get() or wrote.get():
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model: Any, **hints: Any) -> str | None:
+        """
+        Method to choose database for write query, following reads of the request go to primary
+
+        Returns:
+            - primary alias
+        """
+        if not self._is_routed(model):
+            return None
+        use_replica.set(False)
+        wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool | None:
+        """
+        Method to allow relations between objects loaded from primary and replicas
+        """
+        databases: set[str] = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Any
+
+from django.core.signals import request_started
+from django.db import connections
+
+
+# ----------------------------------------------------------------
+# connection statistics
+class ConnectionStats:
+    """
+    Process-wide counters of database connection usage
+
+    Attrs:
+        - requests: number of started requests (counted per database alias)
+        - reused: number of requests which started with a persistent connection left open
+        - opened: number of connections opened
+        - connect_seconds: total time spent waiting for new connections (connect + session setup)
+        - connect_seconds_max: longest wait for a new connection
+        - health_checks: number of health checks performed on persistent connections
+        - health_check_failures: number of persistent connections dropped by a failed health check
+        - discarded: number of persistent connections closed as obsolete or broken
+    """
+    fields: tuple = (
+        'requests', 'reused', 'opened', 'connect_seconds', 'connect_seconds_max',
+        'health_checks', 'health_check_failures', 'discarded',
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Method to set all counters to zero"""
+        with self._lock:
+            for field in self.fields:
+                setattr(self, field, 0)
+
+    def increment(self, field: str, value: int = 1) -> None:
+        """Method to increment one counter"""
+        with self._lock:
+            setattr(self, field, getattr(self, field) + value)
+
+    def record_connect(self, seconds: float) -> None:
+        """
+        Method to record opening of a new connection
+
+        Params:
+            - seconds: time spent on connect and session initialization
+        """
+        with self._lock:
+            self.opened += 1
+            self.connect_seconds += seconds
+            self.connect_seconds_max = max(self.connect_seconds_max, seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Method to get consistent copy of counters with derived values
+
+        Returns:
+            - dict with counters, reuse ratio and average wait for a new connection
+        """
+        with self._lock:
+            data: dict[str, Any] = {field: getattr(self, field) for field in self.fields}
+        data['reuse_ratio'] = round(data['reused'] / data['requests'], 4) if data['requests'] else 0.0
+        data['connect_seconds_avg'] = round(data['connect_seconds'] / data['opened'], 6) if data['opened'] else 0.0
+        return data
+
+
+stats = ConnectionStats()
+
+
+# ----------------------------------------------------------------
+# instrumented database wrapper
+class InstrumentedConnectionMixin:
+    """
+    Mixin for DatabaseWrapper of a database backend to feed ConnectionStats
+    """
+    def connect(self) -> None:
+        started: float = time.perf_counter()
+        super().connect()  # type: ignore
+        stats.record_connect(time.perf_counter() - started)
+
+    def close_if_health_check_failed(self) -> None:
+        if self.connection is not None and self.health_check_enabled and not self.health_check_done:  # type: ignore
+            stats.increment('health_checks')
+            super().close_if_health_check_failed()  # type: ignore
+            if self.connection is None:  # type: ignore
+                stats.increment('health_check_failures')
+            return
+        super().close_if_health_check_failed()  # type: ignore
+
+    def close_if_unusable_or_obsolete(self) -> None:
+        was_open: bool = self.connection is not None  # type: ignore
+        super().close_if_unusable_or_obsolete()  # type: ignore
+        if was_open and self.connection is None:  # type: ignore
+            stats.increment('discarded')
+
+
+def count_reused_connections(**kwargs: Any) -> None:
+    """
+    request_started receiver counting requests and those which start with a persistent connection.
+    Connected after Django's close_old_connections, so obsolete connections are already closed
+    """
+    for connection in connections.all():
+        if isinstance(connection, InstrumentedConnectionMixin):
+            stats.increment('requests')
+            if connection.connection is not None:
+                stats.increment('reused')
+
+
+request_started.connect(count_reused_connections, dispatch_uid='todolist.db.stats.count_reused_connections')
@@ -0,0 +1,40 @@
+from django.db import DatabaseError, connection
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from todolist.db.stats import stats
+
+
+# ----------------------------------------------------------------
+# database health view
+@extend_schema(tags=['Health'])
+class DatabaseHealthView(APIView):
+    """
+    View to check database availability, connection statistics are shown to staff users only
+    """
+    permission_classes: list = [permissions.AllowAny]
+
+    @extend_schema(
+        description="Check database connection, connection reuse and wait statistics for staff",
+        summary="Database health",
+    )
+    def get(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """
+        Method to handle GET request
+
+        Returns:
+            - Response with status 200 or 503 (database unavailable)
+        """
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            healthy: bool = True
+        except DatabaseError:
+            healthy = False
+        data: dict = {'healthy': healthy}
+        if request.user.is_staff:
+            data['connections'] = stats.snapshot()
+        return Response(data, status=status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE)
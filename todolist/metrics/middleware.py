@@ -0,0 +1,117 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest, HttpResponse
+
+from todolist.metrics.registry import request_db_duration, request_duration, request_queries, requests_total, \
+    response_size
+
+
+# ----------------------------------------------------------------
+# SQL accounting
+class QueryCounter:
+    """
+    SQL queries executed while handling one request
+
+    Attrs:
+        - queries: number of executed queries
+        - seconds: total time of executed queries
+    """
+    __slots__ = ('queries', 'seconds')
+
+    def __init__(self) -> None:
+        self.queries: int = 0
+        self.seconds: float = 0.0
+
+
+# context variable is copied into threads of sync_to_async, so queries of async views are counted too
+current_counter: ContextVar[QueryCounter | None] = ContextVar('current_counter', default=None)
+
+
+def count_query(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+    """
+    Database execute wrapper adding query time to counter of current request (SQL text is not stored)
+    """
+    counter: QueryCounter | None = current_counter.get()
+    if counter is None:
+        return execute(sql, params, many, context)
+    started: float = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        counter.queries += 1
+        counter.seconds += time.perf_counter() - started
+
+
+def install_query_counter(connection: Any, **kwargs: Any) -> None:
+    """connection_created receiver installing execute wrapper once per database wrapper"""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+connection_created.connect(install_query_counter, dispatch_uid='todolist.metrics.install_query_counter')
+
+
+# ----------------------------------------------------------------
+# request metrics middleware
+class RequestMetricsMiddleware:
+    """
+    Middleware to record latency, SQL query count, SQL time and response size of each request
+    into histograms labelled by resolved URL name and method
+    """
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        counter, token, started = self._start()
+        try:
+            response: HttpResponse = self.get_response(request)
+        finally:
+            current_counter.reset(token)
+        self._record(request, response, counter, started)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> Any:
+        counter, token, started = self._start()
+        try:
+            response: HttpResponse = await self.get_response(request)
+        finally:
+            current_counter.reset(token)
+        self._record(request, response, counter, started)
+        return response
+
+    @staticmethod
+    def _start() -> tuple:
+        counter = QueryCounter()
+        return counter, current_counter.set(counter), time.perf_counter()
+
+    @staticmethod
+    def _record(request: HttpRequest, response: HttpResponse, counter: QueryCounter, started: float) -> None:
+        """
+        Method to observe metrics of handled request
+
+        Params:
+            - request: HttpRequest
+            - response: HttpResponse
+            - counter: SQL counter of the request
+            - started: perf_counter value at request start
+        """
+        match: Any = getattr(request, 'resolver_match', None)
+        view: str = (match.url_name or match.route) if match else '<unresolved>'
+        labels: tuple = (view, request.method)
+        requests_total.inc((view, request.method, str(response.status_code)))
+        request_duration.observe(labels, time.perf_counter() - started)
+        request_queries.observe(labels, counter.queries)
+        request_db_duration.observe(labels, counter.seconds)
+        if not response.streaming:
+            response_size.observe(labels, len(response.content))
@@ -0,0 +1,161 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, TypeVar
+
+
+# ----------------------------------------------------------------
+# metric types (process-local, rendered in Prometheus text exposition format)
+INF_LABEL: str = 'le="+Inf"'
+
+
+def _format_labels(labelnames: tuple, labels: tuple, extra: str = '') -> str:
+    """
+    Function to render label set
+
+    Params:
+        - labelnames: names of labels
+        - labels: values of labels
+        - extra: already rendered extra label (le="..." of histogram bucket)
+
+    Returns:
+        - string like {view="goal-list",method="GET"}
+    """
+    pairs: list[str] = [
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in zip(labelnames, labels)
+    ]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonic counter with labels
+
+    Attrs:
+        - name: metric name
+        - documentation: HELP text
+        - labelnames: names of labels
+    """
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: tuple = (), value: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + value
+
+    def render(self) -> Iterable[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} counter'
+        with self._lock:
+            values: list = sorted(self._values.items())
+        for labels, value in values:
+            yield f'{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}'
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets and labels
+
+    Attrs:
+        - name: metric name
+        - documentation: HELP text
+        - buckets: sorted upper bounds of buckets (+Inf is implicit)
+        - labelnames: names of labels
+    """
+    def __init__(self, name: str, documentation: str, buckets: tuple, labelnames: tuple = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = labelnames
+        # labels -> [count per bucket..., count in +Inf only, sum]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        index: int = bisect_left(self.buckets, value)
+        with self._lock:
+            series: list | None = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} histogram'
+        with self._lock:
+            snapshot: list = sorted((labels, list(series)) for labels, series in self._series.items())
+        for labels, series in snapshot:
+            cumulative: int = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le: str = f'le="{_format_value(bound)}"'
+                yield f'{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}'
+            cumulative += series[len(self.buckets)]
+            yield f'{self.name}_bucket{_format_labels(self.labelnames, labels, INF_LABEL)} {cumulative}'
+            yield f'{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series[-1])}'
+            yield f'{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}'
+
+
+Metric = TypeVar('Metric', Counter, Histogram)
+
+
+class Registry:
+    """
+    Collection of metrics and collector callables producing exposition lines on scrape
+    """
+    def __init__(self) -> None:
+        self._metrics: list = []
+        self._collectors: list[Callable[[], Iterable[str]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+# ----------------------------------------------------------------
+# request metrics
+SECONDS_BUCKETS: tuple = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERIES_BUCKETS: tuple = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS: tuple = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+REQUEST_LABELS: tuple = ('view', 'method')
+
+requests_total = REGISTRY.register(Counter(
+    'todolist_requests_total', 'Number of handled requests', ('view', 'method', 'status'),
+))
+request_duration = REGISTRY.register(Histogram(
+    'todolist_request_duration_seconds', 'Request latency', SECONDS_BUCKETS, REQUEST_LABELS,
+))
+request_queries = REGISTRY.register(Histogram(
+    'todolist_request_db_queries', 'Number of SQL queries per request', QUERIES_BUCKETS, REQUEST_LABELS,
+))
+request_db_duration = REGISTRY.register(Histogram(
+    'todolist_request_db_duration_seconds', 'Time spent in SQL queries per request', SECONDS_BUCKETS, REQUEST_LABELS,
+))
+response_size = REGISTRY.register(Histogram(
+    'todolist_response_size_bytes', 'Size of response body', SIZE_BUCKETS, REQUEST_LABELS,
+))
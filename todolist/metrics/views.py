@@ -0,0 +1,54 @@
+import hmac
+from typing import Iterable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from todolist.db.stats import stats
+from todolist.metrics.registry import REGISTRY
+
+CONTENT_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+# ----------------------------------------------------------------
+# connection statistics collector
+def collect_connection_stats() -> Iterable[str]:
+    """
+    Collector exporting database connection statistics as gauges
+
+    Returns:
+        - exposition lines
+    """
+    for field, value in stats.snapshot().items():
+        name: str = f'todolist_db_connection_{field}'
+        yield f'# TYPE {name} gauge'
+        yield f'{name} {value}'
+
+
+REGISTRY.register_collector(collect_connection_stats)
+
+
+# ----------------------------------------------------------------
+# metrics view
+def _is_allowed(request: HttpRequest) -> bool:
+    """
+    Function to check access to metrics: bearer METRICS_TOKEN if configured, else staff session
+    """
+    if settings.METRICS_TOKEN:
+        expected: str = f'Bearer {settings.METRICS_TOKEN}'
+        return hmac.compare_digest(request.headers.get('Authorization', ''), expected)
+    return request.user.is_staff
+
+
+@require_GET
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    View to expose metrics of current process in Prometheus text format
+
+    Returns:
+        - HttpResponse with status 200 or 403
+    """
+    if not _is_allowed(request):
+        return HttpResponse(status=403)
+    return HttpResponse(REGISTRY.render(), content_type=CONTENT_TYPE)
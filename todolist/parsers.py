@@ -0,0 +1,49 @@
+import io
+import re
+from typing import Any
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from todolist.renderers import OrJSONRenderer, orjson
+
+# orjson reads integers longer than 64 bits as floats, bodies with such numbers go to stdlib parser
+LONG_NUMBER = re.compile(rb'\d{19,}')
+UTF8_NAMES: frozenset = frozenset(('utf-8', 'utf8', 'UTF-8', 'UTF8'))
+
+
+# ----------------------------------------------------------------
+# orjson parser
+class OrJSONParser(JSONParser):
+    """
+    JSONParser decoding UTF-8 request bodies with orjson.
+    Bodies orjson can not read the same way (other charsets, integers longer than 64 bits) or rejects
+    are passed to the stdlib parser, which also produces the usual error message
+    """
+    renderer_class = OrJSONRenderer
+
+    def parse(self, stream: Any, media_type: str | None = None, parser_context: Any = None) -> Any:
+        """
+        Method to parse request body
+
+        Params:
+            - stream: request stream
+            - media_type: media type of request
+            - parser_context: context of parser
+
+        Returns:
+            - parsed data
+
+        Raises:
+            - ParseError
+        """
+        encoding: str = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding not in UTF8_NAMES or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+        body: bytes = stream.read() if stream is not None else b''
+        if LONG_NUMBER.search(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,71 @@
+import math
+from decimal import Decimal
+from typing import Any
+
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency, stdlib renderer is used instead
+    orjson = None
+
+# same escaping of line and paragraph separators as JSONRenderer does (output is a strict javascript subset)
+LINE_SEPARATOR: bytes = '\u2028'.encode()
+PARAGRAPH_SEPARATOR: bytes = '\u2029'.encode()
+
+
+def non_finite(data: Any) -> bool:
+    """Data has NaN or infinite floats or decimals, orjson writes them as null"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, Decimal):
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(non_finite(value) for value in data)
+    return False
+
+
+# ----------------------------------------------------------------
+# orjson renderer
+class OrJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson. Output matches the stdlib renderer: datetimes, times, Decimal,
+    UUID, lazy translation strings and other non-JSON types are converted by DRF JSONEncoder,
+    non-string keys are converted to strings. Pretty printed (browsable API, indent parameter)
+    and non-default UNICODE_JSON/COMPACT_JSON output, and data orjson can not encode (e.g. integers
+    longer than 64 bits) are left to the stdlib renderer, so are NaN and infinite numbers (ValueError
+    with STRICT_JSON, NaN and Infinity literals without it).
+    Floats with exponent are written without '+' and leading zeros of exponent (1e16 instead of 1e+16)
+    """
+    options: int = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def render(self, data: Any, accepted_media_type: str | None = None, renderer_context: Any = None) -> bytes:
+        """
+        Method to render data into JSON bytes
+
+        Params:
+            - data: data to render
+            - accepted_media_type: negotiated media type, may contain indent parameter
+            - renderer_context: context of renderer
+
+        Returns:
+            - JSON bytes
+        """
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            rendered: bytes = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if b'null' in rendered and non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        if LINE_SEPARATOR in rendered or PARAGRAPH_SEPARATOR in rendered:
+            rendered = rendered.replace(LINE_SEPARATOR, b'\\u2028').replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+        return rendered
@@ -0,0 +1,199 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import drf_spectacular
+import rest_framework
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+# packages which code defines the schema
+SCHEMA_SOURCES: tuple = ('core', 'goals', 'bot', 'todolist')
+
+
+# ----------------------------------------------------------------
+# code fingerprint
+@lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """
+    Hash of project python sources, schema settings and versions of schema libraries.
+    Schema built from the same code has the same fingerprint
+
+    Returns:
+        - hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{drf_spectacular.__version__}:{rest_framework.__version__}'.encode())
+    digest.update(repr(sorted(settings.SPECTACULAR_SETTINGS.items())).encode())
+    for package in SCHEMA_SOURCES:
+        for path in sorted(Path(settings.BASE_DIR, package).rglob('*.py')):
+            if 'migrations' in path.parts:
+                continue
+            digest.update(str(path.relative_to(settings.BASE_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# ----------------------------------------------------------------
+# schema cache
+@dataclass(frozen=True)
+class RenderedSchema:
+    """
+    Schema rendered by one renderer
+
+    Attrs:
+        - body: rendered schema
+        - gzipped: gzip-compressed body
+        - etag: quoted entity tag
+    """
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+    @classmethod
+    def build(cls, body: bytes) -> 'RenderedSchema':
+        return cls(body, gzip.compress(body, mtime=0), f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class SchemaCache:
+    """
+    Process-wide cache of generated schema.
+    Schema is generated once per language, loaded from SCHEMA_CACHE_FILE when its fingerprint
+    matches current code, and rendered once per renderer
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._schemas: dict[str, dict] = {}
+        self._rendered: dict[tuple, RenderedSchema] = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._rendered.clear()
+
+    def rendered(self, view: SpectacularAPIView, renderer: Any, media_type: str) -> RenderedSchema:
+        """
+        Method to get schema rendered for accepted renderer
+
+        Params:
+            - view: schema view, its generator settings are used for generation
+            - renderer: accepted renderer
+            - media_type: accepted media type
+
+        Returns:
+            - RenderedSchema
+        """
+        key: tuple = (translation.get_language(), type(renderer), media_type)
+        rendered: RenderedSchema | None = self._rendered.get(key)
+        if rendered is not None:
+            return rendered
+        with self._lock:
+            if key not in self._rendered:
+                schema: dict = self._schema(view)
+                self._rendered[key] = RenderedSchema.build(renderer.render(schema, media_type, {}))
+            return self._rendered[key]
+
+    def _schema(self, view: SpectacularAPIView) -> dict:
+        language: str = translation.get_language() or ''
+        if language not in self._schemas:
+            schema: dict | None = self._read_file(language)
+            if schema is None:
+                generator: Any = view.generator_class(urlconf=view.urlconf, api_version=view.api_version)
+                schema = generator.get_schema(request=None, public=True)
+                self._write_file(language, schema)
+            self._schemas[language] = schema
+        return self._schemas[language]
+
+    @staticmethod
+    def _path(language: str) -> Path | None:
+        if not settings.SCHEMA_CACHE_FILE:
+            return None
+        path = Path(settings.SCHEMA_CACHE_FILE)
+        if language in ('', settings.LANGUAGE_CODE):
+            return path
+        return path.with_name(f'{path.stem}.{language}{path.suffix}')
+
+    def _read_file(self, language: str) -> dict | None:
+        path: Path | None = self._path(language)
+        try:
+            data: dict = json.loads(path.read_bytes()) if path else {}
+        except (OSError, ValueError):
+            return None
+        if data.get('fingerprint') != code_fingerprint():
+            return None
+        return data.get('schema')
+
+    def _write_file(self, language: str, schema: dict) -> None:
+        path: Path | None = self._path(language)
+        if path is None:
+            return
+        try:
+            descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump({'fingerprint': code_fingerprint(), 'schema': schema}, file, default=str)
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, path)
+        except OSError:
+            logger.warning('Could not write schema cache file %s', path, exc_info=True)
+
+
+schema_cache = SchemaCache()
+
+
+# ----------------------------------------------------------------
+# schema view
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    Schema view serving pre-generated schema from memory with ETag and gzip.
+    Generates schema on every request in live mode (SCHEMA_LIVE, enabled with DEBUG by default)
+    """
+    def _get_schema_response(self, request: Request) -> HttpResponse:
+        if settings.SCHEMA_LIVE or request.version or request.GET.get('version'):
+            return super()._get_schema_response(request)
+        rendered: RenderedSchema = schema_cache.rendered(
+            self, request.accepted_renderer, request.accepted_media_type
+        )
+        compress: bool = 'gzip' in request.headers.get('Accept-Encoding', '')
+        # each representation has its own strong entity tag
+        etag: str = rendered.etag[:-1] + '-gzip"' if compress else rendered.etag
+        if etag in request.headers.get('If-None-Match', ''):
+            response: HttpResponse = HttpResponseNotModified()
+        elif compress:
+            response = HttpResponse(rendered.gzipped, content_type=request.accepted_media_type)
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(rendered.body, content_type=request.accepted_media_type)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        response['Content-Disposition'] = f'inline; filename="{self._get_filename(request, None)}"'
+        patch_vary_headers(response, ('Accept', 'Accept-Encoding'))
+        return response
+
+
+def warm_schema_cache() -> None:
+    """
+    Function to generate schema (and write SCHEMA_CACHE_FILE) on startup of a worker or at build time,
+    so the first request does not wait for generation
+    """
+    if settings.SCHEMA_LIVE:
+        return
+    try:
+        schema_cache.rendered(CachedSpectacularAPIView(), OpenApiYamlRenderer(), OpenApiYamlRenderer.media_type)
+    except Exception:
+        # schema will be generated on first request, where the error is reported as usual
+        logger.warning('Could not warm schema cache', exc_info=True)
@@ -7,8 +7,36 @@ from pathlib import Path
 
 import environ
 
-
-env = environ.Env(DEBUG=(bool, False))
+from todolist.db.config import database_config, listener_database_url
+
+
+env = environ.Env(
+    DEBUG=(bool, False),
+    ASYNC_VIEWS=(bool, False),
+    DB_CONN_MAX_AGE=(int, 60),
+    DB_CONN_HEALTH_CHECKS=(bool, True),
+    DB_POOL_MODE=(str, 'session'),
+    DB_CONNECT_TIMEOUT=(int, 5),
+    DATABASE_REPLICA_URLS=(list, []),
+    REPLICA_PIN_SECONDS=(int, 5),
+    METRICS_TOKEN=(str, ''),
+    FAST_JSON=(bool, True),
+    FAST_LISTS=(bool, True),
+    CACHE_URL=(str, 'locmemcache://'),
+    BOARD_SUMMARY_CACHE_SECONDS=(int, 300),
+    LIVE_EVENTS_BACKEND=(str, 'goals.live.LocalBackend'),
+    LIVE_EVENTS_DATABASE_URL=(str, ''),
+    LIVE_EVENTS_KEEPALIVE_SECONDS=(int, 15),
+    LIVE_EVENTS_QUEUE_SIZE=(int, 100),
+    REMINDER_WINDOWS_HOURS=([int], [24, 1]),
+    REMINDER_RATE=(float, 20),
+    ARCHIVE_AFTER_DAYS=(int, 30),
+    PURGE_AFTER_DAYS=(int, 90),
+    POSITION_REBALANCE_LENGTH=(int, 12),
+    EXPAND_MAX_DEPTH=(int, 2),
+    RESPONSE_CACHE_SECONDS=(int, 60),
+    RESPONSE_CACHE_WAIT_SECONDS=(int, 5),
+)
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 env.read_env(BASE_DIR / '.env')
@@ -43,11 +71,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'todolist.metrics.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'todolist.db.middleware.ReplicaPinningMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -71,6 +101,21 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'todolist.wsgi.application'
+ASGI_APPLICATION = 'todolist.asgi.application'
+
+# serve read endpoints of goals app by async ORM views (ASGI serving profile)
+ASYNC_VIEWS = env('ASYNC_VIEWS')
+
+# server-sent events of board changes (ASGI only): goals.live.LocalBackend serves events of own process,
+# goals.live.PostgresBackend events of all processes through LISTEN/NOTIFY
+LIVE_EVENTS_PATH = '/goals/events'
+LIVE_EVENTS_BACKEND = env('LIVE_EVENTS_BACKEND')
+LIVE_EVENTS_KEEPALIVE_SECONDS = env('LIVE_EVENTS_KEEPALIVE_SECONDS')
+LIVE_EVENTS_QUEUE_SIZE = env('LIVE_EVENTS_QUEUE_SIZE')
+# direct connection (not through transaction-mode pooler) of PostgresBackend listener, DATABASE_URL if empty
+LIVE_EVENTS_DATABASE_URL = listener_database_url(
+    LIVE_EVENTS_BACKEND, env('DB_POOL_MODE'), env('LIVE_EVENTS_DATABASE_URL')
+)
 
 
 #  ----------------------------------------------------------------
@@ -78,15 +123,82 @@ WSGI_APPLICATION = 'todolist.wsgi.application'
 AUTH_USER_MODEL = 'core.User'
 
 # Database
+# persistent connections (DB_CONN_MAX_AGE seconds, 0 - new connection per request) with health checks,
+# DB_POOL_MODE=transaction when connecting through pgbouncer in transaction pooling mode
 DATABASES = {
-    'default': env.db()
+    'default': database_config(
+        env.db(),
+        conn_max_age=env('DB_CONN_MAX_AGE'),
+        health_checks=env('DB_CONN_HEALTH_CHECKS'),
+        pool_mode=env('DB_POOL_MODE'),
+        connect_timeout=env('DB_CONNECT_TIMEOUT'),
+    )
+}
+
+# read replicas (DATABASE_REPLICA_URLS, comma separated): safe-method requests read models of
+# REPLICA_ROUTED_APPS from a replica, a client which has just written reads from primary
+# for REPLICA_PIN_SECONDS
+DATABASE_REPLICAS: list[str] = []
+for number, replica_url in enumerate(env('DATABASE_REPLICA_URLS'), start=1):
+    DATABASE_REPLICAS.append(f'replica_{number}')
+    DATABASES[f'replica_{number}'] = database_config(
+        env.db_url_config(replica_url),
+        conn_max_age=env('DB_CONN_MAX_AGE'),
+        health_checks=env('DB_CONN_HEALTH_CHECKS'),
+        pool_mode=env('DB_POOL_MODE'),
+        connect_timeout=env('DB_CONNECT_TIMEOUT'),
+    )
+    DATABASES[f'replica_{number}']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['todolist.db.routers.ReplicaRouter']
+REPLICA_ROUTED_APPS = ('goals', 'core', 'bot')
+REPLICA_PIN_SECONDS = env('REPLICA_PIN_SECONDS')
+REPLICA_PIN_COOKIE = 'db_pinned'
+
+# cache (CACHE_URL, e.g. redis://host:6379/1), local memory of process by default
+CACHES = {
+    'default': env.cache('CACHE_URL'),
 }
+# board summary is cached per board version, entries also expire to follow overdue goals
+BOARD_SUMMARY_CACHE_SECONDS = env('BOARD_SUMMARY_CACHE_SECONDS')
+# goal, category and comment list responses are cached per versions of visible boards (goals.views.cache),
+# entries also expire to follow changes which do not change boards (e.g. usernames), 0 turns cache off
+RESPONSE_CACHE_SECONDS = env('RESPONSE_CACHE_SECONDS')
+# concurrent requests of a missed response wait this long for the first one to render it
+RESPONSE_CACHE_WAIT_SECONDS = env('RESPONSE_CACHE_WAIT_SECONDS')
+
+# archived goals are moved to archive tables after this number of days (manage.py archive_goals)
+ARCHIVE_AFTER_DAYS = env('ARCHIVE_AFTER_DAYS')
+# soft-deleted boards and categories are hard deleted after this number of days (manage.py purge_deleted)
+PURGE_AFTER_DAYS = env('PURGE_AFTER_DAYS')
+# kanban columns with position keys longer than this are rebalanced (manage.py rebalance_positions)
+POSITION_REBALANCE_LENGTH = env('POSITION_REBALANCE_LENGTH')
+
+# bearer token of metrics scraper, staff session is required when empty
+METRICS_TOKEN = env('METRICS_TOKEN')
 
 
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
+# orjson renderer and parser, output is the same as of stdlib ones
+if env('FAST_JSON'):
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'todolist.renderers.OrJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = [
+        'todolist.parsers.OrJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ]
+
+
+# list endpoints render values() rows with the same output as their serializers (goals.views.values)
+FAST_LISTS = env('FAST_LISTS')
+# relations in a path of expand parameter at most, e.g. category.board (goals.views.expand)
+EXPAND_MAX_DEPTH = env('EXPAND_MAX_DEPTH')
 
 
 # OpenAPI settings
@@ -95,6 +207,10 @@ SPECTACULAR_SETTINGS = {
     'DESCRIPTION': 'This is an API for task manager application TODOList',
     'VERSION': '1.0.0'
 }
+# schema is generated on every request in live mode, otherwise once per process and served from memory
+SCHEMA_LIVE = env.bool('SCHEMA_LIVE', default=DEBUG)
+# optional file shared by workers and restarts, reused while code fingerprint matches
+SCHEMA_CACHE_FILE = env('SCHEMA_CACHE_FILE', default='')
 
 
 # authentication setup
@@ -151,3 +267,6 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Telegram bot key
 TG_BOT_KEY = env('BOT_TOKEN')
+# due date reminders (manage.py send_reminders): windows before due date in hours, messages per second
+REMINDER_WINDOWS_HOURS = env('REMINDER_WINDOWS_HOURS')
+REMINDER_RATE = env('REMINDER_RATE')
@@ -1,6 +1,10 @@
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView
+from drf_spectacular.views import SpectacularRedocView
+
+from todolist.db.views import DatabaseHealthView
+from todolist.metrics.views import metrics_view
+from todolist.schema import CachedSpectacularAPIView
 
 # ----------------------------------------------------------------
 # urlpatterns
@@ -10,6 +14,8 @@ urlpatterns = [
     path("oauth/", include("social_django.urls", namespace="social")),
     path('goals/', include('goals.urls')),
     path('bot/', include('bot.urls')),
-    path('schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('health/db', DatabaseHealthView.as_view(), name='health-db'),
+    path('metrics', metrics_view, name='metrics'),
+    path('schema/', CachedSpectacularAPIView.as_view(), name='schema'),
     path('schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 ]
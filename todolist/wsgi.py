@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todolist.settings')
 
 application = get_wsgi_application()
+
+from todolist.schema import warm_schema_cache  # noqa: E402 - needs configured apps
+
+warm_schema_cache()